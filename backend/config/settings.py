@@ -35,6 +35,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'local_data.middleware.PayloadDebugMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -121,6 +122,55 @@ CRAWLER_SETTINGS = {
     'BACKOFF_FACTOR': 2,
     'MAX_CONCURRENT': 10,
     'REQUEST_DELAY': 0.5,
+    # 호스트별 토큰 버킷 (rate: 초당 요청 수, burst: 순간 최대 요청 수)
+    'RATE_LIMITS': {
+        'youtube.com': {'rate': 2.0, 'burst': 4},
+        'search.naver.com': {'rate': 3.0, 'burst': 5},
+        'dapi.kakao.com': {'rate': 10.0, 'burst': 10},
+        'openapi.seoul.go.kr': {'rate': 5.0, 'burst': 5},
+    },
+    # 호스트별 서킷 브레이커 (연속 실패 FAILURE_THRESHOLD회면 COOLDOWN초간 요청 중단)
+    'CIRCUIT_BREAKER': {
+        'FAILURE_THRESHOLD': 5,
+        'COOLDOWN': 30,
+    },
+}
+
+# 캐시 설정 - 웹 프로세스와 크롤링 커맨드가 같은 캐시를 봐야 하므로 공유 저장소 사용
+# (REDIS_URL이 없으면 DB 캐시 테이블 사용, 테이블은 배포 시 `manage.py createcachetable`로 생성)
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+        }
+    }
+
+# 요청 단위 페이로드 디버그 로깅 토큰 (X-Debug-Payload 헤더 값과 일치할 때만 응답 전체 기록)
+PAYLOAD_DEBUG_TOKEN = os.environ.get('PAYLOAD_DEBUG_TOKEN')
+
+# 응답 캐시 유지 시간 (크롤링 완료 시 데이터 버전이 바뀌면 즉시 무효화)
+RESPONSE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# 기상청 예보 격자 캐시 설정 (예보 주기 3시간, 새 예보 조회 전까지 이전 예보로 응답)
+WEATHER_CACHE = {
+    'FORECAST_TIMEOUT': 60 * 60 * 4,
+    'STALE_TIMEOUT': 60 * 60 * 24,
+    'FAILURE_BACKOFF': 60,  # 백그라운드 갱신 실패 후 같은 격자 재시도 대기(초)
+}
+
+# 감성 분석 결과 캐시 설정
+SENTIMENT_CACHE = {
+    'MAX_SIZE': 20000,  # 메모리 LRU 최대 항목 수
+    'PERSISTENT': os.environ.get('SENTIMENT_CACHE_PERSISTENT', 'false').lower() == 'true',
+    'BATCH_SIZE': 500,  # persistent 테이블 IN 조회/bulk_create 배치 크기
 }
 
 # 로깅 설정
@@ -133,6 +183,13 @@ LOGGING = {
             'style': '{',
         },
     },
+    'filters': {
+        # 요청마다 찍히는 INFO 로그는 일부만 남김 (WARNING 이상은 항상 기록)
+        'weather_sample': {
+            '()': 'local_data.log_utils.SamplingFilter',
+            'rate': float(os.environ.get('WEATHER_LOG_SAMPLE_RATE', '0.01')),
+        },
+    },
     'handlers': {
         'console': {
             'class': 'logging.StreamHandler',
@@ -155,6 +212,12 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        'local_data.weather_service': {
+            'handlers': ['console'],
+            'level': os.environ.get('WEATHER_LOG_LEVEL', 'INFO'),
+            'filters': ['weather_sample'],
+            'propagate': False,
+        },
     },
     'root': {
         'handlers': ['console'],
@@ -0,0 +1,144 @@
+"""
+COPY 기반 벌크 적재기 - 임시 스테이징 테이블로 COPY FROM STDIN 후 INSERT ... SELECT ... ON CONFLICT 한 번으로 병합
+"""
+import logging
+import threading
+import time
+from datetime import date, datetime
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+def _copy_text(value):
+    """COPY text 형식 값 (None은 NULL, list/tuple은 배열 리터럴)
+    
+    jsonb 컬럼 값은 호출하는 쪽에서 json.dumps한 문자열로 넘겨야 한다.
+    """
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        text = 't' if value else 'f'
+    elif isinstance(value, datetime):
+        # Django ORM과 같이 naive datetime은 기본 시간대(Asia/Seoul) 기준으로 해석
+        if settings.USE_TZ and timezone.is_naive(value):
+            value = timezone.make_aware(value)
+        text = value.isoformat()
+    elif isinstance(value, date):
+        text = value.isoformat()
+    elif isinstance(value, (list, tuple)):
+        text = '{' + ','.join(
+            'NULL' if item is None else '"' + str(item).replace('\\', '\\\\').replace('"', '\\"') + '"'
+            for item in value
+        ) + '}'
+    else:
+        text = str(value)
+    return text.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+class _CopyStream:
+    """행 목록을 COPY text 형식으로 조금씩 읽어가는 file-like 객체 (전체 버퍼를 만들지 않음)"""
+    
+    def __init__(self, rows):
+        self._lines = ('\t'.join(_copy_text(value) for value in row) + '\n' for row in rows)
+        self._buffer = ''
+    
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            self._buffer += line
+        if size < 0:
+            chunk, self._buffer = self._buffer, ''
+        else:
+            chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        return chunk
+
+
+class CopyLoader:
+    """PostgreSQL COPY 기반 UPSERT 적재기
+    
+    - 연결별 임시 스테이징 테이블(대상 테이블의 columns만, 제약 없음)에 COPY FROM STDIN으로 행을 흘려보낸다.
+    - INSERT ... SELECT ... ON CONFLICT 한 문장으로 대상 테이블에 병합하고 RETURNING 결과를 반환한다.
+    - 같은 충돌 키가 한 번에 두 번 들어오면 DO UPDATE가 실패하므로 마지막 행만 남긴다.
+    
+    on_conflict의 {table}은 대상 테이블 이름으로 바뀐다.
+    """
+    
+    def __init__(self, model, columns, conflict_columns, on_conflict='DO NOTHING', returning=None):
+        quote = connection.ops.quote_name
+        self.model = model
+        self.columns = list(columns)
+        self.conflict_columns = list(conflict_columns)
+        self.table = quote(model._meta.db_table)
+        self.staging_table = quote(f"{model._meta.db_table}_staging")
+        self.on_conflict = on_conflict.format(table=self.table)
+        self.returning = returning
+        self._key_positions = [self.columns.index(column) for column in self.conflict_columns]
+        self._column_sql = ', '.join(quote(column) for column in self.columns)
+        
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.rows = 0
+        self.seconds = 0.0
+    
+    def load(self, rows):
+        """rows(columns 순서의 튜플)를 적재하고 RETURNING 결과 목록 반환"""
+        unique_rows = {}
+        for row in rows:
+            unique_rows[tuple(row[position] for position in self._key_positions)] = row
+        if not unique_rows:
+            return []
+        
+        start_time = time.perf_counter()
+        with transaction.atomic(), connection.cursor() as cursor:
+            # 연결당 한 번 생성, 트랜잭션이 끝나면 비워짐 (같은 트랜잭션 안의 이전 적재분은 직접 비움)
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {self.staging_table} ON COMMIT DELETE ROWS AS "
+                f"SELECT {self._column_sql} FROM {self.table} WITH NO DATA"
+            )
+            cursor.execute(f"TRUNCATE {self.staging_table}")
+            cursor.copy_expert(
+                f"COPY {self.staging_table} ({self._column_sql}) FROM STDIN",
+                _CopyStream(unique_rows.values())
+            )
+            
+            sql = (
+                f"INSERT INTO {self.table} ({self._column_sql}) "
+                f"SELECT {self._column_sql} FROM {self.staging_table} "
+                f"ON CONFLICT ({', '.join(self.conflict_columns)}) {self.on_conflict}"
+            )
+            if self.returning:
+                sql += f" RETURNING {self.returning}"
+            cursor.execute(sql)
+            returned = cursor.fetchall() if cursor.description else []
+        
+        duration = time.perf_counter() - start_time
+        with self._lock:
+            self.loads += 1
+            self.rows += len(unique_rows)
+            self.seconds += duration
+        logger.debug(
+            f"{self.model._meta.db_table} 적재: {len(unique_rows)}행, "
+            f"{duration * 1000:.1f}ms ({len(unique_rows) / duration if duration else 0:.0f}행/초)"
+        )
+        return returned
+    
+    def get_stats(self):
+        """누적 적재 횟수/행 수/소요 시간/초당 행 수 반환"""
+        with self._lock:
+            return {
+                'loads': self.loads,
+                'rows': self.rows,
+                'seconds': round(self.seconds, 3),
+                'rows_per_second': round(self.rows / self.seconds) if self.seconds else 0
+            }
+    
+    def reset_stats(self):
+        with self._lock:
+            self.loads = 0
+            self.rows = 0
+            self.seconds = 0.0
@@ -0,0 +1,284 @@
+"""
+스트리밍 크롤링 파이프라인 - fetch -> parse -> dedupe -> sentiment -> write 단계를 크기 제한 큐로 연결
+"""
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .url_index import get_seen_url_index
+
+logger = logging.getLogger(__name__)
+
+# 단계 종료 신호
+_DONE = object()
+
+
+async def _iter_batches(queue: asyncio.Queue, batch_size: int, flush_interval: float):
+    """큐에서 batch_size개가 모이거나 첫 항목 후 flush_interval초가 지나면 묶음 반환"""
+    done = False
+    while not done:
+        item = await queue.get()
+        if item is _DONE:
+            return
+        
+        batch = [item]
+        deadline = time.monotonic() + flush_interval
+        while len(batch) < batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            if item is _DONE:
+                done = True
+                break
+            batch.append(item)
+        yield batch
+
+
+class CrawlPipeline:
+    """구별 크롤링 결과를 모아두지 않고 단계별로 흘려보내며 저장
+    
+    - fetch: 검색 페이지 요청 (호스트별 속도/동시 요청 제한은 크롤러가 처리)
+    - parse: 페이지에서 이슈 추출 (크롤러의 파싱 프로세스 풀)
+    - dedupe: 정규화 URL 기준으로 이미 저장된 URL/이번 실행 중복 제거, 구별 target_count 제한
+    - sentiment: 제목 감성 분석 (분석 전용 스레드)
+    - write: 이슈 UPSERT/감성 분석을 batch_size개 또는 flush_interval초마다 일괄 저장 (DB 전용 스레드)
+    
+    단계 사이 큐는 크기가 제한되어 있어 뒷단계가 밀리면 앞단계가 기다린다(backpressure).
+    반드시 crawler의 이벤트 루프 안에서 run()을 실행해야 한다.
+    """
+    
+    def __init__(self, crawler, target_count=50, fetch_workers=None, queue_size=100,
+                 batch_size=200, flush_interval=2.0):
+        self.crawler = crawler
+        self.target_count = target_count
+        self.fetch_workers = fetch_workers or crawler.max_concurrent
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.url_index = get_seen_url_index()
+        self.run_hashes = set()
+        
+        self.saved = {}
+        self.stats = {
+            'pages_fetched': 0,
+            'pages_failed': 0,
+            'items_parsed': 0,
+            'duplicates': 0,
+            'over_limit': 0,
+            'analyzed': 0,
+            'issues_saved': 0,
+            'issues_updated': 0,
+            'analyses_saved': 0,
+            'write_batches': 0,
+            'max_queue': {},
+        }
+    
+    async def run(self, districts: List[str]) -> Dict[str, int]:
+        """districts 크롤링 후 구별 저장 개수 반환"""
+        from .db_writers import get_load_stats, reset_load_stats
+        
+        loop = asyncio.get_running_loop()
+        start_time = time.monotonic()
+        reset_load_stats()
+        
+        # DB 작업은 한 스레드(연결 1개)에서, 감성 분석은 별도 스레드에서 실행
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pipeline-db')
+        self._analysis_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pipeline-analysis')
+        try:
+            self.locations = await loop.run_in_executor(self._db_executor, self._load_locations, districts)
+            self.analyzer = await loop.run_in_executor(self._analysis_executor, self._load_analyzer)
+            
+            request_queue = asyncio.Queue()
+            for district in districts:
+                if district not in self.locations:
+                    logger.warning(f"지역 '{district}' 없음 - 건너뜀")
+                    continue
+                for source, url, limit in self.crawler.source_requests(district, self.target_count):
+                    request_queue.put_nowait((district, source, url, limit))
+            
+            self.queues = {
+                name: asyncio.Queue(maxsize=self.queue_size)
+                for name in ('parse', 'dedupe', 'sentiment', 'write')
+            }
+            
+            tasks = [
+                asyncio.create_task(self._fetch_stage(request_queue)),
+                asyncio.create_task(self._parse_stage()),
+                asyncio.create_task(self._dedupe_stage()),
+                asyncio.create_task(self._sentiment_stage()),
+                asyncio.create_task(self._write_stage()),
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # 한 단계가 실패하면 큐에서 대기 중인 나머지 단계도 정리
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            await loop.run_in_executor(self._db_executor, self.url_index.save)
+        finally:
+            # 두 실행기 스레드 모두 DB를 쓰므로(분석 쪽은 persistent 감성 캐시) 각 스레드의 연결을 닫음
+            await loop.run_in_executor(self._db_executor, connection.close)
+            await loop.run_in_executor(self._analysis_executor, connection.close)
+            self._db_executor.shutdown(wait=False)
+            self._analysis_executor.shutdown(wait=False)
+        
+        self.stats['duration'] = round(time.monotonic() - start_time, 2)
+        self.stats['copy_load'] = get_load_stats()
+        logger.info(f"크롤링 파이프라인 완료: {self.stats}")
+        return self.saved
+    
+    @staticmethod
+    def _load_locations(districts):
+        from .models import Location
+        return {location.gu: location for location in Location.objects.filter(gu__in=districts)}
+    
+    @staticmethod
+    def _load_analyzer():
+        from .sentiment_analyzer import get_sentiment_analyzer
+        return get_sentiment_analyzer()
+    
+    async def _put(self, name, item):
+        queue = self.queues[name]
+        await queue.put(item)
+        max_queue = self.stats['max_queue']
+        max_queue[name] = max(max_queue.get(name, 0), queue.qsize())
+    
+    async def _fetch_stage(self, request_queue: asyncio.Queue):
+        async def worker():
+            while True:
+                try:
+                    district, source, url, limit = request_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                content = await self.crawler._fetch_with_retry(url, raw=True)
+                if not content:
+                    self.stats['pages_failed'] += 1
+                    continue
+                self.stats['pages_fetched'] += 1
+                await self._put('parse', (district, source, content, limit))
+        
+        await asyncio.gather(*[worker() for _ in range(max(1, self.fetch_workers))])
+        await self.queues['parse'].put(_DONE)
+    
+    async def _parse_stage(self):
+        # 파싱 워커 프로세스 수만큼 페이지를 동시에 넘김
+        async def worker():
+            while True:
+                page = await self.queues['parse'].get()
+                if page is _DONE:
+                    # 다른 파싱 작업도 종료하도록 신호를 되돌려 놓음
+                    await self.queues['parse'].put(_DONE)
+                    return
+                district, source, content, limit = page
+                for item in await self.crawler.parse_page(source, content, limit):
+                    self.stats['items_parsed'] += 1
+                    await self._put('dedupe', (district, item))
+        
+        await asyncio.gather(*[worker() for _ in range(max(1, self.crawler.parse_workers))])
+        await self.queues['dedupe'].put(_DONE)
+    
+    async def _dedupe_stage(self):
+        loop = asyncio.get_running_loop()
+        accepted = {}
+        async for batch in _iter_batches(self.queues['dedupe'], self.batch_size, self.flush_interval):
+            # 저장된 URL 확인은 Bloom filter로, 필터에 걸린 것만 배치당 한 번 DB 조회
+            fresh = await loop.run_in_executor(
+                self._db_executor, self.url_index.filter_new,
+                [dict(item, district=district) for district, item in batch]
+            )
+            self.stats['duplicates'] += len(batch) - len(fresh)
+            
+            for item in fresh:
+                district = item.pop('district')
+                # 아직 저장 전인 앞 배치와의 중복
+                if item['url_hash'] in self.run_hashes:
+                    self.stats['duplicates'] += 1
+                    continue
+                if accepted.get(district, 0) >= self.target_count:
+                    self.stats['over_limit'] += 1
+                    continue
+                self.run_hashes.add(item['url_hash'])
+                accepted[district] = accepted.get(district, 0) + 1
+                await self._put('sentiment', (district, item))
+        await self.queues['sentiment'].put(_DONE)
+    
+    async def _sentiment_stage(self):
+        loop = asyncio.get_running_loop()
+        async for batch in _iter_batches(self.queues['sentiment'], self.batch_size, self.flush_interval):
+            titles = [item['title'] for _, item in batch]
+            results = await loop.run_in_executor(
+                self._analysis_executor, lambda: self.analyzer.analyze_many(titles, workers=1)
+            )
+            self.stats['analyzed'] += len(batch)
+            for (district, item), result in zip(batch, results):
+                await self._put('write', (district, item, result))
+        await self.queues['write'].put(_DONE)
+    
+    async def _write_stage(self):
+        loop = asyncio.get_running_loop()
+        async for batch in _iter_batches(self.queues['write'], self.batch_size, self.flush_interval):
+            await loop.run_in_executor(self._db_executor, self._write_batch, batch)
+    
+    def _write_batch(self, batch):
+        """이슈 UPSERT 후 새로 삽입된 이슈의 감성 분석 저장 + 요약 증분 갱신 (한 트랜잭션)"""
+        from .models import LocalIssue
+        from .db_writers import record_sentiment_analyses, upsert_local_issues
+        from .sentiment_analyzer import build_sentiment_analysis
+        
+        now = timezone.now()
+        issues = []
+        results = {}
+        for district, item, result in batch:
+            issues.append(LocalIssue(
+                location=self.locations[district],
+                source=item['source'],
+                title=item['title'],
+                url=item['url'],
+                url_hash=item['url_hash'],
+                view_count=item['view_count'],
+                published_at=item['published_at'],
+                collected_at=now
+            ))
+            results[item['url_hash']] = result
+        
+        with transaction.atomic():
+            # 다른 프로세스가 먼저 저장한 URL은 갱신만 되고 감성 분석은 새로 붙이지 않음
+            inserted = upsert_local_issues(issues)
+            analyses = [
+                build_sentiment_analysis(
+                    issue.location, 'local_issue', issue.id, issue.title, results[issue.url_hash], self.analyzer
+                )
+                for issue in inserted
+            ]
+            analyses_saved = record_sentiment_analyses(analyses)
+        
+        for issue in inserted:
+            district = issue.location.gu
+            self.saved[district] = self.saved.get(district, 0) + 1
+        self.stats['issues_saved'] += len(inserted)
+        self.stats['issues_updated'] += len(issues) - len(inserted)
+        self.stats['analyses_saved'] += analyses_saved
+        self.stats['write_batches'] += 1
+
+def run_crawl_pipeline(runtime, districts: List[str], target_count=50, **options) -> CrawlPipeline:
+    """CrawlerRuntime 루프에서 파이프라인 실행 (완료까지 대기)"""
+    pipeline = None
+    
+    def start(crawler):
+        nonlocal pipeline
+        pipeline = CrawlPipeline(crawler, target_count, **options)
+        return pipeline.run(districts)
+    
+    runtime.run(start).result()
+    return pipeline
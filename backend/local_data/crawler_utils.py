@@ -3,9 +3,13 @@
 """
 import time
 import random
+import asyncio
 import logging
+import threading
+from collections import deque
 from functools import wraps
-from typing import Callable, Any
+from typing import Callable, Any, Dict, Optional
+from urllib.parse import urlsplit
 
 def retry_with_backoff(max_retries=3, base_delay=1, max_delay=10):
     """
@@ -39,12 +43,14 @@ class NetworkHealthChecker:
     
     def __init__(self):
         self.response_times = []
+        self.recent_results = deque(maxlen=100)
         self.error_count = 0
         self.total_requests = 0
     
     def record_response(self, response_time: float, success: bool):
         """응답 시간 및 성공/실패 기록"""
         self.response_times.append(response_time)
+        self.recent_results.append(success)
         self.total_requests += 1
         
         if not success:
@@ -71,6 +77,18 @@ class NetworkHealthChecker:
         
         return min(adaptive_timeout, 60)  # 최대 60초
     
+    def get_average_response_time(self):
+        """최근 100개 응답의 평균 응답 시간 (기록 없으면 0)"""
+        if not self.response_times:
+            return 0.0
+        return sum(self.response_times) / len(self.response_times)
+    
+    def get_error_rate(self):
+        """최근 100개 요청의 에러율"""
+        if not self.recent_results:
+            return 0.0
+        return self.recent_results.count(False) / len(self.recent_results)
+    
     def get_health_status(self):
         """네트워크 상태 반환"""
         if self.total_requests < 5:
@@ -88,6 +106,377 @@ class NetworkHealthChecker:
 # 전역 네트워크 체커 인스턴스
 network_checker = NetworkHealthChecker()
 
+class AdaptiveConcurrencyLimiter:
+    """호스트 하나의 동시 요청 수를 AIMD로 조절
+    
+    - 정상 응답마다 limit += increase / limit (limit개 요청이 성공할 때마다 약 +1)
+    - 오류/timeout/429 또는 평균의 latency_factor배를 넘는 느린 응답이면 limit *= decrease
+      (같은 혼잡 구간에서 여러 번 줄지 않도록 평균 응답 시간 동안은 한 번만 감소)
+    - 최근 에러율이 10%를 넘는 동안에는 늘리지 않는다.
+    
+    asyncio 기반이므로 크롤러 이벤트 루프 안에서만 사용한다.
+    """
+    
+    def __init__(self, initial=2, min_limit=1, max_limit=10,
+                 increase=1.0, decrease=0.5, latency_factor=2.0):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(max(min_limit, min(initial, max_limit)))
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.checker = NetworkHealthChecker()
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+        self._last_decrease = 0.0
+        
+        self.peak_limit = self.limit
+        self.increases = 0
+        self.decreases = 0
+        self.max_in_flight = 0
+    
+    async def acquire(self):
+        """현재 limit보다 적게 실행 중일 때까지 대기"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+    
+    async def release(self, response_time: float, success: bool):
+        """요청 결과를 기록하고 limit 조정 후 슬롯 반환"""
+        self._adjust(response_time, success)
+        self.checker.record_response(response_time, success)
+        async with self._condition:
+            self.in_flight -= 1
+            # limit이 늘었으면 여러 작업이 동시에 들어갈 수 있음
+            self._condition.notify_all()
+    
+    def _is_slow(self, response_time: float) -> bool:
+        if len(self.checker.response_times) < 10:
+            return False
+        return response_time > self.checker.get_average_response_time() * self.latency_factor
+    
+    def _adjust(self, response_time: float, success: bool):
+        if not success or self._is_slow(response_time):
+            now = time.monotonic()
+            if now - self._last_decrease >= max(self.checker.get_average_response_time(), 1.0):
+                self.limit = max(self.min_limit, self.limit * self.decrease)
+                self._last_decrease = now
+                self.decreases += 1
+        elif self.checker.get_error_rate() <= 0.1:
+            self.limit = min(self.max_limit, self.limit + self.increase / self.limit)
+            self.peak_limit = max(self.peak_limit, self.limit)
+            self.increases += 1
+    
+    def request_timeout(self, base_timeout=10):
+        """호스트 응답 시간 기준 요청 timeout"""
+        return self.checker.get_adaptive_timeout(base_timeout)
+    
+    def retry_delay(self):
+        """호스트 에러율 기준 재시도 간격"""
+        return calculate_request_delay(self.checker.get_error_rate())
+    
+    def get_stats(self):
+        return {
+            'limit': round(self.limit, 2),
+            'peak_limit': round(self.peak_limit, 2),
+            'max_in_flight': self.max_in_flight,
+            'increases': self.increases,
+            'decreases': self.decreases,
+            'requests': self.checker.total_requests,
+            'error_rate': round(self.checker.get_error_rate(), 3),
+            'avg_response_time': round(self.checker.get_average_response_time(), 3),
+            'health': self.checker.get_health_status()
+        }
+
+class HostConcurrencyLimiter:
+    """호스트별 AdaptiveConcurrencyLimiter 묶음 (처음 요청할 때 생성)"""
+    
+    def __init__(self, initial=2, max_limit=10):
+        self.initial = initial
+        self.max_limit = max_limit
+        self.limiters = {}
+    
+    def limiter_for(self, url: str) -> AdaptiveConcurrencyLimiter:
+        hostname = (urlsplit(url).hostname or '').lower()
+        limiter = self.limiters.get(hostname)
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter(initial=self.initial, max_limit=self.max_limit)
+            self.limiters[hostname] = limiter
+        return limiter
+    
+    def get_stats(self):
+        """호스트별 동시 요청 한도/응답 통계"""
+        return {host: limiter.get_stats() for host, limiter in self.limiters.items()}
+    
+    def log_stats(self):
+        for host, stats in self.get_stats().items():
+            logging.info(
+                f"[concurrency] {host}: 동시 요청 한도 {stats['limit']} (최대 {stats['peak_limit']}, "
+                f"실제 최대 {stats['max_in_flight']}), 증가 {stats['increases']}회/감소 {stats['decreases']}회, "
+                f"평균 응답 {stats['avg_response_time']:.2f}초, 에러율 {stats['error_rate']:.1%} ({stats['health']})"
+            )
+
+# 호스트별 허용 요청 속도 (rate: 초당 요청 수, burst: 순간 최대 요청 수)
+DEFAULT_RATE_LIMITS = {
+    'youtube.com': {'rate': 2.0, 'burst': 4},
+    'search.naver.com': {'rate': 3.0, 'burst': 5},
+    'dapi.kakao.com': {'rate': 10.0, 'burst': 10},
+    'openapi.seoul.go.kr': {'rate': 5.0, 'burst': 5},
+}
+
+class TokenBucket:
+    """토큰 버킷 - 초당 rate개씩 충전, 최대 burst개 보관
+    
+    토큰을 미리 예약(음수 허용)하고 대기 시간을 돌려주므로
+    스레드/코루틴 어느 쪽에서 호출해도 요청 순서대로 간격이 벌어진다.
+    """
+    
+    def __init__(self, rate: float, burst: float):
+        self.rate = float(rate)
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+        
+        self.acquired = 0
+        self.waited = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.throttled = 0
+    
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def reserve(self) -> float:
+        """토큰 1개 예약 후 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            
+            self.acquired += 1
+            if wait > 0:
+                self.waited += 1
+                self.total_wait += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+    
+    def pause(self, seconds: float):
+        """429 응답 등으로 호스트가 제한을 알려오면 seconds 동안 토큰 발급 중지"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, -seconds * self.rate)
+            self.throttled += 1
+    
+    def get_stats(self):
+        with self._lock:
+            return {
+                'rate': self.rate,
+                'burst': self.capacity,
+                'acquired': self.acquired,
+                'waited': self.waited,
+                'total_wait': round(self.total_wait, 3),
+                'avg_wait': round(self.total_wait / self.waited, 3) if self.waited else 0.0,
+                'max_wait': round(self.max_wait, 3),
+                'throttled': self.throttled
+            }
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 묶음 (모든 크롤링 작업이 공유)
+    
+    설정된 호스트와 그 하위 도메인(www.youtube.com 등)에 적용되고,
+    설정에 없는 호스트는 제한하지 않는다.
+    """
+    
+    def __init__(self, limits: Optional[Dict[str, Dict[str, float]]] = None):
+        self.buckets = {
+            host: TokenBucket(limit['rate'], limit.get('burst', limit['rate']))
+            for host, limit in (limits if limits is not None else load_rate_limits()).items()
+        }
+    
+    def bucket_for(self, url: str) -> Optional[TokenBucket]:
+        hostname = (urlsplit(url).hostname or '').lower()
+        for host, bucket in self.buckets.items():
+            if hostname == host or hostname.endswith('.' + host):
+                return bucket
+        return None
+    
+    async def acquire(self, url: str):
+        """비동기 요청 전 호출 - 필요한 만큼 대기"""
+        bucket = self.bucket_for(url)
+        if bucket is not None:
+            wait = bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+    
+    def acquire_sync(self, url: str):
+        """동기 요청 전 호출 - 필요한 만큼 대기"""
+        bucket = self.bucket_for(url)
+        if bucket is not None:
+            wait = bucket.reserve()
+            if wait > 0:
+                time.sleep(wait)
+    
+    def throttled(self, url: str, seconds: float):
+        """429 응답을 받은 호스트는 seconds 동안 모든 작업이 쉬도록 함"""
+        bucket = self.bucket_for(url)
+        if bucket is not None:
+            bucket.pause(seconds)
+    
+    def get_stats(self):
+        """호스트별 요청/대기 통계"""
+        return {host: bucket.get_stats() for host, bucket in self.buckets.items()}
+    
+    def log_stats(self):
+        for host, stats in self.get_stats().items():
+            if stats['acquired']:
+                logging.info(
+                    f"[rate limit] {host}: 요청 {stats['acquired']}회, 대기 {stats['waited']}회 "
+                    f"(총 {stats['total_wait']:.1f}초, 최대 {stats['max_wait']:.2f}초), 429 {stats['throttled']}회"
+                )
+
+def load_rate_limits():
+    """settings.CRAWLER_SETTINGS['RATE_LIMITS'] (Django 밖에서는 기본값)"""
+    try:
+        from django.conf import settings
+        return settings.CRAWLER_SETTINGS.get('RATE_LIMITS', DEFAULT_RATE_LIMITS)
+    except Exception:
+        return DEFAULT_RATE_LIMITS
+
+# 전역 호스트별 요청 속도 제한기
+rate_limiter = HostRateLimiter()
+
+class CircuitBreaker:
+    """호스트 하나의 서킷 브레이커 (closed -> open -> half_open -> closed)
+    
+    - closed: 연속 실패가 failure_threshold번이면 open
+    - open: cooldown초 동안 요청을 보내지 않고 즉시 실패 처리
+    - half_open: cooldown 후 시험 요청 1개만 허용, 성공하면 closed, 실패하면 다시 open
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, name: str, failure_threshold=5, cooldown=30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_started = 0.0
+        self._lock = threading.Lock()
+        
+        self.times_opened = 0
+        self.short_circuited = 0
+    
+    def allow_request(self) -> bool:
+        """요청을 보내도 되는지 확인 (open 상태면 False)"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.cooldown:
+                    self.short_circuited += 1
+                    return False
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+                logging.info(f"[circuit] {self.name}: half-open - 시험 요청 허용")
+            
+            if self.state == self.HALF_OPEN:
+                # 시험 요청이 결과 없이 사라진 경우(작업 취소 등) cooldown 후 다시 허용
+                now = time.monotonic()
+                if self._trial_in_flight and now - self._trial_started < self.cooldown:
+                    self.short_circuited += 1
+                    return False
+                self._trial_in_flight = True
+                self._trial_started = now
+            return True
+    
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logging.info(f"[circuit] {self.name}: closed - 요청 재개")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            # 이미 open이면 차단 전에 나간 요청의 실패 - cooldown을 늘리지 않음
+            if self.state == self.OPEN:
+                return
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._trial_in_flight = False
+                self.times_opened += 1
+                logging.warning(
+                    f"[circuit] {self.name}: open - 연속 실패 {self.failures}회, {self.cooldown:.0f}초간 요청 중단"
+                )
+    
+    def is_open(self) -> bool:
+        with self._lock:
+            return self.state == self.OPEN
+    
+    def get_stats(self):
+        with self._lock:
+            return {
+                'state': self.state,
+                'failures': self.failures,
+                'times_opened': self.times_opened,
+                'short_circuited': self.short_circuited,
+                'retry_in': round(max(0.0, self.cooldown - (time.monotonic() - self.opened_at)), 1)
+                if self.state == self.OPEN else 0.0
+            }
+
+class HostCircuitBreakers:
+    """호스트별 CircuitBreaker 묶음 (모든 크롤링 작업이 공유, 처음 요청할 때 생성)"""
+    
+    def __init__(self, failure_threshold=None, cooldown=None):
+        options = load_circuit_breaker_settings()
+        self.failure_threshold = failure_threshold or options.get('FAILURE_THRESHOLD', 5)
+        self.cooldown = cooldown or options.get('COOLDOWN', 30)
+        self.breakers = {}
+        self._lock = threading.Lock()
+    
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        hostname = (urlsplit(url).hostname or '').lower()
+        with self._lock:
+            breaker = self.breakers.get(hostname)
+            if breaker is None:
+                breaker = CircuitBreaker(hostname, self.failure_threshold, self.cooldown)
+                self.breakers[hostname] = breaker
+            return breaker
+    
+    def get_stats(self):
+        """호스트별 서킷 상태"""
+        with self._lock:
+            breakers = list(self.breakers.items())
+        return {host: breaker.get_stats() for host, breaker in breakers}
+    
+    def log_stats(self):
+        for host, stats in self.get_stats().items():
+            if stats['times_opened'] or stats['state'] != CircuitBreaker.CLOSED:
+                logging.info(
+                    f"[circuit] {host}: {stats['state']}, 차단 {stats['times_opened']}회, "
+                    f"건너뛴 요청 {stats['short_circuited']}개"
+                )
+
+def load_circuit_breaker_settings():
+    """settings.CRAWLER_SETTINGS['CIRCUIT_BREAKER'] (Django 밖에서는 기본값)"""
+    try:
+        from django.conf import settings
+        return settings.CRAWLER_SETTINGS.get('CIRCUIT_BREAKER', {})
+    except Exception:
+        return {}
+
+# 전역 호스트별 서킷 브레이커
+circuit_breakers = HostCircuitBreakers()
+
 def get_optimal_user_agents():
     """최신 User-Agent 목록 반환"""
     return [
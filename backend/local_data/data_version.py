@@ -0,0 +1,37 @@
+"""
+크롤링 데이터 버전 관리 - 크롤링/분석 완료 시 버전을 올려 응답 캐시 무효화
+"""
+import time
+from django.core.cache import cache
+
+DATA_VERSION_KEY = 'local_data:data_version'
+
+
+def new_data_version():
+    """새 데이터 버전 값 발급 (아직 적용되지 않음)"""
+    return time.time_ns()
+
+
+def get_data_version():
+    """현재 데이터 버전 (캐시에 없으면 새 버전 발급)"""
+    return cache.get_or_set(DATA_VERSION_KEY, new_data_version(), timeout=None)
+
+
+def bump_data_version(version=None):
+    """크롤링/분석 완료 후 호출 - 이전 버전으로 만든 캐시는 더 이상 조회되지 않음
+
+    version을 넘기면 해당 버전으로 전환한다. 새 버전용 캐시를 미리 채운 뒤
+    전환하면 요청이 빈 캐시를 보는 구간이 없다.
+    """
+    if version is None:
+        version = new_data_version()
+    cache.set(DATA_VERSION_KEY, version, timeout=None)
+    return version
+
+
+def versioned_cache_key(name, *parts, version=None):
+    """데이터 버전이 포함된 캐시 키"""
+    if version is None:
+        version = get_data_version()
+    suffix = ':'.join(str(part) for part in parts)
+    return f"local_data:{name}:{version}:{suffix}"
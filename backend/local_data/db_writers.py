@@ -0,0 +1,277 @@
+"""
+벌크 DB 쓰기 헬퍼 - 이슈/음식점 COPY 적재, 감성 분석 저장 및 요약 증분 갱신
+"""
+import json
+from collections import Counter
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .bulk_loader import CopyLoader
+from .data_version import bump_data_version
+from .models import LocalIssue, RestaurantInfo, SentimentAnalysis, SentimentSummary
+
+
+def _execute_values(cursor, sql_prefix, template, rows, sql_suffix='', page_size=500):
+    """VALUES 목록을 page_size 단위로 나눠 실행하고 RETURNING 결과를 모아 반환"""
+    returned = []
+    for i in range(0, len(rows), page_size):
+        page = rows[i:i + page_size]
+        values_sql = ', '.join([template] * len(page))
+        params = [value for row in page for value in row]
+        cursor.execute(f"{sql_prefix} VALUES {values_sql} {sql_suffix}", params)
+        if cursor.description:
+            returned.extend(cursor.fetchall())
+    return returned
+
+
+# 이미 있는 URL은 조회수(큰 값)/제목만 갱신, (xmax = 0)이면 이번에 새로 삽입된 행
+local_issue_loader = CopyLoader(
+    LocalIssue,
+    ['location_id', 'source', 'title', 'url', 'url_hash', 'view_count', 'published_at', 'collected_at'],
+    ['url_hash'],
+    "DO UPDATE SET view_count = GREATEST({table}.view_count, EXCLUDED.view_count), title = EXCLUDED.title",
+    returning='id, url_hash, (xmax = 0) AS inserted'
+)
+
+sentiment_analysis_loader = CopyLoader(
+    SentimentAnalysis,
+    ['location_id', 'content_type', 'content_id', 'sentiment', 'confidence',
+     'keywords', 'lexicon_version', 'text_grams', 'analyzed_at'],
+    ['content_type', 'content_id'],
+    returning='location_id, analyzed_at, sentiment, keywords'
+)
+
+restaurant_loader = CopyLoader(
+    RestaurantInfo,
+    ['location_id', 'management_number', 'business_type', 'license_date', 'business_status_code',
+     'business_status_name', 'business_name', 'phone_number', 'road_address', 'lot_address',
+     'coordinate_x', 'coordinate_y', 'collected_at'],
+    ['management_number'],
+    returning='location_id'
+)
+
+
+def get_load_stats():
+    """테이블별 COPY 적재 누적 통계 (행 수/소요 시간/초당 행 수)"""
+    return {
+        loader.model._meta.db_table: loader.get_stats()
+        for loader in (local_issue_loader, sentiment_analysis_loader, restaurant_loader)
+    }
+
+
+def reset_load_stats():
+    for loader in (local_issue_loader, sentiment_analysis_loader, restaurant_loader):
+        loader.reset_stats()
+
+
+def upsert_local_issues(issues):
+    """LocalIssue 일괄 UPSERT (url_hash 기준, COPY 적재)
+
+    처음 보는 URL은 삽입하고, 이미 있는 URL은 조회수(큰 값)/제목만 갱신한다.
+    URL이 없는 결과는 저장하지 않는다 (모두 같은 해시로 합쳐지므로).
+    저장한 객체에 id를 채우고, 이번에 새로 삽입된 객체만 반환한다.
+    행이 바뀌면 커밋 후 데이터 버전을 올려 응답 캐시를 무효화한다.
+    """
+    issues = [issue for issue in issues if issue.url]
+    if not issues:
+        return []
+
+    now = timezone.now()
+    # 같은 문장에서 한 행을 두 번 갱신할 수 없으므로 배치 안의 같은 URL은 마지막 것만 전송
+    by_hash = {}
+    for issue in issues:
+        issue.fill_url_hash()
+        by_hash[issue.url_hash] = issue
+
+    returned = local_issue_loader.load([
+        (
+            issue.location_id,
+            issue.source,
+            issue.title,
+            issue.url[:200],
+            issue.url_hash,
+            issue.view_count or 0,
+            issue.published_at,
+            issue.collected_at or now,
+        )
+        for issue in by_hash.values()
+    ])
+    if returned:
+        transaction.on_commit(bump_data_version)
+
+    ids = {}
+    inserted_hashes = set()
+    for issue_id, digest, inserted in returned:
+        ids[digest] = issue_id
+        if inserted:
+            inserted_hashes.add(digest)
+
+    for issue in issues:
+        issue.id = ids.get(issue.url_hash)
+        issue._state.adding = False
+        issue._state.db = connection.alias
+    return [issue for issue in by_hash.values() if issue.url_hash in inserted_hashes]
+
+
+def insert_restaurants(restaurants):
+    """RestaurantInfo 일괄 INSERT (관리번호 중복은 무시, COPY 적재)
+
+    지역별로 새로 삽입된 개수를 {location_id: count}로 반환한다.
+    새로 삽입된 행이 있으면 커밋 후 데이터 버전을 올려 응답 캐시를 무효화한다.
+    """
+    if not restaurants:
+        return {}
+
+    now = timezone.now()
+    returned = restaurant_loader.load([
+        (
+            restaurant.location_id,
+            restaurant.management_number[:50],
+            restaurant.business_type,
+            restaurant.license_date,
+            restaurant.business_status_code,
+            restaurant.business_status_name,
+            restaurant.business_name[:200],
+            restaurant.phone_number[:20],
+            restaurant.road_address,
+            restaurant.lot_address,
+            restaurant.coordinate_x,
+            restaurant.coordinate_y,
+            restaurant.collected_at or now,
+        )
+        for restaurant in restaurants
+    ])
+    if returned:
+        transaction.on_commit(bump_data_version)
+    return dict(Counter(location_id for location_id, in returned))
+
+
+def insert_sentiment_analyses(analyses):
+    """SentimentAnalysis 일괄 INSERT (중복은 무시, COPY 적재)
+
+    실제로 삽입된 행만 (location_id, analyzed_at, sentiment, keywords)로 반환한다.
+    """
+    if not analyses:
+        return []
+
+    now = timezone.now()
+    return sentiment_analysis_loader.load([
+        (
+            analysis.location_id,
+            analysis.content_type,
+            analysis.content_id,
+            analysis.sentiment,
+            analysis.confidence,
+            json.dumps(analysis.keywords or [], ensure_ascii=False),
+            analysis.lexicon_version,
+            list(analysis.text_grams or []),
+            analysis.analyzed_at or now,
+        )
+        for analysis in analyses
+    ])
+
+
+def _top_keywords(keyword_counts):
+    """감성별 키워드 카운트에서 상위 5개 추출"""
+    return {
+        sentiment: [word for word, count in Counter(keyword_counts.get(sentiment, {})).most_common(5)]
+        for sentiment in ('positive', 'negative')
+    }
+
+
+def _sentiment_score(positive_count, negative_count, neutral_count):
+    from .sentiment_analyzer import calculate_sentiment_score
+    return calculate_sentiment_score(positive_count, negative_count, neutral_count)
+
+
+def apply_summary_increments(inserted_rows):
+    """삽입된 분석 결과만큼 SentimentSummary 카운터/키워드를 UPSERT로 증가"""
+    if not inserted_rows:
+        return 0
+
+    # (지역, 날짜)별 증가분 집계
+    deltas = {}
+    for location_id, analyzed_at, sentiment, keywords in inserted_rows:
+        key = (location_id, timezone.localdate(analyzed_at))
+        delta = deltas.setdefault(key, {
+            'positive': 0, 'negative': 0, 'neutral': 0,
+            'keywords': {'positive': Counter(), 'negative': Counter()}
+        })
+        delta[sentiment] = delta.get(sentiment, 0) + 1
+        if sentiment in delta['keywords']:
+            if isinstance(keywords, str):
+                keywords = json.loads(keywords)
+            delta['keywords'][sentiment].update(keywords or [])
+
+    rows = []
+    for (location_id, target_date), delta in sorted(deltas.items()):
+        keyword_counts = {sentiment: dict(counter) for sentiment, counter in delta['keywords'].items()}
+        rows.append((
+            location_id,
+            target_date,
+            delta['positive'],
+            delta['negative'],
+            delta['neutral'],
+            _sentiment_score(delta['positive'], delta['negative'], delta['neutral']),
+            json.dumps(_top_keywords(keyword_counts), ensure_ascii=False),
+            json.dumps(keyword_counts, ensure_ascii=False),
+        ))
+
+    table = connection.ops.quote_name(SentimentSummary._meta.db_table)
+    # 기존 행이 있으면 카운터는 더하고, 키워드 카운트는 감성/단어별로 합산
+    merge_keywords = f"""
+        COALESCE((
+            SELECT jsonb_object_agg(sentiment, words) FROM (
+                SELECT sentiment, jsonb_object_agg(word, total) AS words FROM (
+                    SELECT s.key AS sentiment, w.key AS word, SUM(w.value::int) AS total
+                    FROM (
+                        SELECT * FROM jsonb_each({table}.keyword_counts)
+                        UNION ALL
+                        SELECT * FROM jsonb_each(EXCLUDED.keyword_counts)
+                    ) s, jsonb_each_text(s.value) w
+                    GROUP BY s.key, w.key
+                ) merged
+                GROUP BY sentiment
+            ) grouped
+        ), '{{}}'::jsonb)
+    """
+
+    with connection.cursor() as cursor:
+        upserted = _execute_values(
+            cursor,
+            f"INSERT INTO {table} (location_id, date, positive_count, negative_count, neutral_count, "
+            f"sentiment_score, top_keywords, keyword_counts)",
+            "(%s, %s, %s, %s, %s, %s, %s::jsonb, %s::jsonb)",
+            rows,
+            f"ON CONFLICT (location_id, date) DO UPDATE SET "
+            f"positive_count = {table}.positive_count + EXCLUDED.positive_count, "
+            f"negative_count = {table}.negative_count + EXCLUDED.negative_count, "
+            f"neutral_count = {table}.neutral_count + EXCLUDED.neutral_count, "
+            f"keyword_counts = {merge_keywords} "
+            f"RETURNING id, positive_count, negative_count, neutral_count, keyword_counts"
+        )
+
+    # 합산된 카운트로 점수/상위 키워드 갱신 (UPSERT로 잡힌 행 잠금은 트랜잭션 끝까지 유지)
+    summaries = []
+    for summary_id, positive_count, negative_count, neutral_count, keyword_counts in upserted:
+        if isinstance(keyword_counts, str):
+            keyword_counts = json.loads(keyword_counts)
+        summaries.append(SentimentSummary(
+            id=summary_id,
+            sentiment_score=_sentiment_score(positive_count, negative_count, neutral_count),
+            top_keywords=_top_keywords(keyword_counts or {})
+        ))
+    SentimentSummary.objects.bulk_update(summaries, ['sentiment_score', 'top_keywords'], batch_size=500)
+
+    return len(summaries)
+
+
+def record_sentiment_analyses(analyses):
+    """감성 분석 결과 저장과 요약 증분 갱신을 하나의 트랜잭션으로 처리
+
+    새로 삽입된 분석 개수를 반환한다.
+    """
+    with transaction.atomic():
+        inserted_rows = insert_sentiment_analyses(analyses)
+        apply_summary_increments(inserted_rows)
+    return len(inserted_rows)
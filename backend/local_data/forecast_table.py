@@ -0,0 +1,336 @@
+"""
+기상청 단기예보 열 지향 테이블 - (예보일시 × 카테고리) 피벗 및 현재/시간별/일별 조회
+"""
+import math
+import pickle
+import random
+import time
+from array import array
+from datetime import datetime, timedelta
+
+SKY_CODES = {1: '맑음', 3: '구름많음', 4: '흐림'}
+PTY_CODES = {1: '비', 2: '비/눈', 3: '눈', 4: '소나기'}
+
+# 카테고리별 열 타입 ('h': 코드/정수, 'f': 실수)
+CATEGORY_TYPES = {
+    'TMP': 'f',  # 1시간 기온 (℃)
+    'SKY': 'h',  # 하늘상태 코드
+    'PTY': 'h',  # 강수형태 코드
+    'POP': 'h',  # 강수확률 (%)
+    'REH': 'h',  # 습도 (%)
+    'WSD': 'f',  # 풍속 (m/s)
+}
+
+MISSING = -999
+
+
+class _ParsedValues(dict):
+    """문자열 예보값 -> 숫자 변환 결과 캐시 (예보값 종류가 적어 대부분 조회로 끝남)"""
+    
+    def __init__(self, parse, missing, limit=10000):
+        super().__init__()
+        self.parse = parse
+        self.missing = missing
+        self.limit = limit
+    
+    def __missing__(self, value):
+        try:
+            parsed = self.parse(value)
+        except (TypeError, ValueError):
+            parsed = self.missing
+        if len(self) < self.limit:
+            self[value] = parsed
+        return parsed
+
+
+_PARSERS = {
+    'f': _ParsedValues(float, math.nan),
+    'h': _ParsedValues(lambda value: int(float(value)), MISSING),
+}
+
+
+class ForecastTable:
+    """단기예보 항목을 예보일시(행) × 카테고리(열) 표로 피벗한 구조
+    
+    항목을 한 번만 훑어서 카테고리별 배열을 만들고, 현재/시간별/일별 조회는
+    모두 이 배열 위에서 처리한다. 카테고리를 추가해도 항목 순회는 한 번이다.
+    표는 작아서 (카테고리 6개 × 약 70시간) 원본 응답 대신 캐시에 저장한다.
+    """
+    
+    def __init__(self, slots, columns, base=None):
+        self.slots = slots  # [(fcstDate, hour), ...] 시간 순
+        self.columns = columns  # 카테고리 -> array (값 없음은 MISSING/NaN)
+        self.base = base  # 발표 기준 (baseDate, baseTime)
+    
+    @classmethod
+    def from_api_data(cls, api_data, categories=CATEGORY_TYPES):
+        """getVilageFcst 응답에서 표 생성 (예보 항목이 없으면 ValueError)"""
+        try:
+            items = api_data['response']['body']['items']['item']
+        except (KeyError, TypeError):
+            raise ValueError("Invalid API response structure")
+        if not items:
+            raise ValueError("No weather data available")
+        return cls.from_items(items, categories)
+    
+    @classmethod
+    def from_items(cls, items, categories=CATEGORY_TYPES):
+        """API 응답 item 목록을 단일 패스로 피벗"""
+        raw = {category: {} for category in categories}
+        get_values = raw.get
+        
+        for item in items:
+            values = get_values(item['category'])
+            if values is not None:
+                values[item['fcstDate'] + item['fcstTime']] = item['fcstValue']
+        
+        # 응답은 보통 시간 순이지만 보장되지 않으므로 행 순서를 정렬
+        slot_keys = sorted(set().union(*raw.values()))
+        slots = [(slot[:8], int(slot[8:10])) for slot in slot_keys]
+        
+        columns = {}
+        for category, values in raw.items():
+            typecode = categories[category]
+            parsed = _PARSERS[typecode]
+            if len(values) == len(slot_keys):
+                column = [values[slot] for slot in slot_keys]
+            else:
+                column = [values.get(slot) for slot in slot_keys]
+            columns[category] = array(typecode, map(parsed.__getitem__, column))
+        
+        base = (items[0].get('baseDate'), items[0].get('baseTime'))
+        return cls(slots, columns, base)
+    
+    def __len__(self):
+        return len(self.slots)
+    
+    def has(self, category, index):
+        """해당 행에 카테고리 값이 있는지 여부"""
+        value = self.columns[category][index]
+        return value == value and value != MISSING  # NaN 제외
+    
+    def value(self, category, index, default=None):
+        return self.columns[category][index] if self.has(category, index) else default
+    
+    def condition(self, index):
+        """강수형태가 있으면 강수형태, 없으면 하늘상태"""
+        pty = self.value('PTY', index, 0)
+        if pty:
+            return PTY_CODES.get(pty, '비')
+        if not self.has('SKY', index):
+            return None
+        return SKY_CODES.get(self.columns['SKY'][index], '맑음')
+    
+    def rows_for_date(self, fcst_date):
+        """해당 날짜 행 번호 목록"""
+        return [index for index, (slot_date, _) in enumerate(self.slots) if slot_date == fcst_date]
+    
+    def row(self, index):
+        """화면 표시용 시간대 정보 (기온/하늘상태가 없으면 None)"""
+        if not self.has('TMP', index):
+            return None
+        condition = self.condition(index)
+        if condition is None:
+            return None
+        
+        row = {
+            'time': f"{self.slots[index][1]:02d}:00",
+            'temp': f"{int(self.columns['TMP'][index])}°C",
+            'condition': condition
+        }
+        pop = self.value('POP', index)
+        if pop is not None:
+            row['pop'] = pop
+        return row
+    
+    def current(self, now):
+        """현재 날씨 - 오늘 현재 시각 이후 첫 시간대 (없으면 오늘 첫 시간대)"""
+        rows = self.rows_for_date(now.strftime('%Y%m%d'))
+        for index in rows:
+            if self.slots[index][1] >= now.hour:
+                row = self.row(index)
+                if row is not None:
+                    return self._with_details(row, index)
+        if rows:
+            row = self.row(rows[0])
+            if row is not None:
+                return self._with_details(row, rows[0])
+        return None
+    
+    def _with_details(self, row, index):
+        humidity = self.value('REH', index)
+        wind_speed = self.value('WSD', index)
+        if humidity is not None:
+            row['humidity'] = humidity
+        if wind_speed is not None:
+            row['wind_speed'] = round(wind_speed, 1)
+        return row
+    
+    def hourly(self, now, count=3):
+        """오늘 현재 시각 이후 시간별 예보"""
+        forecast = []
+        for index in self.rows_for_date(now.strftime('%Y%m%d')):
+            if self.slots[index][1] <= now.hour:
+                continue
+            row = self.row(index)
+            if row is not None:
+                forecast.append(row)
+                if len(forecast) >= count:
+                    break
+        return forecast
+    
+    def daily(self):
+        """날짜별 최저/최고 기온과 최대 강수확률"""
+        days = {}
+        for index, (fcst_date, _) in enumerate(self.slots):
+            day = days.setdefault(fcst_date, {'temps': [], 'pops': []})
+            if self.has('TMP', index):
+                day['temps'].append(self.columns['TMP'][index])
+            if self.has('POP', index):
+                day['pops'].append(self.columns['POP'][index])
+        
+        return [
+            {
+                'date': f"{fcst_date[4:6]}/{fcst_date[6:8]}",
+                'min_temp': f"{int(min(day['temps']))}°C" if day['temps'] else None,
+                'max_temp': f"{int(max(day['temps']))}°C" if day['temps'] else None,
+                'pop': max(day['pops']) if day['pops'] else None
+            }
+            for fcst_date, day in sorted(days.items())
+        ]
+
+
+# 성능 테스트 함수
+def _legacy_parse(items, now):
+    """기존 WeatherService._parse_weather_data 방식 (비교 기준)"""
+    current_date = now.strftime('%Y%m%d')
+    current_hour = now.hour
+    weather_by_time = {}
+    
+    for item in items:
+        fcst_date = item['fcstDate']
+        fcst_time = item['fcstTime']
+        category = item['category']
+        value = item['fcstValue']
+        
+        if fcst_date == current_date:
+            time_key = fcst_time
+            if time_key not in weather_by_time:
+                weather_by_time[time_key] = {}
+            if category == 'TMP':
+                weather_by_time[time_key]['temp'] = int(value)
+            elif category == 'SKY':
+                sky_codes = {'1': '맑음', '3': '구름많음', '4': '흐림'}
+                weather_by_time[time_key]['condition'] = sky_codes.get(value, '맑음')
+            elif category == 'PTY':
+                if value != '0':
+                    pty_codes = {'1': '비', '2': '비/눈', '3': '눈', '4': '소나기'}
+                    weather_by_time[time_key]['condition'] = pty_codes.get(value, '비')
+    
+    current_weather = None
+    hourly_forecast = []
+    for time_str in sorted(weather_by_time.keys()):
+        hour = int(time_str[:2])
+        weather_info = weather_by_time[time_str]
+        if 'temp' in weather_info and 'condition' in weather_info:
+            formatted_weather = {
+                'time': f"{hour:02d}:00",
+                'temp': f"{weather_info['temp']}°C",
+                'condition': weather_info['condition']
+            }
+            if current_weather is None and hour >= current_hour:
+                current_weather = formatted_weather
+            if hour > current_hour and len(hourly_forecast) < 3:
+                hourly_forecast.append(formatted_weather)
+    return current_weather, hourly_forecast
+
+
+def _sample_items(now, hours=72, seed=15):
+    """기상청 단기예보 응답과 같은 구성의 샘플 항목 생성 (약 1000개)"""
+    rng = random.Random(seed)
+    categories = ['TMP', 'UUU', 'VVV', 'VEC', 'WSD', 'SKY', 'PTY', 'POP', 'WAV', 'PCP', 'REH', 'SNO']
+    start = now.replace(minute=0, second=0, microsecond=0) - timedelta(hours=now.hour % 3)
+    items = []
+    for offset in range(hours):
+        slot = start + timedelta(hours=offset)
+        values = {
+            'TMP': str(rng.randint(-5, 30)),
+            'UUU': f"{rng.uniform(-5, 5):.1f}",
+            'VVV': f"{rng.uniform(-5, 5):.1f}",
+            'VEC': str(rng.randint(0, 359)),
+            'WSD': f"{rng.uniform(0, 10):.1f}",
+            'SKY': rng.choice(['1', '3', '4']),
+            'PTY': rng.choice(['0', '0', '0', '1', '3']),
+            'POP': str(rng.choice([0, 10, 20, 30, 60, 80])),
+            'WAV': '0',
+            'PCP': '강수없음',
+            'REH': str(rng.randint(20, 95)),
+            'SNO': '적설없음',
+        }
+        for category in categories:
+            items.append({
+                'baseDate': start.strftime('%Y%m%d'),
+                'baseTime': '0500',
+                'category': category,
+                'fcstDate': slot.strftime('%Y%m%d'),
+                'fcstTime': slot.strftime('%H00'),
+                'fcstValue': values[category],
+                'nx': 61,
+                'ny': 125
+            })
+    return items
+
+
+def performance_test(iterations=500):
+    """기존 파서 대비 피벗 테이블 파서 성능 비교"""
+    now = datetime.now().replace(hour=9)
+    items = _sample_items(now)
+    api_data = {'response': {'body': {'items': {'item': items}}}}
+    
+    print("=== 단기예보 파서 성능 테스트 ===")
+    print(f"항목 {len(items)}개, {iterations}회 반복")
+    
+    # 기존: 요청마다 원본 응답 전체 파싱
+    start_time = time.time()
+    for _ in range(iterations):
+        legacy_current, legacy_hourly = _legacy_parse(items, now)
+    legacy_duration = time.time() - start_time
+    
+    # 피벗: 예보 주기당 한 번 표 생성
+    start_time = time.time()
+    for _ in range(iterations):
+        table = ForecastTable.from_api_data(api_data)
+    build_duration = time.time() - start_time
+    
+    # 피벗: 요청마다 캐시에서 표를 꺼내 현재/시간별/일별 조회
+    raw_pickle = pickle.dumps(api_data)
+    table_pickle = pickle.dumps(table)
+    start_time = time.time()
+    for _ in range(iterations):
+        cached = pickle.loads(table_pickle)
+        current = cached.current(now)
+        hourly = cached.hourly(now)
+        cached.daily()
+    view_duration = time.time() - start_time
+    
+    start_time = time.time()
+    for _ in range(iterations):
+        pickle.loads(raw_pickle)
+    raw_load_duration = time.time() - start_time
+    
+    same = (
+        {key: current[key] for key in ('time', 'temp', 'condition')} == legacy_current
+        and [{key: row[key] for key in ('time', 'temp', 'condition')} for row in hourly] == legacy_hourly
+    )
+    print(f"기존 요청당 처리 (원본 로드 + 파싱): "
+          f"{(raw_load_duration + legacy_duration) / iterations * 1000:.3f}ms "
+          f"(캐시 크기 {len(raw_pickle) / 1024:.1f}KB)")
+    print(f"피벗 요청당 처리 (표 로드 + 조회):   "
+          f"{view_duration / iterations * 1000:.3f}ms "
+          f"(캐시 크기 {len(table_pickle) / 1024:.1f}KB, POP/REH/WSD/일별 포함)")
+    print(f"피벗 표 생성 (예보 주기당 1회):      {build_duration / iterations * 1000:.3f}ms")
+    print(f"현재/시간별 결과 일치: {same}")
+
+
+if __name__ == "__main__":
+    performance_test()
@@ -0,0 +1,136 @@
+"""
+감성 사전 다중 패턴 매처 (Aho-Corasick)
+"""
+import random
+import time
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, Set
+
+
+class LexiconMatcher:
+    """긍정/부정/중립 사전을 하나의 오토마톤으로 컴파일한 매처
+
+    텍스트를 한 번만 훑어서 포함된 모든 사전 단어와 극성을 찾는다.
+    사전 크기와 관계없이 텍스트 길이에 비례하는 시간이 걸린다.
+    """
+
+    def __init__(self, lexicons: Dict[str, Iterable[str]]):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        self.polarities = {}  # 단어 -> 극성 집합
+
+        for polarity, words in lexicons.items():
+            for word in words:
+                if not word:
+                    continue
+                if word not in self.polarities:
+                    self.polarities[word] = set()
+                    self._add_pattern(word)
+                self.polarities[word].add(polarity)
+
+        self.polarities = {word: frozenset(pols) for word, pols in self.polarities.items()}
+        self._build_failure_links()
+
+    def __len__(self):
+        return len(self.polarities)
+
+    def _add_pattern(self, word: str):
+        """트라이에 패턴 추가"""
+        state = 0
+        for ch in word:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] = (word,)
+
+    def _build_failure_links(self):
+        """BFS로 실패 링크 계산 및 출력 병합"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+
+                self._fail[next_state] = fail
+                if self._output[fail]:
+                    self._output[next_state] = self._output[next_state] + self._output[fail]
+
+    def find_words(self, text: str) -> Set[str]:
+        """텍스트에 포함된 모든 사전 단어 반환 (단일 패스)"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        found = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+    def find_polarities(self, text: str) -> FrozenSet[str]:
+        """텍스트에 포함된 사전 단어들의 극성 합집합 반환"""
+        polarities = set()
+        for word in self.find_words(text):
+            polarities |= self.polarities[word]
+        return frozenset(polarities)
+
+
+# 성능 테스트 함수
+def performance_test(sizes=(100, 1000, 10000, 100000), text_count=200):
+    """사전 크기별 단순 부분 문자열 검색 대비 성능 비교"""
+    rng = random.Random(36)
+    syllables = [chr(code) for code in range(0xAC00, 0xAC00 + 400)]
+
+    def random_word():
+        return ''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4)))
+
+    texts = [' '.join(random_word() for _ in range(12)) for _ in range(text_count)]
+
+    print("=== 감성 사전 매칭 성능 테스트 ===")
+    for size in sizes:
+        words = list({random_word() for _ in range(size)})
+        positive, negative = words[:len(words) // 2], words[len(words) // 2:]
+
+        start_time = time.time()
+        naive_hits = 0
+        for text in texts:
+            naive_hits += sum(1 for word in positive if word in text)
+            naive_hits += sum(1 for word in negative if word in text)
+        naive_duration = time.time() - start_time
+
+        start_time = time.time()
+        matcher = LexiconMatcher({'positive': positive, 'negative': negative})
+        build_duration = time.time() - start_time
+
+        start_time = time.time()
+        matcher_hits = 0
+        for text in texts:
+            for word in matcher.find_words(text):
+                matcher_hits += len(matcher.polarities[word])
+        matcher_duration = time.time() - start_time
+
+        speedup = naive_duration / matcher_duration if matcher_duration > 0 else float('inf')
+        print(
+            f"사전 {size:>6}개: 단순 검색 {naive_duration * 1000:8.1f}ms, "
+            f"오토마톤 {matcher_duration * 1000:6.1f}ms (빌드 {build_duration * 1000:.0f}ms), "
+            f"{speedup:.1f}x, 일치 {naive_hits}/{matcher_hits}"
+        )
+
+
+if __name__ == "__main__":
+    performance_test()
@@ -0,0 +1,64 @@
+"""
+로깅 유틸 - 요청 단위 페이로드 디버그 플래그, 지연 직렬화, 로거별 샘플링 필터
+"""
+import json
+import logging
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_payload_debug = ContextVar('payload_debug', default=False)
+
+
+def payload_debug_enabled():
+    """현재 요청에 페이로드 디버그 로깅이 켜져 있는지 여부"""
+    return _payload_debug.get()
+
+
+@contextmanager
+def payload_debug(enabled=True):
+    """블록 안에서만 페이로드 디버그 로깅 활성화"""
+    token = _payload_debug.set(enabled)
+    try:
+        yield
+    finally:
+        _payload_debug.reset(token)
+
+
+class LazyJson:
+    """로그가 실제로 출력될 때만 JSON 직렬화 (%s 인자로 전달)"""
+    
+    __slots__ = ('obj', 'indent')
+    
+    def __init__(self, obj, indent=None):
+        self.obj = obj
+        self.indent = indent
+    
+    def __str__(self):
+        return json.dumps(self.obj, ensure_ascii=False, indent=self.indent, default=str)
+
+
+def log_payload(logger, message, payload):
+    """디버그 플래그가 켜진 요청에서만 페이로드 전체를 기록
+    
+    플래그가 꺼져 있으면 레코드도 만들지 않으므로 직렬화/로그 I/O 비용이 없다.
+    """
+    if payload_debug_enabled():
+        logger.info("%s: %s", message, LazyJson(payload, indent=2), extra={'payload_debug': True})
+
+
+class SamplingFilter(logging.Filter):
+    """로거별 샘플링 필터
+    
+    WARNING 미만 레코드는 rate 비율만 통과시키고, WARNING 이상과
+    페이로드 디버그 레코드는 항상 통과시킨다.
+    """
+    
+    def __init__(self, rate=1.0, name=''):
+        super().__init__(name)
+        self.rate = float(rate)
+    
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or getattr(record, 'payload_debug', False):
+            return True
+        return self.rate >= 1.0 or random.random() < self.rate
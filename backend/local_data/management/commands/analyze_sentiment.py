@@ -3,7 +3,10 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import date, timedelta
 from local_data.models import Location, RawData, DistrictAnnouncement, LocalIssue, SentimentAnalysis
-from local_data.sentiment_analyzer import SimpleSentimentAnalyzer, update_sentiment_summary
+from local_data.sentiment_analyzer import (
+    get_sentiment_analyzer, build_sentiment_analysis, rebuild_sentiment_summaries, shutdown_analysis_pool
+)
+from rest_api.briefing_snapshot import publish_briefing_snapshots
 
 class Command(BaseCommand):
     help = '크롤링된 데이터의 감성 분석 실행'
@@ -11,113 +14,67 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument('--location', type=str, help='분석할 지역명 (예: 강남구)')
         parser.add_argument('--days', type=int, default=7, help='분석할 일수 (기본: 7일)')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='감성 분석 워커 프로세스 수 (기본: CPU 코어 수)')
     
     def handle(self, *args, **options):
-        analyzer = SimpleSentimentAnalyzer()
+        analyzer = get_sentiment_analyzer()
         
         # 지역 필터링
         locations = Location.objects.all()
         if options['location']:
             locations = locations.filter(gu=options['location'])
+        locations = list(locations)
         
         # 날짜 범위 설정
         end_date = date.today()
         start_date = end_date - timedelta(days=options['days'])
         
+        # 1. 전체 지역의 미분석 데이터 수집
+        pending = []
         for location in locations:
-            self.stdout.write(f"\n=== {location.gu} 감성 분석 시작 ===")
-            
-            analyzed_count = 0
-            
-            # 1. RawData 분석
-            raw_data_items = RawData.objects.filter(
-                location=location,
-                collected_at__date__gte=start_date,
-                processed=False
-            )
-            
-            for item in raw_data_items:
-                # 이미 분석된 데이터는 스킵
-                if SentimentAnalysis.objects.filter(
-                    content_type='raw_data',
-                    content_id=item.id
-                ).exists():
-                    continue
-                
-                # 제목과 내용 합쳐서 분석
-                text = f"{item.title} {item.content}"
-                result = analyzer.analyze_text(text)
-                
-                # 분석 결과 저장
-                SentimentAnalysis.objects.create(
-                    location=location,
-                    content_type='raw_data',
-                    content_id=item.id,
-                    sentiment=result['sentiment'],
-                    confidence=result['confidence'],
-                    keywords=result['keywords']
-                )
-                
-                analyzed_count += 1
-            
-            # 2. DistrictAnnouncement 분석
-            announcements = DistrictAnnouncement.objects.filter(
-                location=location,
-                collected_at__date__gte=start_date
-            )
-            
-            for announcement in announcements:
-                if SentimentAnalysis.objects.filter(
-                    content_type='district_announcement',
-                    content_id=announcement.id
-                ).exists():
-                    continue
-                
-                text = f"{announcement.title} {announcement.content}"
-                result = analyzer.analyze_text(text)
-                
-                SentimentAnalysis.objects.create(
-                    location=location,
-                    content_type='district_announcement',
-                    content_id=announcement.id,
-                    sentiment=result['sentiment'],
-                    confidence=result['confidence'],
-                    keywords=result['keywords']
-                )
-                
-                analyzed_count += 1
-            
-            # 3. LocalIssue 분석
-            issues = LocalIssue.objects.filter(
-                location=location,
-                collected_at__date__gte=start_date
+            pending.extend(self.collect_pending(location, start_date))
+        
+        # 2. 워커 프로세스 풀로 일괄 감성 분석
+        # (워커는 spawn으로 시작해 자체 DB 연결/분석기를 만들므로 부모 연결을 닫을 필요 없음)
+        self.stdout.write(f"미분석 데이터 {len(pending)}건 분석 시작 (워커: {options['workers']})")
+        try:
+            results = analyzer.analyze_many(
+                [text for _, _, _, text in pending],
+                workers=options['workers']
             )
+        finally:
+            shutdown_analysis_pool()
+        
+        # 3. 분석 결과 배치 저장
+        analyses_to_create = []
+        analyzed_counts = {}
+        for (location, content_type, content_id, text), result in zip(pending, results):
+            analyses_to_create.append(build_sentiment_analysis(
+                location, content_type, content_id, text, result, analyzer
+            ))
+            analyzed_counts[location.id] = analyzed_counts.get(location.id, 0) + 1
+        
+        SentimentAnalysis.objects.bulk_create(
+            analyses_to_create,
+            batch_size=500,
+            ignore_conflicts=True
+        )
+        
+        # 4. 전체 지역/일별 감성 요약 일괄 업데이트
+        target_dates = [end_date - timedelta(days=i) for i in range(options['days'])]
+        summaries = rebuild_sentiment_summaries(locations, target_dates)
+        publish_briefing_snapshots()
+        summaries_by_location = {}
+        for summary in summaries:
+            summaries_by_location.setdefault(summary.location.id, []).append(summary)
+        
+        for location in locations:
+            self.stdout.write(f"\n=== {location.gu} 감성 요약 ===")
             
-            for issue in issues:
-                if SentimentAnalysis.objects.filter(
-                    content_type='local_issue',
-                    content_id=issue.id
-                ).exists():
-                    continue
-                
-                result = analyzer.analyze_text(issue.title)
-                
-                SentimentAnalysis.objects.create(
-                    location=location,
-                    content_type='local_issue',
-                    content_id=issue.id,
-                    sentiment=result['sentiment'],
-                    confidence=result['confidence'],
-                    keywords=result['keywords']
-                )
-                
-                analyzed_count += 1
-            
-            # 4. 일별 감성 요약 업데이트
-            for i in range(options['days']):
-                target_date = end_date - timedelta(days=i)
-                summary = update_sentiment_summary(location, target_date)
-                
+            for summary in sorted(summaries_by_location.get(location.id, []),
+                                  key=lambda item: item.date, reverse=True):
+                target_date = summary.date
                 if summary.total_count > 0:
                     self.stdout.write(
                         f"  {target_date}: {summary.mood_emoji} "
@@ -127,9 +84,56 @@ class Command(BaseCommand):
                     )
             
             self.stdout.write(
-                self.style.SUCCESS(f"{location.gu} 완료: {analyzed_count}건 분석")
+                self.style.SUCCESS(f"{location.gu} 완료: {analyzed_counts.get(location.id, 0)}건 분석")
             )
         
         self.stdout.write(
             self.style.SUCCESS("\n감성 분석 완료!")
-        )
\ No newline at end of file
+        )
+    
+    def collect_pending(self, location, start_date):
+        """아직 감성 분석되지 않은 (지역, 타입, ID, 텍스트) 목록 반환"""
+        sources = [
+            (
+                'raw_data',
+                RawData.objects.filter(
+                    location=location,
+                    collected_at__date__gte=start_date,
+                    processed=False
+                ),
+                lambda item: f"{item.title} {item.content}"
+            ),
+            (
+                'district_announcement',
+                DistrictAnnouncement.objects.filter(
+                    location=location,
+                    collected_at__date__gte=start_date
+                ),
+                lambda item: f"{item.title} {item.content}"
+            ),
+            (
+                'local_issue',
+                LocalIssue.objects.filter(
+                    location=location,
+                    collected_at__date__gte=start_date
+                ),
+                lambda item: item.title
+            ),
+        ]
+        
+        pending = []
+        for content_type, queryset, get_text in sources:
+            # 이미 분석된 데이터는 스킵
+            analyzed_ids = set(
+                SentimentAnalysis.objects.filter(
+                    content_type=content_type,
+                    content_id__in=queryset.values('id')
+                ).values_list('content_id', flat=True)
+            )
+            
+            for item in queryset:
+                if item.id in analyzed_ids:
+                    continue
+                pending.append((location, content_type, item.id, get_text(item)))
+        
+        return pending
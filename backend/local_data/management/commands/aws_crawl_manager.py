@@ -1,9 +1,13 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
 from datetime import datetime, timedelta
 from local_data.models import Location, LocalIssue, SentimentAnalysis
 from local_data.optimized_crawler import AsyncCrawlerWrapper as LocalIssueCrawler
-from local_data.sentiment_analyzer import SimpleSentimentAnalyzer
+from local_data.db_writers import record_sentiment_analyses, upsert_local_issues
+from local_data.sentiment_analyzer import get_sentiment_analyzer, build_sentiment_analysis
+from local_data.url_index import get_seen_url_index
+from rest_api.briefing_snapshot import publish_briefing_snapshots
 from aws_services import AWSManager
 from concurrent.futures import ThreadPoolExecutor
 import time
@@ -27,17 +31,19 @@ class Command(BaseCommand):
         if options['cleanup']:
             self.cleanup_old_data()
         
-        # 크롤링 실행
-        if options['district']:
-            # 단일 구 크롤링
-            total_collected = self.crawl_single_district(
-                options['district'], options['limit'], aws_manager
-            )
-        else:
-            # 전체 구 병렬 크롤링
-            total_collected = self.crawl_all_districts_parallel(
-                options['limit'], options['parallel'], aws_manager
-            )
+        # 크롤링 실행 (모든 워커 스레드가 하나의 이벤트 루프/연결 풀 공유)
+        with LocalIssueCrawler(max_concurrent=5 * options['parallel']) as self.crawler:
+            if options['district']:
+                # 단일 구 크롤링
+                total_collected = self.crawl_single_district(
+                    options['district'], options['limit'], aws_manager
+                )
+            else:
+                # 전체 구 병렬 크롤링
+                total_collected = self.crawl_all_districts_parallel(
+                    options['limit'], options['parallel'], aws_manager
+                )
+        get_seen_url_index().save()
         
         duration = time.time() - start_time
         
@@ -45,6 +51,10 @@ class Command(BaseCommand):
         aws_manager.cloudwatch.put_metric('TotalIssuesCollected', total_collected)
         aws_manager.cloudwatch.put_metric('CrawlTotalDuration', duration, 'Seconds')
         
+        # 새 데이터 반영 - 브리핑 스냅샷 생성 후 캐시된 API 응답 무효화
+        snapshot_count = publish_briefing_snapshots()
+        self.stdout.write(f"브리핑 스냅샷 {snapshot_count}개 생성")
+        
         self.stdout.write(
             self.style.SUCCESS(
                 f"크롤링 완료: {total_collected}개 수집, {duration:.1f}초 소요"
@@ -108,59 +118,48 @@ class Command(BaseCommand):
         """구별 크롤링 및 감성 분석 처리"""
         self.stdout.write(f"처리 중: {location.gu}")
         
-        crawler = LocalIssueCrawler(max_concurrent=5)
-        analyzer = SimpleSentimentAnalyzer()
+        analyzer = get_sentiment_analyzer()
         
         # 크롤링 실행
-        results = crawler.crawl_single_district(location.gu, limit)
+        results = self.crawler.crawl_single_district(location.gu, limit)
         collected_count = 0
         
         # 배치 처리를 위한 리스트
         issues_to_create = []
         analyses_to_create = []
         
-        for result in results:
-            # 중복 체크
-            if LocalIssue.objects.filter(url=result['url']).exists():
-                continue
-            
+        # 중복 체크 (정규화 URL 기준, 다른 구/이전 날짜에 저장된 URL 포함)
+        for result in get_seen_url_index().filter_new(results):
             # LocalIssue 객체 준비
             issue_data = {
                 'location': location,
                 'source': result['source'],
                 'title': result['title'],
                 'url': result['url'],
+                'url_hash': result['url_hash'],
                 'view_count': result['view_count'],
                 'published_at': result['published_at']
             }
             issues_to_create.append(LocalIssue(**issue_data))
-            collected_count += 1
         
-        # 배치 INSERT
+        # 배치 UPSERT (url_hash 충돌 시 갱신) - 새로 삽입된 이슈만 감성 분석
         if issues_to_create:
-            created_issues = LocalIssue.objects.bulk_create(
-                issues_to_create, batch_size=100, ignore_conflicts=True
-            )
-            
-            # 감성 분석 배치 처리
-            for issue in created_issues:
-                sentiment_result = analyzer.analyze_text(issue.title)
+            with transaction.atomic():
+                created_issues = upsert_local_issues(issues_to_create)
                 
-                analysis_data = {
-                    'location': location,
-                    'content_type': 'local_issue',
-                    'content_id': issue.id,
-                    'sentiment': sentiment_result['sentiment'],
-                    'confidence': sentiment_result['confidence'],
-                    'keywords': sentiment_result.get('keywords', [])
-                }
-                analyses_to_create.append(SentimentAnalysis(**analysis_data))
-            
-            # 감성 분석 배치 INSERT
-            if analyses_to_create:
-                SentimentAnalysis.objects.bulk_create(
-                    analyses_to_create, batch_size=100, ignore_conflicts=True
-                )
+                # 감성 분석 배치 처리
+                for issue in created_issues:
+                    sentiment_result = analyzer.analyze_text(issue.title)
+                    
+                    analyses_to_create.append(build_sentiment_analysis(
+                        location, 'local_issue', issue.id, issue.title,
+                        sentiment_result, analyzer
+                    ))
+                
+                # 감성 분석 배치 INSERT + 감성 요약 증분 갱신
+                if analyses_to_create:
+                    record_sentiment_analyses(analyses_to_create)
+            collected_count = len(created_issues)
         
         self.stdout.write(f"{location.gu}: {collected_count}개 수집")
         return collected_count
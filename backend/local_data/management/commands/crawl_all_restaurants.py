@@ -2,6 +2,9 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import datetime
 from local_data.models import Location, RestaurantInfo
+from local_data.crawler_utils import rate_limiter
+from local_data.db_writers import insert_restaurants, restaurant_loader
+from rest_api.briefing_snapshot import publish_briefing_snapshots
 import requests
 import json
 import os
@@ -10,23 +13,34 @@ import sys
 class Command(BaseCommand):
     help = '모든 구의 음식점 데이터 크롤링 및 AWS DB 저장'
     
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='구별 최신 5개 대신 서울시 전체 영업 중 일반음식점 적재')
+    
     def handle(self, *args, **options):
         self.stdout.write("=== 전체 구 음식점 데이터 수집 시작 ===")
         
         total_saved = 0
+        restaurant_loader.reset_stats()
         
         # Method 1: 서울시 API 전체 구 데이터 수집
-        total_saved += self.crawl_all_seoul_api()
+        total_saved += self.crawl_all_seoul_api(full=options['full'])
         
         # Method 2: 카카오 API 구별 데이터 수집
         total_saved += self.crawl_all_kakao_api()
         
+        # 새 데이터 반영 - 브리핑 스냅샷 생성 후 캐시된 API 응답 무효화
+        publish_briefing_snapshots()
+        
+        stats = restaurant_loader.get_stats()
+        self.stdout.write(
+            f"DB 적재: {stats['rows']}행, {stats['seconds']:.2f}초 ({stats['rows_per_second']}행/초)"
+        )
         self.stdout.write(
             self.style.SUCCESS(f"\n총 {total_saved}개 음식점 데이터 저장 완료")
         )
     
-    def crawl_all_seoul_api(self):
-        """서울시 API에서 모든 구의 신규 개업 음식점 데이터 수집"""
+    def crawl_all_seoul_api(self, full=False):
+        """서울시 API에서 모든 구의 신규 개업 음식점 데이터 수집 (full이면 전체 페이지)"""
         api_key = os.getenv('SEOUL_API_KEY')
         if not api_key:
             self.stdout.write(self.style.WARNING("SEOUL_API_KEY 없음 - 서울시 API 스킵"))
@@ -38,16 +52,23 @@ class Command(BaseCommand):
         try:
             base_url = f"http://openapi.seoul.go.kr:8088/{api_key}/json/CrtfcUpsoInfo"
             
-            # 전체 데이터 수집
+            # 전체 데이터 수집 (요청당 최대 1000건, full이면 list_total_count까지)
             all_restaurants = []
-            for start_idx in range(1, 1001, 1000):
+            start_idx, total_count = 1, 1000
+            while start_idx <= total_count:
                 url = f"{base_url}/{start_idx}/{start_idx + 999}"
+                rate_limiter.acquire_sync(url)
                 response = requests.get(url, timeout=30)
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    if 'CrtfcUpsoInfo' in data and 'row' in data['CrtfcUpsoInfo']:
-                        all_restaurants.extend(data['CrtfcUpsoInfo']['row'])
+                if response.status_code != 200:
+                    break
+                data = response.json().get('CrtfcUpsoInfo', {})
+                if not data.get('row'):
+                    break
+                all_restaurants.extend(data['row'])
+                if full:
+                    total_count = int(data.get('list_total_count', 0))
+                start_idx += 1000
             
             # 구별로 그룹화
             district_groups = {}
@@ -70,62 +91,54 @@ class Command(BaseCommand):
                         })
             
             # 각 구별로 정렬 및 상위 5개 선별
-            for district in district_groups:
-                district_groups[district].sort(key=lambda x: x['license_date'], reverse=True)
-                district_groups[district] = district_groups[district][:5]
+            if not full:
+                for district in district_groups:
+                    district_groups[district].sort(key=lambda x: x['license_date'], reverse=True)
+                    district_groups[district] = district_groups[district][:5]
             
             results = district_groups
-            
-            total_saved = 0
+            locations = {location.gu: location for location in Location.objects.filter(gu__in=results.keys())}
+            restaurants_to_load = []
             
             for district_name, restaurants in results.items():
-                if not restaurants:
+                location = locations.get(district_name)
+                if not location or not restaurants:
                     continue
                 
-                try:
-                    location = Location.objects.get(gu=district_name)
-                    saved_count = 0
-                    
-                    for restaurant in restaurants:
-                        # 이미 중복 체크를 아래에서 하므로 삭제
-                        
+                for restaurant in restaurants:
+                    try:
                         # 날짜 변환
                         license_date_str = restaurant['license_date']
                         if len(license_date_str) == 8:  # YYYYMMDD
                             license_date = datetime.strptime(license_date_str, '%Y%m%d').date()
                         else:
                             license_date = datetime.strptime(license_date_str, '%Y-%m-%d').date()
-                        
-                        # 관리번호 생성
-                        management_number = restaurant.get('management_number')
-                        if not management_number:
-                            management_number = f"seoul_{district_name}_{restaurant['name']}_{license_date_str}"
-                        
-                        # 중복 체크
-                        if RestaurantInfo.objects.filter(management_number=management_number).exists():
-                            continue
-                        
-                        # 데이터베이스에 저장
-                        RestaurantInfo.objects.create(
-                            location=location,
-                            management_number=management_number,
-                            business_type='general',
-                            license_date=license_date,
-                            business_status_code='01',
-                            business_status_name='영업',
-                            business_name=restaurant['name'],
-                            road_address=restaurant['address'],
-                            collected_at=timezone.now()
-                        )
-                        
-                        saved_count += 1
+                    except ValueError:
+                        continue
                     
-                    if saved_count > 0:
-                        self.stdout.write(f"  {district_name}: {saved_count}개 저장")
-                    total_saved += saved_count
+                    # 관리번호 생성
+                    management_number = restaurant.get('management_number')
+                    if not management_number:
+                        management_number = f"seoul_{district_name}_{restaurant['name']}_{license_date_str}"
                     
-                except Location.DoesNotExist:
-                    continue
+                    restaurants_to_load.append(RestaurantInfo(
+                        location=location,
+                        management_number=management_number,
+                        business_type='general',
+                        license_date=license_date,
+                        business_status_code='01',
+                        business_status_name='영업',
+                        business_name=restaurant['name'],
+                        road_address=restaurant['address'],
+                        collected_at=timezone.now()
+                    ))
+            
+            # COPY 적재 (이미 있는 관리번호는 건너뜀)
+            saved = insert_restaurants(restaurants_to_load)
+            for district_name, location in locations.items():
+                if saved.get(location.id):
+                    self.stdout.write(f"  {district_name}: {saved[location.id]}개 저장")
+            total_saved = sum(saved.values())
             
             self.stdout.write(f"서울시 API 총 {total_saved}개 저장")
             return total_saved
@@ -180,23 +193,23 @@ class Command(BaseCommand):
                 '중랑구': {'x': '127.0927', 'y': '37.6063'}
             }
             
-            total_saved = 0
+            locations = {location.gu: location for location in Location.objects.filter(gu__in=districts)}
+            restaurants_to_load = []
             
             for district_name in districts:
+                location = locations.get(district_name)
+                if not location:
+                    continue
+                
                 try:
-                    location = Location.objects.get(gu=district_name)
-                    
                     # 카카오 API로 해당 구 인기 음식점 수집
                     coords = district_coords.get(district_name, district_coords['강남구'])
                     restaurants = self.get_kakao_restaurants(kakao_key, district_name, coords)
-                    saved_count = 0
                     
                     for restaurant in restaurants:
-                        # 관리번호 생성 및 중복 체크
+                        # 관리번호 생성 (중복은 적재 시 건너뜀)
                         kakao_id = restaurant.get('kakao_id', '')
-                        management_number = f"kakao_{kakao_id}"
-                        
-                        if not kakao_id or RestaurantInfo.objects.filter(management_number=management_number).exists():
+                        if not kakao_id:
                             continue
                         
                         # 해당 구 필터링
@@ -204,10 +217,9 @@ class Command(BaseCommand):
                         if district_name not in address:
                             continue
                         
-                        # 데이터베이스에 저장
-                        RestaurantInfo.objects.create(
+                        restaurants_to_load.append(RestaurantInfo(
                             location=location,
-                            management_number=management_number,
+                            management_number=f"kakao_{kakao_id}",
                             business_type='general',
                             license_date=timezone.now().date(),  # 카카오는 개업일 정보 없음
                             business_status_code='01',
@@ -219,20 +231,20 @@ class Command(BaseCommand):
                             coordinate_x=float(restaurant.get('x', 0)) if restaurant.get('x') else None,
                             coordinate_y=float(restaurant.get('y', 0)) if restaurant.get('y') else None,
                             collected_at=timezone.now()
-                        )
-                        
-                        saved_count += 1
-                    
-                    if saved_count > 0:
-                        self.stdout.write(f"  {district_name}: {saved_count}개 저장")
-                    total_saved += saved_count
+                        ))
                     
-                except Location.DoesNotExist:
-                    continue
                 except Exception as e:
                     self.stdout.write(f"{district_name} 오류: {e}")
                     continue
             
+            # COPY 적재 (이미 있는 관리번호는 건너뜀)
+            saved = insert_restaurants(restaurants_to_load)
+            for district_name in districts:
+                location = locations.get(district_name)
+                if location and saved.get(location.id):
+                    self.stdout.write(f"  {district_name}: {saved[location.id]}개 저장")
+            total_saved = sum(saved.values())
+            
             self.stdout.write(f"카카오 API 총 {total_saved}개 저장")
             return total_saved
             
@@ -259,6 +271,7 @@ class Command(BaseCommand):
                 'sort': 'accuracy'
             }
             
+            rate_limiter.acquire_sync(url)
             response = requests.get(url, headers=headers, params=params)
             
             if response.status_code == 200:
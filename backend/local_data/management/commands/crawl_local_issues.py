@@ -1,5 +1,8 @@
 from django.core.management.base import BaseCommand
 from local_data.models import Location, LocalIssue
+from local_data.db_writers import upsert_local_issues
+from local_data.data_version import bump_data_version
+from rest_api.briefing_snapshot import publish_briefing_snapshots
 from local_data.optimized_crawler import AsyncCrawlerWrapper as LocalIssueCrawler
 from datetime import datetime
 
@@ -10,37 +13,45 @@ class Command(BaseCommand):
         parser.add_argument('--district', type=str, help='특정 구만 크롤링')
 
     def handle(self, *args, **options):
-        crawler = LocalIssueCrawler(max_concurrent=5)
-        
-        if options['district']:
-            locations = Location.objects.filter(gu=options['district'])
-        else:
-            locations = Location.objects.all()
-        
-        for location in locations:
-            self.stdout.write(f"{location.gu} 크롤링 시작...")
-            
-            # 7일 이상 된 데이터 삭제
-            from datetime import timedelta
-            from django.utils import timezone
-            seven_days_ago = timezone.now() - timedelta(days=7)
-            LocalIssue.objects.filter(location=location, collected_at__lt=seven_days_ago).delete()
+        # 구별 크롤링이 끝날 때까지 하나의 이벤트 루프/연결 풀 재사용
+        with LocalIssueCrawler(max_concurrent=5) as crawler:
+            if options['district']:
+                locations = Location.objects.filter(gu=options['district'])
+            else:
+                locations = Location.objects.all()
             
-            # 크롤링 실행
-            results = crawler.crawl_single_district(location.gu, 50)
-            
-            # 데이터베이스에 저장
-            from django.utils import timezone
-            for result in results:
-                LocalIssue.objects.create(
-                    location=location,
-                    source=result['source'],
-                    title=result['title'],
-                    url=result['url'],
-                    view_count=result['view_count'],
-                    published_at=result.get('published_at') or timezone.now()
+            for location in locations:
+                self.stdout.write(f"{location.gu} 크롤링 시작...")
+                
+                # 7일 이상 된 데이터 삭제
+                from datetime import timedelta
+                from django.utils import timezone
+                seven_days_ago = timezone.now() - timedelta(days=7)
+                deleted_count, _ = LocalIssue.objects.filter(location=location, collected_at__lt=seven_days_ago).delete()
+                if deleted_count:
+                    bump_data_version()
+                
+                # 크롤링 실행
+                results = crawler.crawl_single_district(location.gu, 50)
+                
+                # 데이터베이스에 저장 (이미 저장된 URL은 조회수/제목만 갱신)
+                from django.utils import timezone
+                upsert_local_issues([
+                    LocalIssue(
+                        location=location,
+                        source=result['source'],
+                        title=result['title'],
+                        url=result['url'],
+                        view_count=result['view_count'],
+                        published_at=result.get('published_at') or timezone.now()
+                    )
+                    for result in results
+                ])
+                
+                self.stdout.write(
+                    self.style.SUCCESS(f"{location.gu}: {len(results)}개 이슈 수집 완료")
                 )
-            
-            self.stdout.write(
-                self.style.SUCCESS(f"{location.gu}: {len(results)}개 이슈 수집 완료")
-            )
\ No newline at end of file
+        
+        # 새 데이터 반영 - 브리핑 스냅샷 생성 후 캐시된 API 응답 무효화
+        snapshot_count = publish_briefing_snapshots()
+        self.stdout.write(f"브리핑 스냅샷 {snapshot_count}개 생성")
\ No newline at end of file
@@ -2,6 +2,9 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import datetime
 from local_data.models import Location, RestaurantInfo
+from local_data.crawler_utils import rate_limiter
+from local_data.db_writers import insert_restaurants, restaurant_loader
+from rest_api.briefing_snapshot import publish_briefing_snapshots
 import requests
 import json
 import os
@@ -29,6 +32,7 @@ class Command(BaseCommand):
             locations = Location.objects.all()
         
         total_saved = 0
+        restaurant_loader.reset_stats()
         
         for location in locations:
             self.stdout.write(f"\\n=== {location.gu} 음식점 데이터 수집 ===")
@@ -46,9 +50,17 @@ class Command(BaseCommand):
             self.stdout.write(f"{location.gu}: {saved_count}개 저장 완료")
             total_saved += saved_count
         
+        stats = restaurant_loader.get_stats()
+        self.stdout.write(
+            f"DB 적재: {stats['rows']}행, {stats['seconds']:.2f}초 ({stats['rows_per_second']}행/초)"
+        )
         self.stdout.write(
             self.style.SUCCESS(f"\\n총 {total_saved}개 음식점 데이터 저장 완료")
         )
+        
+        # 새 데이터 반영 - 브리핑 스냅샷 생성 후 캐시된 API 응답 무효화
+        snapshot_count = publish_briefing_snapshots()
+        self.stdout.write(f"브리핑 스냅샷 {snapshot_count}개 생성")
     
     def crawl_seoul_api(self, location):
         """서울시 API에서 신규 개업 음식점 데이터 수집"""
@@ -63,6 +75,7 @@ class Command(BaseCommand):
         try:
             # 최대 1000개 데이터 수집
             url = f"{base_url}/1/1000"
+            rate_limiter.acquire_sync(url)
             response = requests.get(url, timeout=30)
             
             if response.status_code != 200:
@@ -75,6 +88,7 @@ class Command(BaseCommand):
                 return 0
             
             restaurants = data['CrtfcUpsoInfo']['row']
+            restaurants_to_load = []
             
             for restaurant in restaurants:
                 district = restaurant.get('CGG_CODE_NM', '').strip()
@@ -88,10 +102,6 @@ class Command(BaseCommand):
                     
                     management_number = restaurant.get('MGTNO', '')
                     
-                    # 중복 체크
-                    if RestaurantInfo.objects.filter(management_number=management_number).exists():
-                        continue
-                    
                     license_date_str = restaurant.get('CRTFC_YMD', '')
                     if not license_date_str or len(license_date_str) < 8:
                         continue
@@ -103,8 +113,7 @@ class Command(BaseCommand):
                         else:
                             license_date = datetime.strptime(license_date_str, '%Y-%m-%d').date()
                         
-                        # 데이터베이스에 저장
-                        RestaurantInfo.objects.create(
+                        restaurants_to_load.append(RestaurantInfo(
                             location=location,
                             management_number=management_number,
                             business_type='general',
@@ -115,13 +124,13 @@ class Command(BaseCommand):
                             phone_number=restaurant.get('TELNO', ''),
                             road_address=restaurant.get('RDN_CODE_NM', '') or restaurant.get('RDN_DETAIL_ADDR', ''),
                             collected_at=timezone.now()
-                        )
-                        
-                        saved_count += 1
+                        ))
                         
                     except ValueError:
                         continue
             
+            # COPY 적재 (이미 있는 관리번호는 건너뜀)
+            saved_count = sum(insert_restaurants(restaurants_to_load).values())
             self.stdout.write(f"  서울시 API: {saved_count}개 저장")
             return saved_count
             
@@ -174,6 +183,7 @@ class Command(BaseCommand):
             
             # 검색 쿼리
             queries = [f"{location.gu} 맛집", f"{location.gu} 인기 레스토랑"]
+            restaurants_to_load = []
             
             for query in queries:
                 params = {
@@ -186,6 +196,7 @@ class Command(BaseCommand):
                     'sort': 'accuracy'
                 }
                 
+                rate_limiter.acquire_sync(url)
                 response = requests.get(url, headers=headers, params=params)
                 
                 if response.status_code == 200:
@@ -194,17 +205,12 @@ class Command(BaseCommand):
                     for place in data.get('documents', []):
                         place_id = place.get('id')
                         
-                        # 중복 체크 (카카오 ID로)
-                        if RestaurantInfo.objects.filter(management_number=f"kakao_{place_id}").exists():
-                            continue
-                        
                         # 해당 구 필터링
                         address = place.get('address_name', '')
                         if location.gu not in address:
                             continue
                         
-                        # 데이터베이스에 저장
-                        RestaurantInfo.objects.create(
+                        restaurants_to_load.append(RestaurantInfo(
                             location=location,
                             management_number=f"kakao_{place_id}",
                             business_type='general',
@@ -218,10 +224,10 @@ class Command(BaseCommand):
                             coordinate_x=float(place.get('x', 0)),
                             coordinate_y=float(place.get('y', 0)),
                             collected_at=timezone.now()
-                        )
-                        
-                        saved_count += 1
+                        ))
             
+            # COPY 적재 (카카오 ID 기준 중복은 건너뜀)
+            saved_count = sum(insert_restaurants(restaurants_to_load).values())
             self.stdout.write(f"  카카오 API: {saved_count}개 저장")
             return saved_count
             
@@ -1,9 +1,13 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
 from datetime import datetime, timedelta
-from local_data.models import Location, LocalIssue, SentimentAnalysis, SentimentSummary
+from local_data.models import Location, LocalIssue
+from local_data.db_writers import get_load_stats, record_sentiment_analyses, reset_load_stats, upsert_local_issues
 from local_data.optimized_crawler import AsyncCrawlerWrapper as LocalIssueCrawler
-from local_data.sentiment_analyzer import SimpleSentimentAnalyzer, update_sentiment_summary
+from local_data.sentiment_analyzer import get_sentiment_analyzer, build_sentiment_analysis
+from local_data.url_index import get_seen_url_index
+from rest_api.briefing_snapshot import publish_briefing_snapshots
 
 class Command(BaseCommand):
     help = '매일 자정 실행: 7일 이내 데이터 크롤링 및 감성 분석'
@@ -19,53 +23,66 @@ class Command(BaseCommand):
         deleted_count = LocalIssue.objects.filter(collected_at__lt=week_ago).delete()[0]
         self.stdout.write(f"7일 이전 데이터 {deleted_count}개 삭제")
         
-        crawler = LocalIssueCrawler(max_concurrent=5)
-        analyzer = SimpleSentimentAnalyzer()
+        reset_load_stats()
         
-        locations = Location.objects.all()
-        total_collected = 0
-        
-        for location in locations:
-            self.stdout.write(f"\n=== {location.gu} 크롤링 시작 ===")
+        # 구별 크롤링이 끝날 때까지 하나의 이벤트 루프/연결 풀 재사용
+        with LocalIssueCrawler(max_concurrent=5) as crawler:
+            analyzer = get_sentiment_analyzer()
+            url_index = get_seen_url_index()
             
-            # 크롤링 실행 (500개 목표)
-            results = crawler.crawl_single_district(location.gu, 500)
+            locations = Location.objects.all()
+            total_collected = 0
             
-            collected_count = 0
-            for result in results:
-                # 중복 체크 (URL 기준)
-                if not LocalIssue.objects.filter(url=result['url']).exists():
-                    issue = LocalIssue.objects.create(
+            for location in locations:
+                self.stdout.write(f"\n=== {location.gu} 크롤링 시작 ===")
+                
+                # 크롤링 실행 (500개 목표)
+                results = crawler.crawl_single_district(location.gu, 500)
+                
+                # 중복 체크 (정규화 URL 기준, 다른 구/이전 날짜에 저장된 URL 포함)
+                issues = [
+                    LocalIssue(
                         location=location,
                         source=result['source'],
                         title=result['title'],
                         url=result['url'],
+                        url_hash=result['url_hash'],
                         view_count=result['view_count'],
                         published_at=result['published_at']
                     )
+                    for result in url_index.filter_new(results)
+                ]
+                
+                with transaction.atomic():
+                    # 배치 UPSERT 후 새로 삽입된 이슈만 감성 분석
+                    created_issues = upsert_local_issues(issues)
+                    analyses_to_create = [
+                        build_sentiment_analysis(
+                            location, 'local_issue', issue.id, issue.title,
+                            analyzer.analyze_text(issue.title), analyzer
+                        )
+                        for issue in created_issues
+                    ]
                     
-                    # 즉시 감성 분석
-                    sentiment_result = analyzer.analyze_text(result['title'])
-                    
-                    SentimentAnalysis.objects.get_or_create(
-                        content_type='local_issue',
-                        content_id=issue.id,
-                        defaults={
-                            'location': location,
-                            'sentiment': sentiment_result['sentiment'],
-                            'confidence': sentiment_result['confidence'],
-                            'keywords': sentiment_result['keywords']
-                        }
-                    )
-                    
-                    collected_count += 1
+                    # 감성 분석 저장 + 오늘의 감성 요약 증분 갱신
+                    record_sentiment_analyses(analyses_to_create)
+                collected_count = len(created_issues)
+                
+                self.stdout.write(f"{location.gu}: {collected_count}개 수집 완료")
+                total_collected += collected_count
             
-            self.stdout.write(f"{location.gu}: {collected_count}개 수집 완료")
-            total_collected += collected_count
-            
-            # 오늘의 감성 요약 업데이트
-            today = timezone.now().date()
-            update_sentiment_summary(location, today)
+            url_index.save()
+        
+        # COPY 적재 속도
+        for table, stats in get_load_stats().items():
+            if stats['rows']:
+                self.stdout.write(
+                    f"DB 적재 {table}: {stats['rows']}행, {stats['seconds']:.2f}초 ({stats['rows_per_second']}행/초)"
+                )
+        
+        # 새 데이터 반영 - 브리핑 스냅샷 생성 후 캐시된 API 응답 무효화
+        snapshot_count = publish_briefing_snapshots()
+        self.stdout.write(f"브리핑 스냅샷 {snapshot_count}개 생성")
         
         self.stdout.write(
             self.style.SUCCESS(f"\n총 {total_collected}개 데이터 수집 및 분석 완료")
@@ -3,11 +3,12 @@ from django.utils import timezone
 from datetime import datetime, timedelta
 from local_data.models import Location, LocalIssue, SentimentAnalysis
 from local_data.optimized_crawler import AsyncCrawlerWrapper
-from local_data.sentiment_analyzer import SimpleSentimentAnalyzer
+from local_data.crawl_pipeline import run_crawl_pipeline
+from rest_api.briefing_snapshot import publish_briefing_snapshots
 from aws_services import AWSManager
 import time
 import asyncio
-from typing import List, Dict
+from typing import List
 
 class Command(BaseCommand):
     help = '최적화된 비동기 크롤링 및 분석'
@@ -15,7 +16,7 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument('--district', type=str, help='특정 구만 크롤링')
         parser.add_argument('--limit', type=int, default=50, help='구별 수집 개수')
-        parser.add_argument('--concurrent', type=int, default=15, help='동시 처리 개수')
+        parser.add_argument('--concurrent', type=int, default=15, help='전체 동시 요청 상한 (호스트별 동시 요청 수는 응답 상태에 따라 자동 조절)')
         parser.add_argument('--cleanup', action='store_true', help='7일 이전 데이터 삭제')
         parser.add_argument('--benchmark', action='store_true', help='성능 벤치마크 실행')
     
@@ -49,6 +50,10 @@ class Command(BaseCommand):
         aws_manager.cloudwatch.put_metric('OptimizedTotalIssuesCollected', total_collected)
         aws_manager.cloudwatch.put_metric('OptimizedCrawlDuration', duration, 'Seconds')
         
+        # 새 데이터 반영 - 브리핑 스냅샷 생성 후 캐시된 API 응답 무효화
+        snapshot_count = publish_briefing_snapshots()
+        self.stdout.write(f"브리핑 스냅샷 {snapshot_count}개 생성")
+        
         self.stdout.write(
             self.style.SUCCESS(
                 f"최적화된 크롤링 완료: {total_collected}개 수집, {duration:.1f}초 소요"
@@ -57,113 +62,43 @@ class Command(BaseCommand):
     
     def crawl_single_district_optimized(self, district: str, limit: int, concurrent: int) -> int:
         """최적화된 단일 구 크롤링"""
-        try:
-            location = Location.objects.get(gu=district)
-        except Location.DoesNotExist:
+        if not Location.objects.filter(gu=district).exists():
             self.stdout.write(self.style.ERROR(f"지역 '{district}' 없음"))
             return 0
         
-        crawler = AsyncCrawlerWrapper(max_concurrent=concurrent)
-        results = crawler.crawl_single_district(district, limit)
-        
-        return self.save_crawl_results({district: results})
+        return self.run_pipeline([district], limit, concurrent)
     
     def crawl_all_districts_optimized(self, limit: int, concurrent: int) -> int:
         """최적화된 전체 구 크롤링"""
         # 모든 구 목록 가져오기
         districts = list(Location.objects.values_list('gu', flat=True))
         
-        self.stdout.write(f"총 {len(districts)}개 구 병렬 크롤링 시작 (동시 처리: {concurrent})")
+        self.stdout.write(f"총 {len(districts)}개 구 병렬 크롤링 시작 (동시 요청 상한: {concurrent}, 호스트별 자동 조절)")
         
-        # 비동기 크롤링 실행
-        crawler = AsyncCrawlerWrapper(max_concurrent=concurrent)
-        all_results = crawler.crawl_all_districts(districts, limit)
-        
-        # 결과 저장
-        return self.save_crawl_results(all_results)
+        return self.run_pipeline(districts, limit, concurrent)
     
-    def save_crawl_results(self, district_results: Dict[str, List[Dict]]) -> int:
-        """크롤링 결과를 데이터베이스에 배치 저장"""
-        analyzer = SimpleSentimentAnalyzer()
-        total_saved = 0
-        
-        # 구별로 처리
-        for district_name, results in district_results.items():
-            try:
-                location = Location.objects.get(gu=district_name)
-            except Location.DoesNotExist:
-                continue
-            
-            if not results:
-                continue
-            
-            # 배치 처리를 위한 리스트
-            issues_to_create = []
-            analyses_to_create = []
-            
-            # 중복 URL 체크를 위한 기존 URL 세트
-            existing_urls = set(
-                LocalIssue.objects.filter(
-                    location=location,
-                    collected_at__date=timezone.now().date()
-                ).values_list('url', flat=True)
-            )
-            
-            for result in results:
-                # 중복 체크
-                if result['url'] in existing_urls:
-                    continue
-                
-                # LocalIssue 객체 준비
-                issue = LocalIssue(
-                    location=location,
-                    source=result['source'],
-                    title=result['title'],
-                    url=result['url'],
-                    view_count=result['view_count'],
-                    published_at=result['published_at'],
-                    collected_at=timezone.now()
-                )
-                issues_to_create.append(issue)
-                existing_urls.add(result['url'])  # 중복 방지
-            
-            # 배치 INSERT (ignore_conflicts=True로 중복 처리)
-            if issues_to_create:
-                created_issues = LocalIssue.objects.bulk_create(
-                    issues_to_create, 
-                    batch_size=200, 
-                    ignore_conflicts=True
+    def run_pipeline(self, districts: List[str], limit: int, concurrent: int) -> int:
+        """수집 -> 파싱 -> 중복 제거 -> 감성 분석 -> 배치 저장을 스트리밍으로 실행"""
+        with AsyncCrawlerWrapper(max_concurrent=concurrent) as crawler:
+            pipeline = run_crawl_pipeline(crawler.runtime, districts, limit)
+        
+        for district_name in districts:
+            if district_name in pipeline.saved:
+                self.stdout.write(f"  {district_name}: {pipeline.saved[district_name]}개 저장")
+        
+        stats = pipeline.stats
+        self.stdout.write(
+            f"파이프라인: 페이지 {stats['pages_fetched']}개 (실패 {stats['pages_failed']}), "
+            f"파싱 {stats['items_parsed']}건, 중복 {stats['duplicates']}건, "
+            f"저장 배치 {stats['write_batches']}회, {stats['duration']:.1f}초"
+        )
+        for table, load_stats in stats['copy_load'].items():
+            if load_stats['rows']:
+                self.stdout.write(
+                    f"  DB 적재 {table}: {load_stats['rows']}행, {load_stats['seconds']:.2f}초 "
+                    f"({load_stats['rows_per_second']}행/초)"
                 )
-                
-                # 실제 생성된 이슈들에 대해 감성 분석 준비
-                for issue in created_issues:
-                    if issue.id:  # 실제로 생성된 경우만
-                        sentiment_result = analyzer.analyze_text(issue.title)
-                        
-                        analysis = SentimentAnalysis(
-                            location=location,
-                            content_type='local_issue',
-                            content_id=issue.id,
-                            sentiment=sentiment_result['sentiment'],
-                            confidence=sentiment_result['confidence'],
-                            keywords=sentiment_result.get('keywords', [])
-                        )
-                        analyses_to_create.append(analysis)
-                
-                # 감성 분석 배치 INSERT
-                if analyses_to_create:
-                    SentimentAnalysis.objects.bulk_create(
-                        analyses_to_create, 
-                        batch_size=200, 
-                        ignore_conflicts=True
-                    )
-                
-                saved_count = len([issue for issue in created_issues if issue.id])
-                total_saved += saved_count
-                
-                self.stdout.write(f"  {district_name}: {saved_count}개 저장")
-        
-        return total_saved
+        return sum(pipeline.saved.values())
     
     def cleanup_old_data(self):
         """7일 이전 데이터 삭제"""
@@ -196,12 +131,12 @@ class Command(BaseCommand):
         start_time = time.time()
         
         from local_data.optimized_crawler import AsyncCrawlerWrapper
-        old_crawler = AsyncCrawlerWrapper(max_concurrent=1)  # 순차 처리 시뮬레이션
         old_results = {}
         
-        for district in test_districts:
-            district_results = old_crawler.crawl_single_district(district, limit)
-            old_results[district] = district_results
+        with AsyncCrawlerWrapper(max_concurrent=1) as old_crawler:  # 순차 처리 시뮬레이션
+            for district in test_districts:
+                district_results = old_crawler.crawl_single_district(district, limit)
+                old_results[district] = district_results
         
         old_duration = time.time() - start_time
         old_total = sum(len(results) for results in old_results.values())
@@ -210,8 +145,8 @@ class Command(BaseCommand):
         self.stdout.write("2. 비동기 병렬 처리 방식 테스트...")
         start_time = time.time()
         
-        crawler = AsyncCrawlerWrapper(max_concurrent=options['concurrent'])
-        new_results = crawler.crawl_all_districts(test_districts, limit)
+        with AsyncCrawlerWrapper(max_concurrent=options['concurrent']) as crawler:
+            new_results = crawler.crawl_all_districts(test_districts, limit)
         
         new_duration = time.time() - start_time
         new_total = sum(len(results) for results in new_results.values())
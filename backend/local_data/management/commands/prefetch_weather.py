@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from datetime import datetime
+from local_data.weather_cache import get_forecast_cache
+from local_data.weather_service import (
+    WeatherService, DISTRICT_GRID_COORDS, FORECAST_PUBLISH_DELAY, get_base_datetime
+)
+import time
+
+class Command(BaseCommand):
+    help = '단기예보 발표 직후 전체 구 격자 예보 미리 조회'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=8, help='동시 조회 수 (기본: 8)')
+    
+    def handle(self, *args, **options):
+        weather_service = WeatherService()
+        if not weather_service.api_key:
+            self.stdout.write(self.style.WARNING("API 키 없음 - 날씨 미리 조회 건너뜀"))
+            return
+        
+        # 방금 발표된 예보 기준 (사용자 요청보다 먼저 새 발표분으로 전환)
+        base_date, base_time = get_base_datetime(datetime.now(), FORECAST_PUBLISH_DELAY)
+        
+        # 여러 구가 같은 격자를 쓰므로 중복 없는 격자만 조회
+        cells = sorted({(coords['nx'], coords['ny']) for coords in DISTRICT_GRID_COORDS.values()})
+        
+        start_time = time.time()
+        results = get_forecast_cache().prefetch(
+            cells, base_date, base_time, weather_service._fetch_forecast_table,
+            workers=options['workers']
+        )
+        duration = time.time() - start_time
+        
+        failed = [cell for cell, ok in results.items() if not ok]
+        for nx, ny in failed:
+            self.stdout.write(self.style.WARNING(f"  격자 ({nx}, {ny}) 예보 조회 실패"))
+        
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{base_date} {base_time} 예보 미리 조회 완료: "
+                f"격자 {len(cells) - len(failed)}/{len(cells)}개, {duration:.1f}초 소요"
+            )
+        )
@@ -0,0 +1,159 @@
+import os
+from functools import reduce
+from operator import or_
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+from local_data.models import SentimentAnalysis, LexiconSnapshot
+from local_data.sentiment_analyzer import (
+    get_sentiment_analyzer, ensure_lexicon_snapshot, build_text_grams, term_grams,
+    get_content_texts, rebuild_sentiment_summaries, shutdown_analysis_pool
+)
+from rest_api.briefing_snapshot import publish_briefing_snapshots
+
+class Command(BaseCommand):
+    help = '감성 사전 변경분에 해당하는 분석 결과만 재분석'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--from-version', type=str, help='비교할 이전 사전 버전 (기본: 저장된 모든 이전 버전)')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                            help='감성 분석 워커 프로세스 수 (기본: CPU 코어 수)')
+        parser.add_argument('--dry-run', action='store_true', help='재분석 대상 개수만 출력')
+    
+    def handle(self, *args, **options):
+        # 배치마다 워커를 새로 띄우지 않도록 명령 실행 동안 하나의 분석 풀을 재사용하고 끝나면 종료
+        try:
+            self.reanalyze_versions(options)
+        finally:
+            shutdown_analysis_pool()
+    
+    def reanalyze_versions(self, options):
+        """이전 사전 버전별로 변경 용어가 포함된 분석만 재분석"""
+        analyzer = get_sentiment_analyzer()
+        ensure_lexicon_snapshot(analyzer)
+        current_version = analyzer.lexicon_version
+        current = LexiconSnapshot.objects.get(version=current_version)
+        
+        self.stdout.write(f"현재 사전 버전: {current_version}")
+        
+        if options['from_version']:
+            old_versions = [options['from_version']]
+        else:
+            old_versions = list(
+                SentimentAnalysis.objects.exclude(lexicon_version=current_version)
+                .values_list('lexicon_version', flat=True).distinct()
+            )
+        
+        affected_days = set()
+        for old_version in old_versions:
+            rows = SentimentAnalysis.objects.filter(lexicon_version=old_version)
+            
+            if not old_version:
+                self.stdout.write(self.style.WARNING(
+                    f"사전 버전 없는 분석 {rows.count()}건 - 비교 불가, 전체 재분석 필요 (analyze_sentiment)"
+                ))
+                continue
+            
+            try:
+                previous = LexiconSnapshot.objects.get(version=old_version)
+            except LexiconSnapshot.DoesNotExist:
+                self.stdout.write(self.style.WARNING(f"{old_version}: 사전 스냅샷 없음 - 건너뜀"))
+                continue
+            
+            changed_terms = self.diff_lexicons(previous, current)
+            if changed_terms is None:
+                # 분석기 버전이나 불용어가 바뀌면 형태소 키워드가 달라지므로 전체 재분석
+                candidate_ids = list(rows.values_list('id', flat=True))
+                self.stdout.write(f"{old_version}: 분석기/불용어 변경 - 전체 {len(candidate_ids)}건 재분석")
+            else:
+                candidate_ids = self.find_candidates(rows, changed_terms)
+                self.stdout.write(
+                    f"{old_version}: 변경 용어 {len(changed_terms)}개, 재분석 대상 {len(candidate_ids)}건"
+                )
+            
+            if options['dry_run']:
+                continue
+            
+            # 변경 용어가 없는 분석은 점수가 같으므로 버전만 갱신
+            unchanged = rows.exclude(id__in=candidate_ids).update(lexicon_version=current_version)
+            self.stdout.write(f"  버전만 갱신: {unchanged}건")
+            
+            updated, days = self.reanalyze(candidate_ids, analyzer, options['workers'])
+            affected_days |= days
+            self.stdout.write(f"  재분석 완료: {updated}건 (결과 변경 {len(days)}개 지역/일)")
+        
+        # 결과가 바뀐 지역/날짜의 요약만 다시 계산
+        if affected_days:
+            rebuild_sentiment_summaries(
+                {location for location, _ in affected_days},
+                {target_date for _, target_date in affected_days}
+            )
+            publish_briefing_snapshots()
+        
+        self.stdout.write(self.style.SUCCESS("사전 변경분 재분석 완료"))
+    
+    def diff_lexicons(self, previous, current):
+        """추가/삭제/극성 변경된 용어 목록 (비교 불가하면 None)"""
+        previous_model = previous.version.split('-')[0]
+        current_model = current.version.split('-')[0]
+        if previous_model != current_model or set(previous.stopwords) != set(current.stopwords):
+            return None
+        
+        changed = set()
+        for field in ('positive_words', 'negative_words', 'neutral_words'):
+            changed |= set(getattr(previous, field)) ^ set(getattr(current, field))
+        return sorted(changed)
+    
+    def find_candidates(self, rows, terms, chunk_size=50):
+        """용어 색인(text_grams)으로 변경 용어를 포함한 분석 ID 조회"""
+        candidate_ids = set()
+        for i in range(0, len(terms), chunk_size):
+            chunk = terms[i:i + chunk_size]
+            condition = reduce(or_, [Q(text_grams__contains=term_grams(term)) for term in chunk])
+            candidate_ids.update(rows.filter(condition).values_list('id', flat=True))
+        return sorted(candidate_ids)
+    
+    def reanalyze(self, analysis_ids, analyzer, workers, batch_size=1000):
+        """분석 결과 재계산 후 일괄 업데이트"""
+        updated = 0
+        affected_days = set()
+        
+        for i in range(0, len(analysis_ids), batch_size):
+            batch = list(
+                SentimentAnalysis.objects.filter(id__in=analysis_ids[i:i + batch_size])
+                .select_related('location')
+            )
+            
+            # 콘텐츠 타입별 원본 텍스트 일괄 조회
+            texts = {}
+            for content_type in {analysis.content_type for analysis in batch}:
+                ids = [a.content_id for a in batch if a.content_type == content_type]
+                for content_id, text in get_content_texts(content_type, ids).items():
+                    texts[(content_type, content_id)] = text
+            
+            batch = [a for a in batch if (a.content_type, a.content_id) in texts]
+            results = analyzer.analyze_many(
+                [texts[(a.content_type, a.content_id)] for a in batch],
+                workers=workers
+            )
+            
+            for analysis, result in zip(batch, results):
+                if (analysis.sentiment != result['sentiment']
+                        or set(analysis.keywords) != set(result['keywords'])):
+                    affected_days.add((analysis.location, timezone.localdate(analysis.analyzed_at)))
+                analysis.sentiment = result['sentiment']
+                analysis.confidence = result['confidence']
+                analysis.keywords = result['keywords']
+                analysis.lexicon_version = analyzer.lexicon_version
+                analysis.text_grams = build_text_grams(
+                    texts[(analysis.content_type, analysis.content_id)], result.get('tokens', [])
+                )
+            
+            SentimentAnalysis.objects.bulk_update(
+                batch,
+                ['sentiment', 'confidence', 'keywords', 'lexicon_version', 'text_grams'],
+                batch_size=500
+            )
+            updated += len(batch)
+        
+        return updated, affected_days
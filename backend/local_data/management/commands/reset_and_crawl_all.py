@@ -1,6 +1,10 @@
 from django.core.management.base import BaseCommand
 from local_data.models import Location, LocalIssue, RestaurantInfo, SentimentAnalysis, SentimentSummary
 from local_data.optimized_crawler import AsyncCrawlerWrapper as LocalIssueCrawler
+from local_data.db_writers import upsert_local_issues
+from local_data.url_index import get_seen_url_index
+from local_data.data_version import bump_data_version
+from rest_api.briefing_snapshot import publish_briefing_snapshots
 from django.utils import timezone
 import time
 
@@ -15,6 +19,8 @@ class Command(BaseCommand):
         RestaurantInfo.objects.all().delete()
         SentimentAnalysis.objects.all().delete()
         SentimentSummary.objects.all().delete()
+        get_seen_url_index().clear()
+        bump_data_version()
         
         self.stdout.write(self.style.SUCCESS('DB 초기화 완료'))
         
@@ -33,23 +39,20 @@ class Command(BaseCommand):
             if created:
                 self.stdout.write(f'{district} 생성')
         
-        # 4. 각 구별 크롤링 실행
-        crawler = LocalIssueCrawler(max_concurrent=5)
-        
-        for district in districts:
-            self.stdout.write(f'\n=== {district} 크롤링 시작 ===')
-            
-            try:
-                location = Location.objects.get(gu=district)
+        # 4. 각 구별 크롤링 실행 (하나의 이벤트 루프/연결 풀 재사용)
+        with LocalIssueCrawler(max_concurrent=5) as crawler:
+            for district in districts:
+                self.stdout.write(f'\n=== {district} 크롤링 시작 ===')
                 
-                # 크롤링 실행 (각 구당 50개)
-                results = crawler.crawl_single_district(district, 50)
-                
-                # DB 저장
-                saved_count = 0
-                for result in results:
-                    try:
-                        LocalIssue.objects.create(
+                try:
+                    location = Location.objects.get(gu=district)
+                    
+                    # 크롤링 실행 (각 구당 50개)
+                    results = crawler.crawl_single_district(district, 50)
+                    
+                    # DB 저장 (배치 UPSERT, 중복 URL은 조회수/제목만 갱신)
+                    saved_count = len(upsert_local_issues([
+                        LocalIssue(
                             location=location,
                             source=result['source'],
                             title=result['title'],
@@ -58,21 +61,20 @@ class Command(BaseCommand):
                             published_at=result.get('published_at') or timezone.now(),
                             collected_at=timezone.now()
                         )
-                        saved_count += 1
-                    except Exception as e:
-                        continue
-                
-                self.stdout.write(
-                    self.style.SUCCESS(f'{district}: {saved_count}개 저장 완료')
-                )
-                
-                # 과부하 방지를 위한 대기
-                time.sleep(2)
-                
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'{district} 크롤링 실패: {str(e)}')
-                )
+                        for result in results
+                    ]))
+                    
+                    self.stdout.write(
+                        self.style.SUCCESS(f'{district}: {saved_count}개 저장 완료')
+                    )
+                    
+                    # 과부하 방지를 위한 대기
+                    time.sleep(2)
+                    
+                except Exception as e:
+                    self.stdout.write(
+                        self.style.ERROR(f'{district} 크롤링 실패: {str(e)}')
+                    )
         
         self.stdout.write('\n=== 전체 크롤링 완료 ===')
         
@@ -83,4 +85,8 @@ class Command(BaseCommand):
             call_command('crawl_all_restaurants')
             self.stdout.write(self.style.SUCCESS('음식점 데이터 크롤링 완료'))
         except Exception as e:
-            self.stdout.write(self.style.ERROR(f'음식점 크롤링 실패: {str(e)}'))
\ No newline at end of file
+            self.stdout.write(self.style.ERROR(f'음식점 크롤링 실패: {str(e)}'))
+        
+        # 6. 새 데이터 반영 - 브리핑 스냅샷 생성 후 캐시된 API 응답 무효화
+        snapshot_count = publish_briefing_snapshots()
+        self.stdout.write(f'브리핑 스냅샷 {snapshot_count}개 생성')
\ No newline at end of file
@@ -2,7 +2,10 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 from local_data.models import Location, LocalIssue, RestaurantInfo, SentimentAnalysis, SentimentSummary
 from local_data.optimized_crawler import AsyncCrawlerWrapper as LocalIssueCrawler
-from local_data.sentiment_analyzer import SimpleSentimentAnalyzer
+from local_data.db_writers import record_sentiment_analyses, upsert_local_issues
+from local_data.sentiment_analyzer import get_sentiment_analyzer, build_sentiment_analysis
+from local_data.url_index import get_seen_url_index
+from rest_api.briefing_snapshot import publish_briefing_snapshots
 from django.utils import timezone
 import time
 
@@ -40,6 +43,9 @@ class Command(BaseCommand):
         # 5. 감성 분석 실행
         self.analyze_sentiments()
         
+        # 6. 브리핑 스냅샷 생성 및 캐시된 API 응답 무효화
+        publish_briefing_snapshots()
+        
         self.stdout.write(
             self.style.SUCCESS('=== AWS RDS 초기화 및 크롤링 완료 ===')
         )
@@ -62,6 +68,7 @@ class Command(BaseCommand):
                 f'음식점 {deleted_restaurants}개, 지역 {deleted_locations}개'
             )
         
+        get_seen_url_index().clear()
         self.stdout.write(self.style.SUCCESS('✅ 모든 데이터 삭제 완료'))
 
     def setup_locations(self):
@@ -90,71 +97,58 @@ class Command(BaseCommand):
         """전체 구 크롤링 실행"""
         self.stdout.write(f'🕷️  전체 구 크롤링 시작 (구별 {limit}개)')
         
-        crawler = LocalIssueCrawler(max_concurrent=5)
-        locations = Location.objects.all()
-        total_collected = 0
-        
-        for location in locations:
-            self.stdout.write(f'처리 중: {location.gu}')
+        # 구별 크롤링이 끝날 때까지 하나의 이벤트 루프/연결 풀 재사용
+        with LocalIssueCrawler(max_concurrent=5) as crawler:
+            locations = Location.objects.all()
+            total_collected = 0
             
-            try:
-                # 크롤링 실행 (더 많은 쿼리로 시도)
-                results = []
-                
-                # 크롤링 실행
-                results = crawler.crawl_single_district(location.gu, limit)
-                
-                # 중복 제거
-                seen_urls = set()
-                unique_results = []
-                for result in results:
-                    if result['url'] not in seen_urls:
-                        seen_urls.add(result['url'])
-                        unique_results.append(result)
+            for location in locations:
+                self.stdout.write(f'처리 중: {location.gu}')
                 
-                results = unique_results[:limit]
-                
-                # 배치 저장
-                issues_to_create = []
-                for result in results:
-                    # 중복 체크
-                    if LocalIssue.objects.filter(url=result['url']).exists():
-                        continue
+                try:
+                    # 크롤링 실행 (더 많은 쿼리로 시도)
+                    results = []
                     
-                    issues_to_create.append(LocalIssue(
-                        location=location,
-                        source=result['source'],
-                        title=result['title'],
-                        url=result['url'],
-                        view_count=result['view_count'],
-                        published_at=result.get('published_at') or timezone.now(),
-                        collected_at=timezone.now()
-                    ))
-                
-                # 배치 INSERT
-                if issues_to_create:
-                    LocalIssue.objects.bulk_create(
-                        issues_to_create, 
-                        batch_size=100, 
-                        ignore_conflicts=True
-                    )
-                    saved_count = len(issues_to_create)
-                    total_collected += saved_count
+                    # 크롤링 실행
+                    results = crawler.crawl_single_district(location.gu, limit)
+                    
+                    # 중복 제거 (정규화 URL 기준, 이미 저장된 URL 포함)
+                    results = get_seen_url_index().filter_new(results)[:limit]
                     
+                    # 배치 저장
+                    issues_to_create = []
+                    for result in results:
+                        issues_to_create.append(LocalIssue(
+                            location=location,
+                            source=result['source'],
+                            title=result['title'],
+                            url=result['url'],
+                            url_hash=result['url_hash'],
+                            view_count=result['view_count'],
+                            published_at=result.get('published_at') or timezone.now(),
+                            collected_at=timezone.now()
+                        ))
+                    
+                    # 배치 UPSERT (url_hash 충돌 시 갱신)
+                    if issues_to_create:
+                        saved_count = len(upsert_local_issues(issues_to_create))
+                        total_collected += saved_count
+                        
+                        self.stdout.write(
+                            self.style.SUCCESS(f'  ✅ {location.gu}: {saved_count}개 저장')
+                        )
+                    else:
+                        self.stdout.write(f'  ⚠️  {location.gu}: 새로운 데이터 없음')
+                    
+                    # 서버 부하 방지
+                    time.sleep(1)
+                    
+                except Exception as e:
                     self.stdout.write(
-                        self.style.SUCCESS(f'  ✅ {location.gu}: {saved_count}개 저장')
+                        self.style.ERROR(f'  ❌ {location.gu} 크롤링 실패: {str(e)}')
                     )
-                else:
-                    self.stdout.write(f'  ⚠️  {location.gu}: 새로운 데이터 없음')
-                
-                # 서버 부하 방지
-                time.sleep(1)
-                
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f'  ❌ {location.gu} 크롤링 실패: {str(e)}')
-                )
         
+        get_seen_url_index().save()
         self.stdout.write(
             self.style.SUCCESS(f'✅ 전체 크롤링 완료: 총 {total_collected}개 수집')
         )
@@ -189,28 +183,21 @@ class Command(BaseCommand):
             self.stdout.write('분석할 새로운 이슈가 없습니다.')
             return
         
-        analyzer = SimpleSentimentAnalyzer()
+        analyzer = get_sentiment_analyzer()
         analyses_to_create = []
         
         for issue in issues:
             try:
                 result = analyzer.analyze_text(issue.title)
                 
-                analyses_to_create.append(SentimentAnalysis(
-                    location=issue.location,
-                    content_type='local_issue',
-                    content_id=issue.id,
-                    sentiment=result['sentiment'],
-                    confidence=result['confidence'],
-                    keywords=result.get('keywords', [])
+                analyses_to_create.append(build_sentiment_analysis(
+                    issue.location, 'local_issue', issue.id, issue.title,
+                    result, analyzer
                 ))
                 
                 # 배치 크기 제한
                 if len(analyses_to_create) >= 100:
-                    SentimentAnalysis.objects.bulk_create(
-                        analyses_to_create, 
-                        ignore_conflicts=True
-                    )
+                    record_sentiment_analyses(analyses_to_create)
                     analyses_to_create = []
                     
             except Exception as e:
@@ -218,10 +205,7 @@ class Command(BaseCommand):
         
         # 남은 데이터 저장
         if analyses_to_create:
-            SentimentAnalysis.objects.bulk_create(
-                analyses_to_create, 
-                ignore_conflicts=True
-            )
+            record_sentiment_analyses(analyses_to_create)
         
         analyzed_count = SentimentAnalysis.objects.count()
         self.stdout.write(
@@ -3,7 +3,10 @@ from django.db import transaction, connection
 from django.db.utils import OperationalError
 from local_data.models import Location, LocalIssue, RestaurantInfo, SentimentAnalysis, SentimentSummary
 from local_data.simple_crawler import LocalIssueCrawler
-from local_data.sentiment_analyzer import SimpleSentimentAnalyzer
+from local_data.db_writers import upsert_local_issues
+from local_data.url_index import get_seen_url_index
+from local_data.data_version import bump_data_version
+from rest_api.briefing_snapshot import publish_briefing_snapshots
 from django.utils import timezone
 import time
 
@@ -35,6 +38,10 @@ class Command(BaseCommand):
             # 3. 크롤링 실행
             self.crawl_with_retry(options['limit'], options['retry'])
             
+            # 4. 새 데이터 반영 - 브리핑 스냅샷 생성 후 캐시된 API 응답 무효화
+            snapshot_count = publish_briefing_snapshots()
+            self.stdout.write(f'브리핑 스냅샷 {snapshot_count}개 생성')
+            
             self.stdout.write(
                 self.style.SUCCESS('=== 모든 작업 완료 ===')
             )
@@ -69,6 +76,8 @@ class Command(BaseCommand):
                         f'요약 {deleted_summary}개, 이슈 {deleted_issues}개, '
                         f'음식점 {deleted_restaurants}개, 지역 {deleted_locations}개'
                     )
+                get_seen_url_index().clear()
+                bump_data_version()
                 
                 return True
                 
@@ -151,15 +160,8 @@ class Command(BaseCommand):
                         news_data = crawler.crawl_naver_news_fast(query, 4)
                         results.extend(news_data)
                     
-                    # 중복 제거
-                    seen_urls = set()
-                    unique_results = []
-                    for result in results:
-                        if result['url'] not in seen_urls and result['url']:
-                            seen_urls.add(result['url'])
-                            unique_results.append(result)
-                    
-                    results = unique_results[:limit]
+                    # 중복 제거 (정규화 URL 기준, 이미 저장된 URL 포함)
+                    results = get_seen_url_index().filter_new(results)[:limit]
                     
                     # 데이터베이스 저장
                     if results:
@@ -175,14 +177,8 @@ class Command(BaseCommand):
                                 collected_at=timezone.now()
                             ))
                         
-                        # 배치 저장
-                        LocalIssue.objects.bulk_create(
-                            issues_to_create, 
-                            batch_size=50, 
-                            ignore_conflicts=True
-                        )
-                        
-                        saved_count = len(issues_to_create)
+                        # 배치 UPSERT (url_hash 충돌 시 갱신)
+                        saved_count = len(upsert_local_issues(issues_to_create))
                         total_collected += saved_count
                         
                         self.stdout.write(
@@ -30,6 +30,8 @@ class Command(BaseCommand):
             try:
                 call_command('makemigrations')
                 call_command('migrate')
+                # DatabaseCache 사용 시 캐시 테이블 생성 (이미 있으면 건너뜀)
+                call_command('createcachetable')
                 self.stdout.write(self.style.SUCCESS("✓ 마이그레이션 완료"))
             except Exception as e:
                 self.stdout.write(self.style.ERROR(f"✗ 마이그레이션 실패: {str(e)}"))
@@ -0,0 +1,27 @@
+"""
+요청 단위 페이로드 디버그 로깅 미들웨어
+"""
+from django.conf import settings
+from .log_utils import payload_debug
+
+
+class PayloadDebugMiddleware:
+    """X-Debug-Payload 헤더가 설정 토큰과 일치하는 요청만 페이로드 로깅 활성화
+    
+    DEBUG 모드에서는 토큰 없이 헤더 값 '1'로도 활성화된다.
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.token = getattr(settings, 'PAYLOAD_DEBUG_TOKEN', None)
+    
+    def __call__(self, request):
+        value = request.headers.get('X-Debug-Payload')
+        enabled = bool(value) and (
+            (self.token and value == self.token) or (settings.DEBUG and value == '1')
+        )
+        if not enabled:
+            return self.get_response(request)
+        
+        with payload_debug():
+            return self.get_response(request)
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.24 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('local_data', '0003_remove_localissue_local_issue_sentime_13cd4a_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SentimentCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('text_hash', models.CharField(max_length=64, unique=True, verbose_name='텍스트 해시')),
+                ('lexicon_version', models.CharField(max_length=32, verbose_name='사전 버전')),
+                ('sentiment', models.CharField(choices=[('positive', '긍정'), ('negative', '부정'), ('neutral', '중립')], max_length=10, verbose_name='감성')),
+                ('confidence', models.FloatField(verbose_name='신뢰도')),
+                ('keywords', models.JSONField(default=list, verbose_name='추출 키워드')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+            ],
+            options={
+                'verbose_name': '감성 분석 캐시',
+                'verbose_name_plural': '감성 분석 캐시들',
+                'db_table': 'sentiment_cache',
+                'indexes': [models.Index(fields=['lexicon_version'], name='sentiment_c_lexicon_b100dd_idx')],
+            },
+        ),
+    ]
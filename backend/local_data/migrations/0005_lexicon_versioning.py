@@ -0,0 +1,55 @@
+# Generated by Django 4.2.24 on 2026-10-18 11:00
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('local_data', '0004_sentimentcacheentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LexiconSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.CharField(max_length=32, unique=True, verbose_name='사전 버전')),
+                ('positive_words', models.JSONField(default=list, verbose_name='긍정어')),
+                ('negative_words', models.JSONField(default=list, verbose_name='부정어')),
+                ('neutral_words', models.JSONField(default=list, verbose_name='중립어')),
+                ('stopwords', models.JSONField(default=list, verbose_name='불용어')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+            ],
+            options={
+                'verbose_name': '감성 사전 스냅샷',
+                'verbose_name_plural': '감성 사전 스냅샷들',
+                'db_table': 'lexicon_snapshots',
+            },
+        ),
+        migrations.AddField(
+            model_name='sentimentanalysis',
+            name='lexicon_version',
+            field=models.CharField(blank=True, default='', max_length=32, verbose_name='사전 버전'),
+        ),
+        migrations.AddField(
+            model_name='sentimentanalysis',
+            name='text_grams',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=2), blank=True, default=list, size=None, verbose_name='용어 색인'),
+        ),
+        migrations.AddField(
+            model_name='sentimentcacheentry',
+            name='tokens',
+            field=models.JSONField(default=list, verbose_name='형태소 키워드'),
+        ),
+        migrations.AddIndex(
+            model_name='sentimentanalysis',
+            index=models.Index(fields=['lexicon_version'], name='sentiment_a_lexicon_b9872f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sentimentanalysis',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['text_grams'], name='sentiment_a_text_gr_606dc6_gin'),
+        ),
+    ]
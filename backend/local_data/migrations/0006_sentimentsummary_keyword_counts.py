@@ -0,0 +1,18 @@
+# Generated by Django 4.2.24 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('local_data', '0005_lexicon_versioning'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sentimentsummary',
+            name='keyword_counts',
+            field=models.JSONField(default=dict, verbose_name='키워드 빈도'),
+        ),
+    ]
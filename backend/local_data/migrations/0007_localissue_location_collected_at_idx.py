@@ -0,0 +1,17 @@
+# Generated by Django 4.2.24 on 2026-10-18 13:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('local_data', '0006_sentimentsummary_keyword_counts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='localissue',
+            index=models.Index(fields=['location', 'collected_at'], name='local_issue_locatio_491a36_idx'),
+        ),
+    ]
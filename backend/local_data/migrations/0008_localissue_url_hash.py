@@ -0,0 +1,102 @@
+# Generated by Django 4.2.24 on 2026-10-18 15:00
+
+import hashlib
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from django.db import migrations, models
+
+
+# 마이그레이션 시점의 URL 정규화/해시 로직 사본 (이후 local_data.url_index가 바뀌어도 결과가 달라지지 않도록)
+TRACKING_PARAMS = {'fbclid', 'gclid', 'igshid', 'ref_src', 'spm'}
+_NAVER_ARTICLE_PATH = re.compile(r'^/(?:mnews/)?article/(\d+)/(\d+)')
+
+
+def _strip_host_prefix(host):
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            return host[len(prefix):]
+    return host
+
+
+def _youtube_video_id(host, path, query):
+    if host == 'youtu.be':
+        return path.strip('/') or None
+    if path == '/watch':
+        return dict(query).get('v')
+    for prefix in ('/shorts/', '/live/', '/embed/'):
+        if path.startswith(prefix):
+            return path[len(prefix):].split('/')[0] or None
+    return None
+
+
+def canonicalize_url(url):
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    
+    scheme = (parts.scheme or 'https').lower()
+    host = (parts.hostname or '').lower()
+    netloc = host if port in (None, 80, 443) else f"{host}:{port}"
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    ]
+    
+    bare_host = _strip_host_prefix(host)
+    if bare_host in ('youtube.com', 'youtu.be'):
+        video_id = _youtube_video_id(bare_host, path, query)
+        if video_id:
+            return f"https://www.youtube.com/watch?v={video_id}"
+    
+    if bare_host.endswith('news.naver.com'):
+        article = _NAVER_ARTICLE_PATH.match(path)
+        params = dict(query)
+        if article:
+            return f"https://n.news.naver.com/article/{article.group(1)}/{article.group(2)}"
+        if params.get('oid') and params.get('aid'):
+            return f"https://n.news.naver.com/article/{params['oid']}/{params['aid']}"
+    
+    return urlunsplit((scheme, netloc, path, urlencode(sorted(query)), ''))
+
+
+def url_hash(url):
+    parts = urlsplit(canonicalize_url(url))
+    key = _strip_host_prefix(parts.netloc) + urlunsplit(('', '', parts.path, parts.query, ''))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def fill_url_hashes(apps, schema_editor):
+    # 기존 이슈의 정규화 URL 해시 채우기
+    LocalIssue = apps.get_model('local_data', 'LocalIssue')
+    batch = []
+    for issue in LocalIssue.objects.filter(url_hash__isnull=True).only('id', 'url').iterator(chunk_size=2000):
+        issue.url_hash = url_hash(issue.url)
+        batch.append(issue)
+        if len(batch) >= 2000:
+            LocalIssue.objects.bulk_update(batch, ['url_hash'])
+            batch = []
+    if batch:
+        LocalIssue.objects.bulk_update(batch, ['url_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('local_data', '0007_localissue_location_collected_at_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='localissue',
+            name='url_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=40, null=True, verbose_name='URL 해시'),
+        ),
+        migrations.RunPython(fill_url_hashes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,167 @@
+# Generated by Django 4.2.24 on 2026-10-18 16:00
+
+import hashlib
+import re
+from collections import Counter
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+
+# 마이그레이션 시점의 URL 정규화/해시 로직 사본 (이후 local_data.url_index가 바뀌어도 결과가 달라지지 않도록)
+TRACKING_PARAMS = {'fbclid', 'gclid', 'igshid', 'ref_src', 'spm'}
+_NAVER_ARTICLE_PATH = re.compile(r'^/(?:mnews/)?article/(\d+)/(\d+)')
+
+
+def _strip_host_prefix(host):
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            return host[len(prefix):]
+    return host
+
+
+def _youtube_video_id(host, path, query):
+    if host == 'youtu.be':
+        return path.strip('/') or None
+    if path == '/watch':
+        return dict(query).get('v')
+    for prefix in ('/shorts/', '/live/', '/embed/'):
+        if path.startswith(prefix):
+            return path[len(prefix):].split('/')[0] or None
+    return None
+
+
+def canonicalize_url(url):
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    
+    scheme = (parts.scheme or 'https').lower()
+    host = (parts.hostname or '').lower()
+    netloc = host if port in (None, 80, 443) else f"{host}:{port}"
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    ]
+    
+    bare_host = _strip_host_prefix(host)
+    if bare_host in ('youtube.com', 'youtu.be'):
+        video_id = _youtube_video_id(bare_host, path, query)
+        if video_id:
+            return f"https://www.youtube.com/watch?v={video_id}"
+    
+    if bare_host.endswith('news.naver.com'):
+        article = _NAVER_ARTICLE_PATH.match(path)
+        params = dict(query)
+        if article:
+            return f"https://n.news.naver.com/article/{article.group(1)}/{article.group(2)}"
+        if params.get('oid') and params.get('aid'):
+            return f"https://n.news.naver.com/article/{params['oid']}/{params['aid']}"
+    
+    return urlunsplit((scheme, netloc, path, urlencode(sorted(query)), ''))
+
+
+def url_hash(url):
+    parts = urlsplit(canonicalize_url(url))
+    key = _strip_host_prefix(parts.netloc) + urlunsplit(('', '', parts.path, parts.query, ''))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+def rebuild_summaries(apps, keys):
+    # 지운 분석이 속한 (지역, 날짜) 요약을 남은 분석 기준으로 다시 계산 (rebuild_sentiment_summaries와 같은 집계)
+    SentimentAnalysis = apps.get_model('local_data', 'SentimentAnalysis')
+    SentimentSummary = apps.get_model('local_data', 'SentimentSummary')
+    
+    for location_id, day in sorted(keys):
+        analyses = (
+            SentimentAnalysis.objects.filter(location_id=location_id)
+            .annotate(day=TruncDate('analyzed_at')).filter(day=day)
+        )
+        counts = {
+            row['sentiment']: row['count']
+            for row in analyses.values('sentiment').annotate(count=Count('id')).order_by()
+        }
+        keyword_counts = {'positive': Counter(), 'negative': Counter()}
+        for sentiment, keywords in analyses.filter(
+            sentiment__in=['positive', 'negative']
+        ).values_list('sentiment', 'keywords').iterator(chunk_size=2000):
+            keyword_counts[sentiment].update(keywords or [])
+        
+        positive_count = counts.get('positive', 0)
+        negative_count = counts.get('negative', 0)
+        neutral_count = counts.get('neutral', 0)
+        total = positive_count + negative_count + neutral_count
+        SentimentSummary.objects.filter(location_id=location_id, date=day).update(
+            positive_count=positive_count,
+            negative_count=negative_count,
+            neutral_count=neutral_count,
+            sentiment_score=(positive_count - negative_count) / total if total else 0.0,
+            top_keywords={
+                sentiment: [word for word, count in counter.most_common(5)]
+                for sentiment, counter in keyword_counts.items()
+            },
+            keyword_counts={sentiment: dict(counter) for sentiment, counter in keyword_counts.items()}
+        )
+
+
+def remove_duplicate_issues(apps, schema_editor):
+    # 정규화 URL이 같은 이슈는 가장 먼저 저장된 행만 남기고, 지운 이슈의 감성 분석도 함께 삭제한 뒤
+    # 해당 (지역, 날짜) 감성 요약을 다시 계산
+    LocalIssue = apps.get_model('local_data', 'LocalIssue')
+    SentimentAnalysis = apps.get_model('local_data', 'SentimentAnalysis')
+    
+    # 0008 이후 해시 없이 저장된 행 채우기
+    batch = []
+    for issue in LocalIssue.objects.filter(url_hash__isnull=True).only('id', 'url').iterator(chunk_size=2000):
+        issue.url_hash = url_hash(issue.url)
+        batch.append(issue)
+        if len(batch) >= 2000:
+            LocalIssue.objects.bulk_update(batch, ['url_hash'])
+            batch = []
+    if batch:
+        LocalIssue.objects.bulk_update(batch, ['url_hash'])
+    
+    duplicated_hashes = (
+        LocalIssue.objects.values('url_hash').annotate(total=Count('id')).filter(total__gt=1).values('url_hash')
+    )
+    rows = (
+        LocalIssue.objects.filter(url_hash__in=duplicated_hashes)
+        .order_by('url_hash', 'id').values_list('id', 'url_hash')
+    )
+    stale_ids = []
+    previous_hash = None
+    for issue_id, digest in rows.iterator(chunk_size=2000):
+        if digest == previous_hash:
+            stale_ids.append(issue_id)
+        previous_hash = digest
+    
+    affected_summaries = set()
+    for i in range(0, len(stale_ids), 2000):
+        chunk = stale_ids[i:i + 2000]
+        stale_analyses = SentimentAnalysis.objects.filter(content_type='local_issue', content_id__in=chunk)
+        for location_id, analyzed_at in stale_analyses.values_list('location_id', 'analyzed_at'):
+            affected_summaries.add((location_id, timezone.localdate(analyzed_at)))
+        stale_analyses.delete()
+        LocalIssue.objects.filter(id__in=chunk).delete()
+    
+    rebuild_summaries(apps, affected_summaries)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('local_data', '0008_localissue_url_hash'),
+    ]
+    
+    operations = [
+        migrations.RunPython(remove_duplicate_issues, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.24 on 2026-10-18 16:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('local_data', '0009_remove_duplicate_localissues'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='localissue',
+            name='url_hash',
+            field=models.CharField(max_length=40, unique=True, verbose_name='URL 해시'),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 
 class Location(models.Model):
     gu = models.CharField(max_length=50, verbose_name="구")
@@ -13,6 +15,14 @@ class Location(models.Model):
     def __str__(self):
         return f"{self.gu}"
 
+class LocalIssueQuerySet(models.QuerySet):
+    def bulk_create(self, objs, *args, **kwargs):
+        # bulk_create는 save()를 거치지 않으므로 여기서 URL 해시를 채움
+        objs = list(objs)
+        for obj in objs:
+            obj.fill_url_hash()
+        return super().bulk_create(objs, *args, **kwargs)
+
 class LocalIssue(models.Model):
     SOURCE_CHOICES = [
         ('youtube', '유튜브'),
@@ -26,6 +36,7 @@ class LocalIssue(models.Model):
     source = models.CharField(max_length=20, choices=SOURCE_CHOICES, verbose_name="출처")
     title = models.TextField(verbose_name="제목")
     url = models.CharField(max_length=200, verbose_name="원본 URL")
+    url_hash = models.CharField(max_length=40, unique=True, verbose_name="URL 해시")
     view_count = models.IntegerField(default=0, verbose_name="조회수")
     published_at = models.DateTimeField(null=True, blank=True, verbose_name="게시일시")
     collected_at = models.DateTimeField(auto_now_add=True, verbose_name="수집일시")
@@ -34,11 +45,24 @@ class LocalIssue(models.Model):
         db_table = 'local_issues'
         indexes = [
             models.Index(fields=['location', 'source', 'collected_at']),
+            models.Index(fields=['location', 'collected_at']),
             models.Index(fields=['view_count']),
         ]
         verbose_name = "동네 이슈"
         verbose_name_plural = "동네 이슈들"
     
+    objects = LocalIssueQuerySet.as_manager()
+    
+    def fill_url_hash(self):
+        """정규화 URL 기준 중복 판정용 해시 계산 (이미 있으면 유지, 빈 URL도 해시해 NULL이 남지 않게 함)"""
+        if not self.url_hash:
+            from .url_index import url_hash
+            self.url_hash = url_hash(self.url or '')
+    
+    def save(self, *args, **kwargs):
+        self.fill_url_hash()
+        super().save(*args, **kwargs)
+    
     def __str__(self):
         return f"{self.location} - {self.title[:50]}"
 
@@ -145,6 +169,8 @@ class SentimentAnalysis(models.Model):
     sentiment = models.CharField(max_length=10, choices=SENTIMENT_CHOICES, verbose_name="감성")
     confidence = models.FloatField(verbose_name="신뢰도")
     keywords = models.JSONField(default=list, verbose_name="추출 키워드")
+    lexicon_version = models.CharField(max_length=32, blank=True, default='', verbose_name="사전 버전")
+    text_grams = ArrayField(models.CharField(max_length=2), default=list, blank=True, verbose_name="용어 색인")
     analyzed_at = models.DateTimeField(auto_now_add=True, verbose_name="분석일시")
     
     class Meta:
@@ -152,6 +178,8 @@ class SentimentAnalysis(models.Model):
         indexes = [
             models.Index(fields=['location', 'sentiment', 'analyzed_at']),
             models.Index(fields=['content_type', 'content_id']),
+            models.Index(fields=['lexicon_version']),
+            GinIndex(fields=['text_grams']),
         ]
         unique_together = ['content_type', 'content_id']
         verbose_name = "감성 분석"
@@ -168,6 +196,7 @@ class SentimentSummary(models.Model):
     neutral_count = models.IntegerField(default=0, verbose_name="중립 개수")
     sentiment_score = models.FloatField(default=0.0, verbose_name="감성 점수")
     top_keywords = models.JSONField(default=dict, verbose_name="주요 키워드")
+    keyword_counts = models.JSONField(default=dict, verbose_name="키워드 빈도")
     
     class Meta:
         db_table = 'sentiment_summary'
@@ -191,4 +220,49 @@ class SentimentSummary(models.Model):
     
     @property
     def negative_ratio(self):
-        return (self.negative_count / self.total_count * 100) if self.total_count > 0 else 0
\ No newline at end of file
+        return (self.negative_count / self.total_count * 100) if self.total_count > 0 else 0
+    
+    @property
+    def mood_emoji(self):
+        temperature = max(0, min(100, (self.sentiment_score + 1) * 50))
+        if temperature >= 70:
+            return '😊'
+        elif temperature >= 30:
+            return '😐'
+        return '😔'
+
+class SentimentCacheEntry(models.Model):
+    text_hash = models.CharField(max_length=64, unique=True, verbose_name="텍스트 해시")
+    lexicon_version = models.CharField(max_length=32, verbose_name="사전 버전")
+    sentiment = models.CharField(max_length=10, choices=SentimentAnalysis.SENTIMENT_CHOICES, verbose_name="감성")
+    confidence = models.FloatField(verbose_name="신뢰도")
+    keywords = models.JSONField(default=list, verbose_name="추출 키워드")
+    tokens = models.JSONField(default=list, verbose_name="형태소 키워드")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+    
+    class Meta:
+        db_table = 'sentiment_cache'
+        indexes = [
+            models.Index(fields=['lexicon_version']),
+        ]
+        verbose_name = "감성 분석 캐시"
+        verbose_name_plural = "감성 분석 캐시들"
+    
+    def __str__(self):
+        return f"{self.text_hash[:12]} ({self.lexicon_version})"
+
+class LexiconSnapshot(models.Model):
+    version = models.CharField(max_length=32, unique=True, verbose_name="사전 버전")
+    positive_words = models.JSONField(default=list, verbose_name="긍정어")
+    negative_words = models.JSONField(default=list, verbose_name="부정어")
+    neutral_words = models.JSONField(default=list, verbose_name="중립어")
+    stopwords = models.JSONField(default=list, verbose_name="불용어")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
+    
+    class Meta:
+        db_table = 'lexicon_snapshots'
+        verbose_name = "감성 사전 스냅샷"
+        verbose_name_plural = "감성 사전 스냅샷들"
+    
+    def __str__(self):
+        return f"{self.version} ({self.created_at.date()})"
\ No newline at end of file
@@ -5,15 +5,138 @@ import json
 from datetime import datetime, timedelta
 from urllib.parse import quote
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict
+import os
 import time
+import threading
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from .crawler_utils import rate_limiter, circuit_breakers, HostConcurrencyLimiter
+from .youtube_extractor import iter_videos, parse_published_text
+
+# 페이지 파싱 함수 - 프로세스 풀 워커에서 실행되므로 모듈 수준에 둔다
+def parse_view_count(view_text: str) -> int:
+    """조회수 텍스트를 숫자로 변환"""
+    if not view_text:
+        return 0
+    
+    view_text = str(view_text).lower()
+    
+    # 만 단위 처리
+    if '만' in view_text:
+        numbers = re.findall(r'([\d.]+)', view_text)
+        if numbers:
+            try:
+                return int(float(numbers[0]) * 10000)
+            except ValueError:
+                return 0
+    
+    # 억 단위 처리
+    elif '억' in view_text:
+        numbers = re.findall(r'([\d.]+)', view_text)
+        if numbers:
+            try:
+                return int(float(numbers[0]) * 100000000)
+            except ValueError:
+                return 0
+    
+    # 일반 숫자 처리
+    else:
+        numbers = re.findall(r'[\d,]+', view_text)
+        if numbers:
+            try:
+                return int(numbers[0].replace(',', ''))
+            except ValueError:
+                return 0
+    
+    return 0
+
+
+def parse_youtube_page(content: str, limit: int) -> List[Dict]:
+    """YouTube 검색 결과 페이지에서 영상 목록 추출 (ytInitialData의 영상 항목만 디코딩)"""
+    results = []
+    try:
+        now = datetime.now()
+        for video in iter_videos(content):
+            results.append({
+                'source': 'youtube',
+                'title': video.title,
+                'url': f"https://www.youtube.com/watch?v={video.video_id}",
+                'view_count': parse_view_count(video.view_text),
+                'published_at': parse_published_text(video.published_text, now) or now - timedelta(hours=2)
+            })
+            if len(results) >= limit:
+                break
+    except Exception as e:
+        logging.warning(f"YouTube parsing error: {e}")
+    
+    return results
+
+
+def parse_naver_news_page(content: str, limit: int) -> List[Dict]:
+    """네이버 뉴스 검색 결과 페이지에서 기사 목록 추출"""
+    results = []
+    try:
+        # 정규식으로 빠른 제목 추출 시도
+        title_pattern = r'<a[^>]*class="news_tit"[^>]*href="([^"]*)"[^>]*>([^<]+)</a>'
+        matches = re.findall(title_pattern, content)
+        
+        if matches:
+            for i, (url_match, title) in enumerate(matches[:limit]):
+                results.append({
+                    'source': 'naver_news',
+                    'title': title.strip(),
+                    'url': url_match,
+                    'view_count': 0,
+                    'published_at': datetime.now() - timedelta(hours=1)
+                })
+        else:
+            # 정규식 실패시 BeautifulSoup 사용
+            soup = BeautifulSoup(content, 'lxml')
+            news_items = soup.select('.list_news .bx')[:limit]
+            
+            for item in news_items:
+                title_elem = item.select_one('.news_tit')
+                if title_elem:
+                    results.append({
+                        'source': 'naver_news',
+                        'title': title_elem.get_text(strip=True),
+                        'url': title_elem.get('href', ''),
+                        'view_count': 0,
+                        'published_at': datetime.now() - timedelta(hours=1)
+                    })
+    except Exception as e:
+        logging.warning(f"Naver news parsing error: {e}")
+    
+    return results
+
+
+PAGE_PARSERS = {
+    'youtube': parse_youtube_page,
+    'naver_news': parse_naver_news_page,
+}
+
+
+def parse_page(source: str, content, limit: int):
+    """원본 응답(bytes)을 디코딩해 소스별로 파싱하고 (결과, 파싱 소요 시간) 반환"""
+    start_time = time.perf_counter()
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', errors='replace')
+    results = PAGE_PARSERS[source](content, limit)
+    return results, time.perf_counter() - start_time
+
 
 class OptimizedLocalIssueCrawler:
     """성능 최적화된 비동기 크롤러"""
     
-    def __init__(self, max_concurrent=10, timeout=30):
+    def __init__(self, max_concurrent=10, timeout=30, max_per_host=10, parse_workers=None):
         self.max_concurrent = max_concurrent
+        # 큰 검색 결과 페이지 파싱은 프로세스 풀에서 (0이면 이벤트 루프에서 직접 파싱)
+        self.parse_workers = min(4, os.cpu_count() or 1) if parse_workers is None else parse_workers
+        self.parse_pool = None
+        self.parse_stats = {}
         self.timeout = aiohttp.ClientTimeout(
             total=timeout,
             connect=10,  # 연결 timeout
@@ -27,13 +150,17 @@ class OptimizedLocalIssueCrawler:
             'Connection': 'keep-alive'
         }
         self.session = None
+        # 전체 동시 요청 상한 - 호스트별 동시 요청 수는 응답 상태에 따라 자동 조절
         self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.concurrency = HostConcurrencyLimiter(max_limit=min(max_per_host, max_concurrent))
+        self.rate_limiter = rate_limiter
+        self.circuit_breakers = circuit_breakers
         
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
         connector = aiohttp.TCPConnector(
             limit=50,  # 전체 연결 풀 크기 감소
-            limit_per_host=10,  # 호스트당 연결 수 감소
+            limit_per_host=self.concurrency.max_limit,  # 호스트당 연결 수 (AIMD 상한)
             ttl_dns_cache=300,
             use_dns_cache=True,
             keepalive_timeout=30,  # keep-alive timeout
@@ -45,58 +172,168 @@ class OptimizedLocalIssueCrawler:
             timeout=self.timeout,
             headers=self.headers
         )
+        if self.parse_workers > 0:
+            # 이벤트 루프/DB 스레드가 도는 프로세스에서 fork하면 잡힌 잠금이 복사될 수 있어 forkserver(없으면 spawn) 사용
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            self.parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context(start_method)
+            )
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료"""
         if self.session:
             await self.session.close()
+        if self.parse_pool:
+            await asyncio.get_running_loop().run_in_executor(None, self.parse_pool.shutdown)
+            self.parse_pool = None
+        self.concurrency.log_stats()
+        self.log_parse_stats()
     
-    async def _fetch_with_retry(self, url: str, max_retries=3) -> Optional[str]:
-        """개선된 재시도 로직이 포함된 HTTP 요청"""
-        async with self.semaphore:
-            for attempt in range(max_retries + 1):
-                try:
-                    async with self.session.get(url) as response:
+    async def _fetch_with_retry(self, url: str, max_retries=3, raw=False):
+        """개선된 재시도 로직이 포함된 HTTP 요청 (raw=True면 디코딩하지 않은 bytes 반환)"""
+        host_limiter = self.concurrency.limiter_for(url)
+        breaker = self.circuit_breakers.breaker_for(url)
+        
+        for attempt in range(max_retries + 1):
+            # 장애로 차단된 호스트는 대기 없이 바로 실패 처리
+            if not breaker.allow_request():
+                logging.debug(f"Circuit open, skipping {url}")
+                return None
+            
+            # 호스트별 속도 제한 (토큰 대기나 재시도 대기 중에는 동시 실행 슬롯을 잡지 않음)
+            await self.rate_limiter.acquire(url)
+            retry_delay = 0
+            success = False
+            throttled = False
+            
+            # 호스트별 동시 요청 한도 -> 전체 상한 순서로 대기 (느린 호스트가 전체 슬롯을 막지 않도록)
+            await host_limiter.acquire()
+            start_time = None
+            try:
+                async with self.semaphore:
+                    # 응답 시간은 전체 상한 대기 이후부터 측정 (다른 호스트 혼잡이 이 호스트 한도를 줄이지 않도록)
+                    start_time = time.monotonic()
+                    timeout = aiohttp.ClientTimeout(
+                        total=host_limiter.request_timeout(self.timeout.connect),
+                        connect=self.timeout.connect,
+                        sock_read=self.timeout.sock_read
+                    )
+                    async with self.session.get(url, timeout=timeout) as response:
                         if response.status == 200:
-                            return await response.text()
+                            body = await response.read() if raw else await response.text()
+                            success = True
+                            return body
                         elif response.status == 429:  # Rate limit
-                            wait_time = min(2 ** attempt, 10)  # 최대 10초
-                            logging.info(f"Rate limited, waiting {wait_time}s")
-                            await asyncio.sleep(wait_time)
-                            continue
+                            retry_delay = min(2 ** attempt, 10)  # 최대 10초
+                            throttled = True
+                            # 같은 호스트로 가는 다른 작업도 함께 대기
+                            self.rate_limiter.throttled(url, retry_delay)
+                            logging.info(f"Rate limited, waiting {retry_delay}s")
                         elif response.status >= 500:  # 서버 오류
                             logging.warning(f"Server error {response.status} for {url}")
-                            await asyncio.sleep(1 * (attempt + 1))
-                            continue
+                            retry_delay = max(1 * (attempt + 1), host_limiter.retry_delay())
                         else:
+                            # 4xx는 호스트 혼잡이 아니므로 동시 요청 한도를 줄이지 않음
+                            success = True
                             logging.warning(f"HTTP {response.status} for {url}")
                             return None
                             
-                except asyncio.TimeoutError:
-                    logging.warning(f"Timeout attempt {attempt + 1}/{max_retries + 1} for {url}")
-                    if attempt < max_retries:
-                        await asyncio.sleep(2 * (attempt + 1))
-                except aiohttp.ClientError as e:
-                    logging.warning(f"Client error attempt {attempt + 1}/{max_retries + 1} for {url}: {e}")
-                    if attempt < max_retries:
-                        await asyncio.sleep(1 * (attempt + 1))
-                except Exception as e:
-                    logging.error(f"Unexpected error for {url}: {e}")
-                    break
+            except asyncio.TimeoutError:
+                logging.warning(f"Timeout attempt {attempt + 1}/{max_retries + 1} for {url}")
+                retry_delay = 2 * (attempt + 1)
+            except aiohttp.ClientError as e:
+                logging.warning(f"Client error attempt {attempt + 1}/{max_retries + 1} for {url}: {e}")
+                retry_delay = max(1 * (attempt + 1), host_limiter.retry_delay())
+            except Exception as e:
+                logging.error(f"Unexpected error for {url}: {e}")
+                break
+            finally:
+                response_time = time.monotonic() - start_time if start_time is not None else 0.0
+                await host_limiter.release(response_time, success)
+                # 429는 호스트가 살아 있다는 뜻이므로 장애로 세지 않음
+                if success or throttled:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+            
+            # 재시도 중 서킷이 열렸으면 더 기다리지 않음
+            if attempt == max_retries or breaker.is_open():
+                break
+            await asyncio.sleep(retry_delay)
                     
         return None
     
+    def youtube_query_urls(self, district_name: str) -> List[str]:
+        """구별 YouTube 검색 URL (처음 2개 쿼리만 사용)"""
+        queries = [f"{district_name} 뉴스", f"{district_name} 이슈", f"{district_name} 소식"]
+        return [f"https://www.youtube.com/results?search_query={quote(query)}" for query in queries[:2]]
+    
+    def naver_news_query_urls(self, district_name: str) -> List[str]:
+        """구별 네이버 뉴스 검색 URL"""
+        queries = [f"{district_name} 뉴스", f"{district_name} 소식"]
+        return [
+            f"https://search.naver.com/search.naver?where=news&query={quote(query)}&sort=1"
+            for query in queries
+        ]
+    
+    def source_requests(self, district_name: str, target_count=50) -> List[tuple]:
+        """구 하나를 수집할 (source, url, 쿼리당 개수) 목록 - 소스별로 target_count의 절반씩"""
+        per_source = target_count // 2
+        return (
+            [('naver_news', url, per_source // 2) for url in self.naver_news_query_urls(district_name)]
+            + [('youtube', url, per_source // 2) for url in self.youtube_query_urls(district_name)]
+        )
+    
+    async def parse_page(self, source: str, content, limit: int) -> List[Dict]:
+        """검색 결과 페이지를 프로세스 풀에서 파싱 (원본 bytes를 그대로 넘기고 디코딩도 워커에서)"""
+        if self.parse_pool is None:
+            results, elapsed = parse_page(source, content, limit)
+        else:
+            try:
+                results, elapsed = await asyncio.get_running_loop().run_in_executor(
+                    self.parse_pool, parse_page, source, content, limit
+                )
+            except BrokenProcessPool as e:
+                logging.warning(f"파싱 프로세스 풀 사용 불가, 이벤트 루프에서 파싱: {e}")
+                self.parse_pool = None
+                results, elapsed = parse_page(source, content, limit)
+        
+        stats = self.parse_stats.setdefault(source, {'pages': 0, 'bytes': 0, 'total': 0.0, 'max': 0.0})
+        stats['pages'] += 1
+        stats['bytes'] += len(content)
+        stats['total'] += elapsed
+        stats['max'] = max(stats['max'], elapsed)
+        return results
+    
+    def get_parse_stats(self):
+        """소스별 파싱 횟수/평균/최대 시간 (워커 안에서 측정한 순수 파싱 시간)"""
+        return {
+            source: {
+                'pages': stats['pages'],
+                'avg_kb': round(stats['bytes'] / stats['pages'] / 1024, 1),
+                'avg_ms': round(stats['total'] / stats['pages'] * 1000, 2),
+                'max_ms': round(stats['max'] * 1000, 2),
+            }
+            for source, stats in self.parse_stats.items()
+        }
+    
+    def log_parse_stats(self):
+        for source, stats in self.get_parse_stats().items():
+            logging.info(
+                f"[parse] {source}: {stats['pages']}페이지 (평균 {stats['avg_kb']}KB), "
+                f"평균 {stats['avg_ms']}ms, 최대 {stats['max_ms']}ms"
+            )
+    
     async def crawl_youtube_async(self, district_name: str, limit=5) -> List[Dict]:
         """비동기 YouTube 크롤링"""
         results = []
-        queries = [f"{district_name} 뉴스", f"{district_name} 이슈", f"{district_name} 소식"]
         
         # 병렬로 여러 쿼리 처리
         tasks = []
-        for query in queries[:2]:  # 처음 2개 쿼리만 사용
-            url = f"https://www.youtube.com/results?search_query={quote(query)}"
-            tasks.append(self._crawl_single_youtube_query(url, query, limit//2))
+        for url in self.youtube_query_urls(district_name):
+            tasks.append(self._crawl_single_youtube_query(url, url, limit//2))
         
         query_results = await asyncio.gather(*tasks, return_exceptions=True)
         
@@ -110,40 +347,17 @@ class OptimizedLocalIssueCrawler:
     
     async def _crawl_single_youtube_query(self, url: str, query: str, limit: int) -> List[Dict]:
         """단일 YouTube 쿼리 처리"""
-        content = await self._fetch_with_retry(url)
+        content = await self._fetch_with_retry(url, raw=True)
         if not content:
             return []
         
-        results = []
-        try:
-            # 정규식으로 빠른 데이터 추출
-            video_pattern = r'"videoId":"([^"]+)".*?"title":{"runs":\[{"text":"([^"]+)".*?"viewCountText":{"simpleText":"([^"]*)"'
-            matches = re.findall(video_pattern, content, re.DOTALL)
-            
-            for i, (video_id, title, view_count) in enumerate(matches[:limit]):
-                if i >= limit:
-                    break
-                
-                results.append({
-                    'source': 'youtube',
-                    'title': title.replace('\\', ''),
-                    'url': f"https://www.youtube.com/watch?v={video_id}",
-                    'view_count': self._parse_view_count(view_count),
-                    'published_at': datetime.now() - timedelta(hours=2)
-                })
-        except Exception as e:
-            logging.warning(f"YouTube parsing error for {query}: {e}")
-        
-        return results
+        return await self.parse_page('youtube', content, limit)
     
     async def crawl_naver_news_async(self, district_name: str, limit=10) -> List[Dict]:
         """비동기 네이버 뉴스 크롤링"""
-        queries = [f"{district_name} 뉴스", f"{district_name} 소식"]
-        
         # 병렬로 여러 쿼리 처리
         tasks = []
-        for query in queries:
-            url = f"https://search.naver.com/search.naver?where=news&query={quote(query)}&sort=1"
+        for url in self.naver_news_query_urls(district_name):
             tasks.append(self._crawl_single_naver_query(url, limit//2))
         
         query_results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -157,44 +371,11 @@ class OptimizedLocalIssueCrawler:
     
     async def _crawl_single_naver_query(self, url: str, limit: int) -> List[Dict]:
         """단일 네이버 뉴스 쿼리 처리"""
-        content = await self._fetch_with_retry(url)
+        content = await self._fetch_with_retry(url, raw=True)
         if not content:
             return []
         
-        results = []
-        try:
-            # 정규식으로 빠른 제목 추출 시도
-            title_pattern = r'<a[^>]*class="news_tit"[^>]*href="([^"]*)"[^>]*>([^<]+)</a>'
-            matches = re.findall(title_pattern, content)
-            
-            if matches:
-                for i, (url_match, title) in enumerate(matches[:limit]):
-                    results.append({
-                        'source': 'naver_news',
-                        'title': title.strip(),
-                        'url': url_match,
-                        'view_count': 0,
-                        'published_at': datetime.now() - timedelta(hours=1)
-                    })
-            else:
-                # 정규식 실패시 BeautifulSoup 사용
-                soup = BeautifulSoup(content, 'lxml')
-                news_items = soup.select('.list_news .bx')[:limit]
-                
-                for item in news_items:
-                    title_elem = item.select_one('.news_tit')
-                    if title_elem:
-                        results.append({
-                            'source': 'naver_news',
-                            'title': title_elem.get_text(strip=True),
-                            'url': title_elem.get('href', ''),
-                            'view_count': 0,
-                            'published_at': datetime.now() - timedelta(hours=1)
-                        })
-        except Exception as e:
-            logging.warning(f"Naver news parsing error: {e}")
-        
-        return results
+        return await self.parse_page('naver_news', content, limit)
     
     async def crawl_district_async(self, district_name: str, target_count=50) -> List[Dict]:
         """단일 구 비동기 크롤링"""
@@ -233,65 +414,130 @@ class OptimizedLocalIssueCrawler:
     
     def _parse_view_count(self, view_text: str) -> int:
         """조회수 텍스트를 숫자로 변환"""
-        if not view_text:
-            return 0
-        
-        view_text = str(view_text).lower()
-        
-        # 만 단위 처리
-        if '만' in view_text:
-            numbers = re.findall(r'([\d.]+)', view_text)
-            if numbers:
-                try:
-                    return int(float(numbers[0]) * 10000)
-                except ValueError:
-                    return 0
-        
-        # 억 단위 처리
-        elif '억' in view_text:
-            numbers = re.findall(r'([\d.]+)', view_text)
-            if numbers:
-                try:
-                    return int(float(numbers[0]) * 100000000)
-                except ValueError:
-                    return 0
-        
-        # 일반 숫자 처리
-        else:
-            numbers = re.findall(r'[\d,]+', view_text)
-            if numbers:
-                try:
-                    return int(numbers[0].replace(',', ''))
-                except ValueError:
-                    return 0
-        
-        return 0
+        return parse_view_count(view_text)
+
+class CrawlerRuntime:
+    """크롤링 작업 동안 하나의 이벤트 루프와 연결 풀을 유지하는 런타임
+    
+    전용 스레드에서 이벤트 루프를 돌리고 크롤러 세션을 한 번만 연다.
+    구 단위 작업은 같은 세션으로 처리되므로 keep-alive 연결과 DNS 캐시가
+    구 사이에서 재사용된다. 여러 스레드에서 동시에 작업을 제출해도 된다.
+    """
+    
+    def __init__(self, max_concurrent=10, timeout=30):
+        self.max_concurrent = max_concurrent
+        self.timeout = timeout
+        self._loop = None
+        self._thread = None
+        self._crawler = None
+        self._lock = threading.Lock()
+    
+    @property
+    def is_running(self):
+        return self._loop is not None
+    
+    def start(self):
+        """이벤트 루프 스레드 시작 및 크롤러 세션 생성 (이미 실행 중이면 무시)"""
+        with self._lock:
+            if self._loop is not None:
+                return self
+            
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name='crawler-runtime', daemon=True)
+            thread.start()
+            try:
+                crawler = asyncio.run_coroutine_threadsafe(self._open_crawler(), loop).result()
+            except Exception:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                loop.close()
+                raise
+            
+            self._loop, self._thread, self._crawler = loop, thread, crawler
+            logging.info(f"크롤러 런타임 시작 (동시 요청 {self.max_concurrent})")
+        return self
+    
+    async def _open_crawler(self):
+        # 세마포어/세션이 런타임 루프에 묶이도록 루프 안에서 생성
+        crawler = OptimizedLocalIssueCrawler(self.max_concurrent, self.timeout)
+        return await crawler.__aenter__()
+    
+    def run(self, coroutine_factory):
+        """crawler를 받아 코루틴을 만드는 함수를 런타임 루프에 제출 (concurrent Future 반환)"""
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coroutine_factory(self._crawler), self._loop)
+    
+    def submit_district(self, district: str, target_count=50):
+        """구 크롤링 작업 제출 (결과는 future.result()로 조회)"""
+        return self.run(lambda crawler: crawler.crawl_district_async(district, target_count))
+    
+    def crawl_district(self, district: str, target_count=50) -> List[Dict]:
+        """단일 구 크롤링 (완료까지 대기)"""
+        return self.submit_district(district, target_count).result()
+    
+    def crawl_districts(self, districts: List[str], target_count=50) -> Dict[str, List[Dict]]:
+        """여러 구 병렬 크롤링 (완료까지 대기)"""
+        return self.run(lambda crawler: crawler.crawl_all_districts_async(districts, target_count)).result()
+    
+    def close(self):
+        """크롤러 세션을 닫고 이벤트 루프 스레드 종료"""
+        with self._lock:
+            if self._loop is None:
+                return
+            
+            loop, thread, crawler = self._loop, self._thread, self._crawler
+            self._loop = self._thread = self._crawler = None
+            try:
+                asyncio.run_coroutine_threadsafe(crawler.__aexit__(None, None, None), loop).result()
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                loop.close()
+            logging.info("크롤러 런타임 종료")
+            rate_limiter.log_stats()
+            circuit_breakers.log_stats()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 
 # 동기 인터페이스 래퍼
 class AsyncCrawlerWrapper:
-    """기존 동기 코드와의 호환성을 위한 래퍼"""
+    """기존 동기 코드와의 호환성을 위한 래퍼
+    
+    처음 호출할 때 CrawlerRuntime을 시작하고 close()까지 유지한다.
+    with 문으로 쓰면 작업이 끝날 때 자동으로 닫힌다.
+    """
     
     def __init__(self, max_concurrent=10):
         self.max_concurrent = max_concurrent
+        self.runtime = CrawlerRuntime(max_concurrent)
     
     def crawl_all_districts(self, districts: List[str], target_count=50) -> Dict[str, List[Dict]]:
         """동기 인터페이스로 모든 구 크롤링"""
-        return asyncio.run(self._crawl_all_async(districts, target_count))
+        return self.runtime.crawl_districts(districts, target_count)
     
     def crawl_single_district(self, district: str, target_count=50) -> List[Dict]:
         """동기 인터페이스로 단일 구 크롤링"""
-        return asyncio.run(self._crawl_single_async(district, target_count))
+        return self.runtime.crawl_district(district, target_count)
+    
+    def submit_district(self, district: str, target_count=50):
+        """단일 구 크롤링 작업 제출 (concurrent Future 반환)"""
+        return self.runtime.submit_district(district, target_count)
     
-    async def _crawl_all_async(self, districts: List[str], target_count: int) -> Dict[str, List[Dict]]:
-        """내부 비동기 구현"""
-        async with OptimizedLocalIssueCrawler(self.max_concurrent) as crawler:
-            return await crawler.crawl_all_districts_async(districts, target_count)
+    def close(self):
+        """런타임 종료"""
+        self.runtime.close()
     
-    async def _crawl_single_async(self, district: str, target_count: int) -> List[Dict]:
-        """내부 비동기 구현"""
-        async with OptimizedLocalIssueCrawler(self.max_concurrent) as crawler:
-            return await crawler.crawl_district_async(district, target_count)
+    def __enter__(self):
+        self.runtime.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 
 # 성능 테스트 함수
@@ -315,6 +561,26 @@ async def performance_test():
     # 결과 출력
     for district, items in results.items():
         print(f"  {district}: {len(items)}개")
+    
+    # 호스트별 요청 속도 제한 대기 통계
+    for host, stats in rate_limiter.get_stats().items():
+        if stats['acquired']:
+            print(f"  [{host}] 요청 {stats['acquired']}회, 대기 {stats['waited']}회, "
+                  f"평균 대기 {stats['avg_wait']:.2f}초, 429 {stats['throttled']}회")
+    
+    # 호스트별 서킷 상태
+    for host, stats in circuit_breakers.get_stats().items():
+        print(f"  [{host}] 서킷 {stats['state']}, 차단 {stats['times_opened']}회, "
+              f"건너뛴 요청 {stats['short_circuited']}개")
+    
+    # 소스별 파싱 시간 (프로세스 풀 워커에서 측정)
+    for source, stats in crawler.get_parse_stats().items():
+        print(f"  [parse:{source}] {stats['pages']}페이지, 평균 {stats['avg_ms']}ms, 최대 {stats['max_ms']}ms")
+    
+    # 호스트별 동시 요청 한도 변화
+    for host, stats in crawler.concurrency.get_stats().items():
+        print(f"  [{host}] 동시 요청 한도 {stats['limit']} (최대 {stats['peak_limit']}), "
+              f"평균 응답 {stats['avg_response_time']:.2f}초, 에러율 {stats['error_rate']:.1%}")
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ import threading
 from django.core.management import call_command
 from django.utils import timezone
 from datetime import datetime
+from .weather_service import FORECAST_BASE_TIMES, FORECAST_PUBLISH_DELAY
 import logging
 
 # 로깅 설정
@@ -20,9 +21,13 @@ class CrawlScheduler:
     def __init__(self):
         self.is_running = False
         self.scheduler_thread = None
+        self._crawl_lock = threading.Lock()
     
     def daily_crawl_job(self):
-        """매일 자정 실행되는 크롤링 작업"""
+        """매일 자정 실행되는 크롤링 작업 (이전 작업이 아직 실행 중이면 건너뜀)"""
+        if not self._crawl_lock.acquire(blocking=False):
+            logging.warning("이전 일일 크롤링이 아직 실행 중 - 이번 실행 건너뜀")
+            return
         try:
             logging.info("=== 일일 크롤링 작업 시작 ===")
             start_time = datetime.now()
@@ -40,6 +45,19 @@ class CrawlScheduler:
             
         except Exception as e:
             logging.error(f"크롤링 작업 실패: {str(e)}")
+        finally:
+            self._crawl_lock.release()
+    
+    def weather_prefetch_job(self):
+        """단기예보 발표 직후 실행되는 날씨 미리 조회 작업"""
+        try:
+            call_command('prefetch_weather')
+        except Exception as e:
+            logging.error(f"날씨 미리 조회 실패: {str(e)}")
+    
+    def _run_in_thread(self, job):
+        """스케줄러 루프를 막지 않도록 별도 스레드에서 실행 (크롤링 중에도 예보 조회가 제시간에 실행됨)"""
+        threading.Thread(target=job, daemon=True).start()
     
     def start_scheduler(self):
         """스케줄러 시작"""
@@ -48,7 +66,12 @@ class CrawlScheduler:
             return
         
         # 매일 자정(00:00)에 실행
-        schedule.every().day.at("00:00").do(self.daily_crawl_job)
+        schedule.every().day.at("00:00").do(self._run_in_thread, self.daily_crawl_job)
+        
+        # 단기예보 발표(02시부터 3시간 간격) 직후 전체 격자 예보 미리 조회
+        publish_minute = int(FORECAST_PUBLISH_DELAY.total_seconds() // 60) + 1
+        for base_time in FORECAST_BASE_TIMES:
+            schedule.every().day.at(f"{base_time[:2]}:{publish_minute:02d}").do(self._run_in_thread, self.weather_prefetch_job)
         
         # 테스트용: 매 10분마다 실행 (개발 시에만 사용)
         # schedule.every(10).minutes.do(self.daily_crawl_job)
@@ -57,6 +80,9 @@ class CrawlScheduler:
         self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
         self.scheduler_thread.start()
         
+        # 시작 시점의 예보도 바로 채워 둠
+        self._run_in_thread(self.weather_prefetch_job)
+        
         logging.info("크롤링 스케줄러 시작됨 - 매일 자정 실행")
     
     def _run_scheduler(self):
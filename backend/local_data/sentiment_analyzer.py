@@ -1,9 +1,21 @@
+import os
 import re
+import atexit
+import hashlib
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from django.utils import timezone
 from collections import Counter
 import math
 
+from .lexicon_matcher import LexiconMatcher
+from .sentiment_cache import get_sentiment_cache, make_cache_key
+
+logger = logging.getLogger(__name__)
+
 try:
     from konlpy.tag import Okt
     KONLPY_AVAILABLE = True
@@ -19,6 +31,19 @@ except ImportError:
     SKLEARN_AVAILABLE = False
     print("scikit-learn not installed. TF-IDF features disabled.")
 
+# 점수 계산 로직이 바뀌면 올려서 기존 캐시/분석 결과와 구분
+ANALYZER_VERSION = 1
+
+def compute_lexicon_version(positive_words, negative_words, neutral_words, stopwords):
+    """사전 내용 기반 버전 문자열 (분석기 버전 + 사전 해시)"""
+    digest = hashlib.sha1()
+    for name, words in (('positive', positive_words), ('negative', negative_words),
+                        ('neutral', neutral_words), ('stopwords', stopwords)):
+        digest.update(name.encode('utf-8'))
+        for word in sorted(set(words)):
+            digest.update(b'\0' + word.encode('utf-8'))
+    return f"v{ANALYZER_VERSION}-{digest.hexdigest()[:12]}"
+
 class SimpleSentimentAnalyzer:
     def __init__(self):
         # 외부 리소스 매니저 초기화
@@ -29,10 +54,10 @@ class SimpleSentimentAnalyzer:
         try:
             self.positive_words, self.negative_words = self.resource_manager.load_sentiment_dictionary()
             self.stopwords = self.resource_manager.download_korean_stopwords()
-            print(f"감성 사전 로드 완료: 긍정 {len(self.positive_words)}개, 부정 {len(self.negative_words)}개")
-            print(f"불용어 사전 로드 완료: {len(self.stopwords)}개")
+            logger.info(f"감성 사전 로드 완료: 긍정 {len(self.positive_words)}개, 부정 {len(self.negative_words)}개")
+            logger.info(f"불용어 사전 로드 완료: {len(self.stopwords)}개")
         except Exception as e:
-            print(f"외부 리소스 로드 실패, 기본 사전 사용: {e}")
+            logger.warning(f"외부 리소스 로드 실패, 기본 사전 사용: {e}")
             self._load_default_dictionaries()
         
         # 중립 키워드 (기본값)
@@ -40,6 +65,18 @@ class SimpleSentimentAnalyzer:
             '공지', '안내', '알림', '변경', '일정', '계획', '예정', '진행'
         ]
         
+        # 긍정/부정/중립 사전을 단일 오토마톤으로 컴파일
+        self.matcher = LexiconMatcher({
+            'positive': self.positive_words,
+            'negative': self.negative_words,
+            'neutral': self.neutral_words
+        })
+        
+        # 캐시 키에 사용할 사전 버전
+        self.lexicon_version = compute_lexicon_version(
+            self.positive_words, self.negative_words, self.neutral_words, self.stopwords
+        )
+        
         # KoNLPy 형태소 분석기 초기화 (Java 없이 실행 가능)
         try:
             if KONLPY_AVAILABLE:
@@ -47,9 +84,8 @@ class SimpleSentimentAnalyzer:
             else:
                 self.okt = None
         except Exception as e:
-            print(f"KoNLPy 초기화 실패 (Java 필요): {e}")
+            logger.warning(f"KoNLPy 초기화 실패 (Java 필요): {e}")
             self.okt = None
-            KONLPY_AVAILABLE = False
     
     def _load_default_dictionaries(self):
         """기본 사전 로드 (fallback)"""
@@ -87,9 +123,22 @@ class SimpleSentimentAnalyzer:
         return [word for word, count in keyword_counts.most_common(top_k)]
     
     def analyze_text(self, text):
+        """텍스트 감성 분석 (같은 텍스트는 캐시된 결과 반환)"""
+        if not text:
+            return {'sentiment': 'neutral', 'confidence': 0.0, 'keywords': [], 'tokens': []}
+        
+        cache = get_sentiment_cache()
+        key = make_cache_key(text, self.lexicon_version)
+        result = cache.get(key)
+        if result is None:
+            result = self._analyze_uncached(text)
+            cache.set(key, result, self.lexicon_version)
+        return result
+    
+    def _analyze_uncached(self, text):
         """텍스트 감성 분석 (KoNLPy + 키워드 사전 조합)"""
         if not text:
-            return {'sentiment': 'neutral', 'confidence': 0.0, 'keywords': []}
+            return {'sentiment': 'neutral', 'confidence': 0.0, 'keywords': [], 'tokens': []}
         
         text = text.lower()
         
@@ -104,24 +153,29 @@ class SimpleSentimentAnalyzer:
         
         # 추출된 키워드로 감성 점수 계산
         for keyword in extracted_keywords:
-            if any(pos_word in keyword for pos_word in self.positive_words):
+            polarities = self.matcher.find_polarities(keyword)
+            if 'positive' in polarities:
                 pos_score += 2
                 found_keywords.append(keyword)
-            elif any(neg_word in keyword for neg_word in self.negative_words):
+            elif 'negative' in polarities:
                 neg_score += 2
                 found_keywords.append(keyword)
-            elif any(neu_word in keyword for neu_word in self.neutral_words):
+            elif 'neutral' in polarities:
                 neu_score += 1
                 found_keywords.append(keyword)
         
-        # 원본 텍스트에서도 직접 매칭 (보완)
-        for word in self.positive_words:
-            if word in text and word not in found_keywords:
+        # 원본 텍스트에서도 직접 매칭 (보완) - 한 번의 스캔으로 모든 사전 단어 검색
+        matched_words = self.matcher.find_words(text)
+        positive_hits = [word for word in matched_words if 'positive' in self.matcher.polarities[word]]
+        negative_hits = [word for word in matched_words if 'negative' in self.matcher.polarities[word]]
+        
+        for word in positive_hits:
+            if word not in found_keywords:
                 pos_score += 1
                 found_keywords.append(word)
         
-        for word in self.negative_words:
-            if word in text and word not in found_keywords:
+        for word in negative_hits:
+            if word not in found_keywords:
                 neg_score += 1
                 found_keywords.append(word)
         
@@ -131,7 +185,8 @@ class SimpleSentimentAnalyzer:
             return {
                 'sentiment': 'neutral', 
                 'confidence': 0.1, 
-                'keywords': extracted_keywords[:3]  # 추출된 키워드라도 반환
+                'keywords': extracted_keywords[:3],  # 추출된 키워드라도 반환
+                'tokens': extracted_keywords
             }
         
         if pos_score > neg_score:
@@ -147,21 +202,22 @@ class SimpleSentimentAnalyzer:
         return {
             'sentiment': sentiment,
             'confidence': confidence,
-            'keywords': list(set(found_keywords))[:5]  # 중복 제거 후 최대 5개
+            'keywords': list(set(found_keywords))[:5],  # 중복 제거 후 최대 5개
+            'tokens': extracted_keywords  # 사전 매칭에 사용된 형태소 키워드 (용어 색인용)
         }
     
     def calculate_sentiment_score(self, positive_count, negative_count, neutral_count):
         """감성 점수 계산 (-1.0 ~ 1.0)"""
-        total = positive_count + negative_count + neutral_count
-        if total == 0:
-            return 0.0
-        
-        pos_ratio = positive_count / total
-        neg_ratio = negative_count / total
-        
-        return (pos_ratio - neg_ratio)
+        return calculate_sentiment_score(positive_count, negative_count, neutral_count)
+    
+    def _tokenize_for_tfidf(self, text):
+        """TF-IDF 입력용 형태소 분리 (불용어/한 글자 제거)"""
+        morphs = self.okt.morphs(text)
+        filtered_morphs = [word for word in morphs 
+                         if len(word) > 1 and word not in self.stopwords]
+        return ' '.join(filtered_morphs)
     
-    def extract_tfidf_keywords(self, texts, top_k=10):
+    def extract_tfidf_keywords(self, texts, top_k=10, workers=1):
         """여러 텍스트에서 TF-IDF 기반 주요 키워드 추출"""
         if not SKLEARN_AVAILABLE or not texts or len(texts) < 2:
             return []
@@ -169,12 +225,9 @@ class SimpleSentimentAnalyzer:
         try:
             # KoNLPy로 전처리
             if self.okt:
-                processed_texts = []
-                for text in texts:
-                    morphs = self.okt.morphs(text)
-                    filtered_morphs = [word for word in morphs 
-                                     if len(word) > 1 and word not in self.stopwords]
-                    processed_texts.append(' '.join(filtered_morphs))
+                processed_texts = _run_in_pool(_tokenize_chunk, texts, workers)
+                if processed_texts is None:
+                    processed_texts = [self._tokenize_for_tfidf(text) for text in texts]
             else:
                 processed_texts = texts
             
@@ -199,73 +252,379 @@ class SimpleSentimentAnalyzer:
             print(f"TF-IDF 키워드 추출 오류: {e}")
             return []
     
-    def analyze_batch(self, texts):
-        """여러 텍스트 일괄 분석"""
+    def analyze_many(self, texts, workers=None, chunk_size=None):
+        """여러 텍스트를 청크로 나눠 워커 프로세스 풀에서 분석
+
+        캐시에 있는 텍스트와 배치 내 중복 텍스트는 다시 분석하지 않는다.
+        워커 풀은 호출 간에 재사용되며(get_analysis_pool), 각 워커는 자체 분석기(Okt 포함)를 한 번 생성한다.
+        workers가 1 이하이거나 텍스트가 적으면 현재 프로세스에서 분석한다.
+        """
+        texts = list(texts)
+        cache = get_sentiment_cache()
+        
+        # 캐시에 없는 텍스트만 중복 없이 모아서 분석
+        keys = [make_cache_key(text, self.lexicon_version) if text else None for text in texts]
+        cached = cache.get_many([key for key in keys if key is not None])
+        pending = {}
+        for text, key in zip(texts, keys):
+            if key is not None and key not in cached:
+                pending.setdefault(key, text)
+        
+        pending_keys = list(pending)
+        pending_texts = [pending[key] for key in pending_keys]
+        analyzed = _run_in_pool(_analyze_chunk, pending_texts, workers, chunk_size)
+        if analyzed is None:
+            analyzed = [self._analyze_uncached(text) for text in pending_texts]
+        
+        analyzed = dict(zip(pending_keys, analyzed))
+        cache.set_many(analyzed, self.lexicon_version)
+        cached.update(analyzed)
+        
         results = []
-        for text in texts:
-            result = self.analyze_text(text)
-            results.append(result)
+        for text, key in zip(texts, keys):
+            if key is None:
+                results.append(self._analyze_uncached(text))
+            else:
+                result = cached[key]
+                results.append({
+                    **result,
+                    'keywords': list(result['keywords']),
+                    'tokens': list(result.get('tokens', []))
+                })
+        return results
+    
+    def analyze_batch(self, texts, workers=1):
+        """여러 텍스트 일괄 분석"""
+        results = self.analyze_many(texts, workers=workers)
         
         # 전체 텍스트에서 주요 키워드 추출
-        tfidf_keywords = self.extract_tfidf_keywords(texts)
+        tfidf_keywords = self.extract_tfidf_keywords(texts, workers=workers)
         
         return {
             'individual_results': results,
             'top_keywords': tfidf_keywords
         }
 
-def update_sentiment_summary(location, target_date=None):
-    """특정 지역의 감성 요약 업데이트"""
-    from .models import SentimentAnalysis, SentimentSummary
+def _init_pool_worker():
+    """워커 프로세스 초기화 - 분석기 생성 및 Okt 워밍업
+
+    워커는 spawn으로 시작하므로 부모의 분석기(Okt JVM 핸들)를 물려받지 않고 새로 만든다.
+    """
+    import django
+    from django.apps import apps
+    if not apps.ready and os.environ.get('DJANGO_SETTINGS_MODULE'):
+        django.setup()
+    analyzer_registry.reset()
+    analyzer = get_sentiment_analyzer()
+    if analyzer.okt:
+        analyzer.okt.pos('워밍업 문장입니다', stem=True)
+
+def _analyze_chunk(texts):
+    """워커 프로세스에서 텍스트 청크 감성 분석 (캐시는 부모 프로세스에서 처리)"""
+    analyzer = get_sentiment_analyzer()
+    return [analyzer._analyze_uncached(text) for text in texts]
+
+def _tokenize_chunk(texts):
+    """워커 프로세스에서 텍스트 청크 형태소 분리"""
+    analyzer = get_sentiment_analyzer()
+    return [analyzer._tokenize_for_tfidf(text) for text in texts]
+
+_analysis_pool = None
+_analysis_pool_workers = 0
+_analysis_pool_lock = threading.Lock()
+
+def get_analysis_pool(workers):
+    """프로세스 공유 분석 워커 풀 반환 (워커 수가 같으면 재사용)
+
+    워커 시작(spawn + django.setup + Okt JVM 기동) 비용이 크므로
+    배치마다 새로 만들지 않고 명령 실행 동안 하나의 풀을 계속 쓴다.
+    종료 시 shutdown_analysis_pool()로 정리한다 (프로세스 종료 시에도 자동 정리).
+    """
+    global _analysis_pool, _analysis_pool_workers
+    with _analysis_pool_lock:
+        if _analysis_pool is not None and _analysis_pool_workers != workers:
+            _analysis_pool.shutdown()
+            _analysis_pool = None
+        if _analysis_pool is None:
+            # JVM은 fork 후 자식에서 쓸 수 없으므로 fork 대신 spawn으로 워커 시작
+            _analysis_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_pool_worker
+            )
+            _analysis_pool_workers = workers
+        return _analysis_pool
+
+def shutdown_analysis_pool():
+    """공유 분석 워커 풀 종료 (다음 get_analysis_pool 호출 시 다시 생성)"""
+    global _analysis_pool, _analysis_pool_workers
+    with _analysis_pool_lock:
+        if _analysis_pool is not None:
+            _analysis_pool.shutdown()
+            _analysis_pool = None
+            _analysis_pool_workers = 0
+
+atexit.register(shutdown_analysis_pool)
+
+def _run_in_pool(func, texts, workers=None, chunk_size=None):
+    """텍스트를 청크로 나눠 공유 프로세스 풀에서 func 실행
+
+    풀을 쓸 필요가 없거나 풀 실행에 실패하면 None을 반환해
+    호출 측에서 현재 프로세스로 처리하도록 한다.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(texts) <= 1:
+        return None
     
-    if target_date is None:
-        target_date = date.today()
+    if chunk_size is None:
+        # 워커당 4개 청크 정도로 나눠 부하 분산
+        chunk_size = max(1, math.ceil(len(texts) / (workers * 4)))
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
     
-    # 해당 날짜의 감성 분석 데이터 집계
-    analyses = SentimentAnalysis.objects.filter(
-        location=location,
-        analyzed_at__date=target_date
-    )
+    try:
+        results = []
+        for chunk_result in get_analysis_pool(workers).map(func, chunks):
+            results.extend(chunk_result)
+        return results
+    except Exception as e:
+        # 깨진 풀은 버리고 다음 호출에서 새로 생성
+        shutdown_analysis_pool()
+        logger.warning(f"프로세스 풀 실행 실패, 단일 프로세스로 처리: {e}")
+        return None
+
+class SentimentAnalyzerRegistry:
+    """프로세스 단위로 SimpleSentimentAnalyzer를 공유하는 레지스트리
+
+    첫 호출 시 한 번만 생성하고 스레드 간에 같은 인스턴스를 사용한다.
+    감성/불용어 사전 파일의 mtime이 바뀐 경우에만 다시 생성한다.
+    """
     
-    positive_count = analyses.filter(sentiment='positive').count()
-    negative_count = analyses.filter(sentiment='negative').count()
-    neutral_count = analyses.filter(sentiment='neutral').count()
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._analyzer = None
+        self._resource_mtimes = None
+        self.build_count = 0
+        self.reload_count = 0
     
-    # 키워드 집계 및 TF-IDF 분석
-    all_keywords = {'positive': [], 'negative': []}
-    all_texts = {'positive': [], 'negative': []}
+    def _get_resource_mtimes(self):
+        """리소스 파일별 mtime 조회 (없는 파일은 None)"""
+        from .sentiment_resources import SentimentResourceManager
+        mtimes = {}
+        for path in SentimentResourceManager.resource_files():
+            try:
+                mtimes[path.name] = path.stat().st_mtime
+            except OSError:
+                mtimes[path.name] = None
+        return mtimes
     
-    for analysis in analyses:
-        if analysis.sentiment == 'positive':
-            all_keywords['positive'].extend(analysis.keywords)
-        elif analysis.sentiment == 'negative':
-            all_keywords['negative'].extend(analysis.keywords)
+    def get(self):
+        """공유 분석기 반환 (필요 시 생성/재생성)"""
+        mtimes = self._get_resource_mtimes()
+        analyzer = self._analyzer
+        if analyzer is not None and mtimes == self._resource_mtimes:
+            return analyzer
+        
+        with self._lock:
+            # 다른 스레드가 먼저 생성했는지 다시 확인
+            if self._analyzer is not None and mtimes == self._resource_mtimes:
+                return self._analyzer
+            
+            if self._analyzer is not None:
+                self.reload_count += 1
+                logger.info("감성 사전 변경 감지 - 분석기 재생성")
+            
+            self._analyzer = SimpleSentimentAnalyzer()
+            # 기본 사전 생성 등으로 파일이 바뀌었을 수 있으므로 생성 후 다시 기록
+            self._resource_mtimes = self._get_resource_mtimes()
+            self.build_count += 1
+            return self._analyzer
     
-    # 상위 키워드 추출
-    analyzer = SimpleSentimentAnalyzer()
-    top_positive = [word for word, count in Counter(all_keywords['positive']).most_common(5)]
-    top_negative = [word for word, count in Counter(all_keywords['negative']).most_common(5)]
+    def reset(self):
+        """공유 분석기 폐기 (다음 호출 시 재생성)"""
+        with self._lock:
+            self._analyzer = None
+            self._resource_mtimes = None
     
-    # 감성 점수 계산
-    analyzer = SimpleSentimentAnalyzer()
-    sentiment_score = analyzer.calculate_sentiment_score(
-        positive_count, negative_count, neutral_count
-    )
+    def get_stats(self):
+        """생성/재생성 횟수 반환"""
+        return {
+            'build_count': self.build_count,
+            'reload_count': self.reload_count,
+            'loaded': self._analyzer is not None
+        }
+
+# 전역 분석기 레지스트리 인스턴스
+analyzer_registry = SentimentAnalyzerRegistry()
+
+def get_sentiment_analyzer():
+    """프로세스 공유 감성 분석기 반환"""
+    return analyzer_registry.get()
+
+def build_text_grams(text, tokens=()):
+    """용어 색인용 문자 1-gram/2-gram 집합
+
+    분석 시 사전 매칭 대상(소문자 원문 + 형태소 키워드)을 그대로 색인해
+    사전 단어가 포함된 분석 결과를 GIN 인덱스로 찾을 수 있게 한다.
+    """
+    grams = set()
+    for part in [(text or '').lower(), *tokens]:
+        for word in part.split():
+            grams.update(word)
+            grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return sorted(grams)
+
+def term_grams(term):
+    """사전 단어 검색용 gram 목록 (한 글자는 1-gram, 그 외는 2-gram)"""
+    if len(term) == 1:
+        return [term]
+    return sorted({term[i:i + 2] for i in range(len(term) - 1)})
+
+_snapshot_versions = set()
+
+def ensure_lexicon_snapshot(analyzer):
+    """분석기 사전 버전의 스냅샷을 프로세스당 한 번 저장 (재분석 시 사전 비교용)"""
+    from .models import LexiconSnapshot
     
-    # 요약 데이터 저장/업데이트
-    summary, created = SentimentSummary.objects.update_or_create(
-        location=location,
-        date=target_date,
+    if analyzer.lexicon_version in _snapshot_versions:
+        return
+    _, created = LexiconSnapshot.objects.get_or_create(
+        version=analyzer.lexicon_version,
         defaults={
-            'positive_count': positive_count,
-            'negative_count': negative_count,
-            'neutral_count': neutral_count,
-            'sentiment_score': sentiment_score,
-            'top_keywords': {
-                'positive': top_positive,
-                'negative': top_negative
-            }
+            'positive_words': sorted(set(analyzer.positive_words)),
+            'negative_words': sorted(set(analyzer.negative_words)),
+            'neutral_words': sorted(set(analyzer.neutral_words)),
+            'stopwords': sorted(set(analyzer.stopwords))
         }
     )
+    if created:
+        # 새 사전 버전이 등록되면 이전 버전의 persistent 캐시 행은 더 이상 조회되지 않으므로 정리
+        get_sentiment_cache().prune_versions(analyzer.lexicon_version)
+    _snapshot_versions.add(analyzer.lexicon_version)
+
+def build_sentiment_analysis(location, content_type, content_id, text, result, analyzer):
+    """분석 결과로 SentimentAnalysis 객체 생성 (사전 버전/용어 색인 포함)"""
+    from .models import SentimentAnalysis
+    
+    ensure_lexicon_snapshot(analyzer)
+    return SentimentAnalysis(
+        location=location,
+        content_type=content_type,
+        content_id=content_id,
+        sentiment=result['sentiment'],
+        confidence=result['confidence'],
+        keywords=result.get('keywords', []),
+        lexicon_version=analyzer.lexicon_version,
+        text_grams=build_text_grams(text, result.get('tokens', []))
+    )
+
+def get_content_texts(content_type, content_ids):
+    """콘텐츠 타입별 원본 텍스트 조회 ({id: 분석 대상 텍스트})"""
+    from .models import RawData, DistrictAnnouncement, LocalIssue
+    
+    if content_type == 'raw_data':
+        items = RawData.objects.in_bulk(content_ids)
+        return {pk: f"{item.title} {item.content}" for pk, item in items.items()}
+    if content_type == 'district_announcement':
+        items = DistrictAnnouncement.objects.in_bulk(content_ids)
+        return {pk: f"{item.title} {item.content}" for pk, item in items.items()}
+    if content_type == 'local_issue':
+        items = LocalIssue.objects.in_bulk(content_ids)
+        return {pk: item.title for pk, item in items.items()}
+    return {}
+
+def calculate_sentiment_score(positive_count, negative_count, neutral_count):
+    """감성 점수 계산 (-1.0 ~ 1.0)"""
+    total = positive_count + negative_count + neutral_count
+    if total == 0:
+        return 0.0
+    
+    pos_ratio = positive_count / total
+    neg_ratio = negative_count / total
+    
+    return (pos_ratio - neg_ratio)
+
+def rebuild_sentiment_summaries(locations=None, dates=None):
+    """여러 지역/날짜의 감성 요약을 한 번에 재계산
+
+    감성별 개수는 (지역, 날짜, 감성) GROUP BY 한 번으로, 키워드는
+    긍정/부정 분석 결과를 한 번 스트리밍하며 집계한 뒤
+    모든 SentimentSummary를 단일 UPSERT로 저장한다.
+    """
+    from django.db.models import Count
+    from django.db.models.functions import TruncDate
+    from .models import Location, SentimentAnalysis, SentimentSummary
+    
+    if locations is None:
+        locations = Location.objects.all()
+    locations = list(locations)
+    dates = sorted(set(dates or [date.today()]))
+    if not locations:
+        return []
+    
+    location_ids = [location.id for location in locations]
+    analyses = SentimentAnalysis.objects.filter(
+        location_id__in=location_ids,
+        analyzed_at__date__gte=dates[0],
+        analyzed_at__date__lte=dates[-1]
+    ).annotate(day=TruncDate('analyzed_at'))
+    
+    # 1. (지역, 날짜, 감성)별 개수 - 단일 GROUP BY
+    counts = {}
+    rows = analyses.values('location_id', 'day', 'sentiment').annotate(count=Count('id')).order_by()
+    for row in rows:
+        counts[(row['location_id'], row['day'], row['sentiment'])] = row['count']
+    
+    # 2. 긍정/부정 키워드 스트리밍 집계
+    keyword_counts = {}
+    keyword_rows = analyses.filter(
+        sentiment__in=['positive', 'negative']
+    ).order_by('id').values_list('location_id', 'day', 'sentiment', 'keywords')
+    for location_id, day, sentiment, keywords in keyword_rows.iterator(chunk_size=2000):
+        counter = keyword_counts.setdefault((location_id, day, sentiment), Counter())
+        counter.update(keywords or [])
+    
+    # 3. 요약 객체 생성 후 단일 UPSERT
+    summaries = []
+    for location in locations:
+        for target_date in dates:
+            positive_count = counts.get((location.id, target_date, 'positive'), 0)
+            negative_count = counts.get((location.id, target_date, 'negative'), 0)
+            neutral_count = counts.get((location.id, target_date, 'neutral'), 0)
+            
+            top_keywords = {}
+            merged_counts = {}
+            for sentiment in ('positive', 'negative'):
+                counter = keyword_counts.get((location.id, target_date, sentiment), Counter())
+                top_keywords[sentiment] = [word for word, count in counter.most_common(5)]
+                merged_counts[sentiment] = dict(counter)
+            
+            summaries.append(SentimentSummary(
+                location=location,
+                date=target_date,
+                positive_count=positive_count,
+                negative_count=negative_count,
+                neutral_count=neutral_count,
+                sentiment_score=calculate_sentiment_score(
+                    positive_count, negative_count, neutral_count
+                ),
+                top_keywords=top_keywords,
+                keyword_counts=merged_counts
+            ))
+    
+    SentimentSummary.objects.bulk_create(
+        summaries,
+        update_conflicts=True,
+        unique_fields=['location', 'date'],
+        update_fields=['positive_count', 'negative_count', 'neutral_count',
+                       'sentiment_score', 'top_keywords', 'keyword_counts']
+    )
+    
+    return summaries
+
+def update_sentiment_summary(location, target_date=None):
+    """특정 지역의 감성 요약 업데이트"""
+    if target_date is None:
+        target_date = date.today()
     
-    return summary
\ No newline at end of file
+    return rebuild_sentiment_summaries([location], [target_date])[0]
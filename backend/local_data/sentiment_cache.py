@@ -0,0 +1,197 @@
+"""
+감성 분석 결과 캐시 (정규화 텍스트 해시 + 사전 버전 기반 LRU)
+"""
+import hashlib
+import logging
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_text(text):
+    """캐시 키용 텍스트 정규화 (NFC, 소문자, 공백 정리)"""
+    text = unicodedata.normalize('NFC', text)
+    return _WHITESPACE_RE.sub(' ', text.lower()).strip()
+
+
+def make_cache_key(text, lexicon_version):
+    """정규화 텍스트와 사전 버전으로 캐시 키 생성"""
+    normalized = normalize_text(text)
+    return hashlib.sha256(f"{lexicon_version}\0{normalized}".encode('utf-8')).hexdigest()
+
+
+def _copy_result(result):
+    """캐시된 결과가 호출 측에서 수정되지 않도록 복사"""
+    return {
+        'sentiment': result['sentiment'],
+        'confidence': result['confidence'],
+        'keywords': list(result['keywords']),
+        'tokens': list(result.get('tokens', []))
+    }
+
+
+class SentimentResultCache:
+    """감성 분석 결과 LRU 캐시
+
+    메모리 LRU를 우선 조회하고, persistent가 켜져 있으면
+    SentimentCacheEntry 테이블을 2차 저장소로 사용한다.
+    """
+
+    def __init__(self, max_size=20000, persistent=False, batch_size=500):
+        self.max_size = max_size
+        self.persistent = persistent
+        self.batch_size = batch_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.persistent_hits = 0
+
+    def get(self, key):
+        """캐시 조회 (없으면 None)"""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys):
+        """여러 키를 한 번에 조회 ({key: 결과}, 없는 키는 빠짐)
+
+        메모리에 없는 키는 persistent 테이블에서 배치당 한 번의 IN 쿼리로 조회한다.
+        """
+        found = {}
+        missing = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                result = self._entries.get(key)
+                if result is None:
+                    missing.append(key)
+                    continue
+                self._entries.move_to_end(key)
+                self.hits += 1
+                found[key] = _copy_result(result)
+
+        if self.persistent and missing:
+            loaded = self._load_persistent(missing)
+            for key, result in loaded.items():
+                self._store_memory(key, result)
+                found[key] = _copy_result(result)
+            with self._lock:
+                self.persistent_hits += len(loaded)
+                self.hits += len(loaded)
+            missing = [key for key in missing if key not in loaded]
+
+        with self._lock:
+            self.misses += len(missing)
+        return found
+
+    def set(self, key, result, lexicon_version=''):
+        """캐시 저장"""
+        self.set_many({key: result}, lexicon_version)
+
+    def set_many(self, results, lexicon_version=''):
+        """여러 결과({key: 결과})를 한 번에 저장 (persistent 테이블은 배치당 bulk_create 한 번)"""
+        for key, result in results.items():
+            self._store_memory(key, result)
+        if self.persistent and results:
+            self._save_persistent(results, lexicon_version)
+
+    def _store_memory(self, key, result):
+        with self._lock:
+            self._entries[key] = _copy_result(result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def _load_persistent(self, keys):
+        from .models import SentimentCacheEntry
+        loaded = {}
+        try:
+            for start in range(0, len(keys), self.batch_size):
+                entries = SentimentCacheEntry.objects.filter(
+                    text_hash__in=keys[start:start + self.batch_size]
+                ).values_list('text_hash', 'sentiment', 'confidence', 'keywords', 'tokens')
+                for text_hash, sentiment, confidence, keywords, tokens in entries:
+                    loaded[text_hash] = {
+                        'sentiment': sentiment,
+                        'confidence': confidence,
+                        'keywords': keywords,
+                        'tokens': tokens
+                    }
+        except Exception as e:
+            logger.warning(f"감성 캐시 테이블 조회 실패: {e}")
+        return loaded
+
+    def _save_persistent(self, results, lexicon_version):
+        from .models import SentimentCacheEntry
+        try:
+            SentimentCacheEntry.objects.bulk_create([
+                SentimentCacheEntry(
+                    text_hash=key,
+                    lexicon_version=lexicon_version,
+                    sentiment=result['sentiment'],
+                    confidence=result['confidence'],
+                    keywords=result['keywords'],
+                    tokens=result.get('tokens', [])
+                )
+                for key, result in results.items()
+            ], batch_size=self.batch_size, ignore_conflicts=True)
+        except Exception as e:
+            logger.warning(f"감성 캐시 테이블 저장 실패: {e}")
+
+    def prune_versions(self, lexicon_version):
+        """현재 사전 버전이 아닌 persistent 캐시 행 삭제 (키에 버전이 들어가므로 다시 조회될 일이 없음)"""
+        if not self.persistent:
+            return 0
+        from .models import SentimentCacheEntry
+        try:
+            deleted, _ = SentimentCacheEntry.objects.exclude(lexicon_version=lexicon_version).delete()
+        except Exception as e:
+            logger.warning(f"감성 캐시 이전 버전 삭제 실패: {e}")
+            return 0
+        if deleted:
+            logger.info(f"감성 캐시 이전 사전 버전 {deleted}건 삭제")
+        return deleted
+
+    def clear(self):
+        """메모리 캐시 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        """히트/미스/제거 횟수 반환"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'persistent_hits': self.persistent_hits,
+                'hit_rate': (self.hits / lookups) if lookups else 0.0
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_sentiment_cache():
+    """settings.SENTIMENT_CACHE 설정으로 프로세스 공유 캐시 반환"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from django.conf import settings
+                options = getattr(settings, 'SENTIMENT_CACHE', {})
+                _cache = SentimentResultCache(
+                    max_size=options.get('MAX_SIZE', 20000),
+                    persistent=options.get('PERSISTENT', False),
+                    batch_size=options.get('BATCH_SIZE', 500)
+                )
+    return _cache
@@ -5,11 +5,20 @@ import os
 import requests
 from pathlib import Path
 
+RESOURCE_DIR = Path(__file__).parent / 'resources'
+
 class SentimentResourceManager:
+    RESOURCE_FILES = ('positive_words.txt', 'negative_words.txt', 'korean_stopwords.txt')
+    
     def __init__(self):
-        self.resource_dir = Path(__file__).parent / 'resources'
+        self.resource_dir = RESOURCE_DIR
         self.resource_dir.mkdir(exist_ok=True)
     
+    @classmethod
+    def resource_files(cls):
+        """분석기가 읽는 사전 파일 경로 목록"""
+        return [RESOURCE_DIR / name for name in cls.RESOURCE_FILES]
+    
     def download_korean_stopwords(self):
         """한국어 불용어 사전 다운로드"""
         url = "https://raw.githubusercontent.com/stopwords-iso/stopwords-ko/master/stopwords-ko.txt"
@@ -4,6 +4,7 @@ import re
 from datetime import datetime, timedelta
 from urllib.parse import quote
 import time
+from .youtube_extractor import iter_videos, parse_published_text
 
 class LocalIssueCrawler:
     """간단한 동기 크롤러"""
@@ -71,26 +72,18 @@ class LocalIssueCrawler:
             response = self.session.get(search_url, timeout=20)
             
             if response.status_code == 200:
-                # 정규식으로 빠른 추출
-                video_ids = re.findall(r'"videoId":"([^"]+)"', response.text)[:limit]
-                titles = re.findall(r'"title":{"runs":\[{"text":"([^"]+)"', response.text)[:limit]
-                view_counts = re.findall(r'"viewCountText":{"simpleText":"([^"]+)"', response.text)[:limit]
-                
-                for i, (video_id, title) in enumerate(zip(video_ids, titles)):
-                    if i >= limit:
-                        break
-                    
-                    view_count = 0
-                    if i < len(view_counts):
-                        view_count = self._parse_view_count(view_counts[i])
-                    
+                # 페이지의 ytInitialData에서 영상별로 id/제목/조회수를 함께 추출
+                now = datetime.now()
+                for video in iter_videos(response.text):
                     results.append({
                         'source': 'youtube',
-                        'title': title.replace('\\', ''),
-                        'url': f"https://www.youtube.com/watch?v={video_id}",
-                        'view_count': view_count,
-                        'published_at': datetime.now() - timedelta(hours=2)
+                        'title': video.title,
+                        'url': f"https://www.youtube.com/watch?v={video.video_id}",
+                        'view_count': self._parse_view_count(video.view_text),
+                        'published_at': parse_published_text(video.published_text, now) or now - timedelta(hours=2)
                     })
+                    if len(results) >= limit:
+                        break
                     
         except Exception as e:
             print(f"유튜브 크롤링 오류: {e}")
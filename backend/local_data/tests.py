@@ -1,3 +1,343 @@
-from django.test import TestCase
+import json
+import random
+from datetime import datetime, timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from .forecast_table import ForecastTable
+from .lexicon_matcher import LexiconMatcher
+from .sentiment_analyzer import SimpleSentimentAnalyzer
+from .weather_service import WeatherService
+from .youtube_extractor import YoutubeVideo, _legacy_extract, iter_videos, parse_published_text
+
+
+def make_lexicon_analyzer(positive_words, negative_words, neutral_words):
+    """외부 사전/형태소 분석기 없이 지정한 사전으로 분석기 생성
+
+    형태소 분석 대신 공백 단위 토큰(2자 이상)을 추출 키워드로 사용한다.
+    """
+    analyzer = SimpleSentimentAnalyzer.__new__(SimpleSentimentAnalyzer)
+    analyzer.positive_words = list(positive_words)
+    analyzer.negative_words = list(negative_words)
+    analyzer.neutral_words = list(neutral_words)
+    analyzer.stopwords = set()
+    analyzer.okt = None
+    analyzer.matcher = LexiconMatcher({
+        'positive': analyzer.positive_words,
+        'negative': analyzer.negative_words,
+        'neutral': analyzer.neutral_words
+    })
+    analyzer._extract_keywords_konlpy = lambda text, top_k=5: [
+        word for word in text.split() if len(word) > 1
+    ][:top_k]
+    return analyzer
+
+
+def legacy_analyze(analyzer, text):
+    """오토마톤 도입 전의 사전 단어별 부분 문자열 검색으로 감성 점수 계산 (비교 기준)"""
+    text = text.lower()
+    extracted_keywords = analyzer._extract_keywords_konlpy(text)
+
+    pos_score = 0
+    neg_score = 0
+    neu_score = 0
+    found_keywords = []
+
+    for keyword in extracted_keywords:
+        if any(pos_word in keyword for pos_word in analyzer.positive_words):
+            pos_score += 2
+            found_keywords.append(keyword)
+        elif any(neg_word in keyword for neg_word in analyzer.negative_words):
+            neg_score += 2
+            found_keywords.append(keyword)
+        elif any(neu_word in keyword for neu_word in analyzer.neutral_words):
+            neu_score += 1
+            found_keywords.append(keyword)
+
+    for word in analyzer.positive_words:
+        if word in text and word not in found_keywords:
+            pos_score += 1
+            found_keywords.append(word)
+
+    for word in analyzer.negative_words:
+        if word in text and word not in found_keywords:
+            neg_score += 1
+            found_keywords.append(word)
+
+    total_score = pos_score + neg_score + neu_score
+    if total_score == 0:
+        return {'sentiment': 'neutral', 'confidence': 0.1, 'keywords': extracted_keywords[:3]}
+
+    if pos_score > neg_score:
+        sentiment = 'positive'
+        confidence = min(pos_score / (pos_score + neg_score + 1), 0.9)
+    elif neg_score > pos_score:
+        sentiment = 'negative'
+        confidence = min(neg_score / (pos_score + neg_score + 1), 0.9)
+    else:
+        sentiment = 'neutral'
+        confidence = 0.5
+    return {'sentiment': sentiment, 'confidence': confidence, 'keywords': list(set(found_keywords))[:5]}
+
+
+class LexiconMatcherEquivalenceTest(SimpleTestCase):
+    """오토마톤 매칭이 기존 부분 문자열 검색과 같은 결과를 내는지 확인"""
+
+    # 중첩(만족 ⊂ 불만족, 새로 ⊂ 새로운, 개선 ⊂ 개선안), 겹침(사고/고장),
+    # 두 사전에 모두 있는 단어(변경)를 포함
+    POSITIVE = ['만족', '새로', '새로운', '개선', '개선안', '개통', '변경', '축제']
+    NEGATIVE = ['불만', '불만족', '사고', '고장', '지연', '민원', '변경', '폐쇄']
+    NEUTRAL = ['안내', '공지', '일정']
+
+    # 문장마다 찾는 키워드가 5개 이하라서 결과 keywords 잘림이 순서에 좌우되지 않음
+    SENTENCES = [
+        '주민 불만족 민원 증가',
+        '새로운 공원 개선안 확정',
+        '교통사고장 부근 지연',
+        '도로 변경 일정 안내',
+        '지하철 개통 축제 개최',
+        '불만 없이 만족',
+        '공지 사항 없음',
+        '오늘 날씨 맑음',
+        '',
+    ]
+
+    def setUp(self):
+        self.analyzer = make_lexicon_analyzer(self.POSITIVE, self.NEGATIVE, self.NEUTRAL)
+
+    def test_find_words_matches_substring_search(self):
+        words = set(self.POSITIVE + self.NEGATIVE + self.NEUTRAL)
+        for text in self.SENTENCES:
+            with self.subTest(text=text):
+                expected = {word for word in words if word in text}
+                self.assertEqual(self.analyzer.matcher.find_words(text), expected)
+
+    def test_polarities_include_every_lexicon(self):
+        self.assertEqual(self.analyzer.matcher.polarities['변경'], frozenset({'positive', 'negative'}))
+        self.assertEqual(
+            self.analyzer.matcher.find_polarities('불만족'),
+            frozenset({'positive', 'negative'})
+        )
+        self.assertEqual(self.analyzer.matcher.find_polarities('맑음'), frozenset())
+
+    def test_scores_match_legacy_substring_logic(self):
+        for text in self.SENTENCES:
+            if not text:
+                continue
+            with self.subTest(text=text):
+                expected = legacy_analyze(self.analyzer, text)
+                result = self.analyzer._analyze_uncached(text)
+                self.assertEqual(result['sentiment'], expected['sentiment'])
+                self.assertEqual(result['confidence'], expected['confidence'])
+                self.assertEqual(sorted(result['keywords']), sorted(expected['keywords']))
+
+    def test_random_texts_match_substring_search(self):
+        rng = random.Random(36)
+        syllables = ['불', '만', '족', '새', '로', '운', '사', '고', '장', '개', '선', '안']
+        words = set(self.POSITIVE + self.NEGATIVE + self.NEUTRAL)
+        for _ in range(500):
+            text = ''.join(rng.choice(syllables + [' ']) for _ in range(rng.randint(1, 20)))
+            self.assertEqual(
+                self.analyzer.matcher.find_words(text),
+                {word for word in words if word in text}
+            )
+
+
+# 기상청 getVilageFcst 응답 (2025-07-01 05시 발표, 격자 61/125)을 줄인 것
+# (fcstDate, fcstTime, {category: fcstValue}) - 12시는 SKY가 빠져 있고, 15시는 표에 쓰지 않는 TMX만 있음
+KMA_FORECAST_SLOTS = [
+    ('20250701', '0900', {'TMP': '24', 'UUU': '0.5', 'VVV': '-1.1', 'VEC': '335', 'WSD': '1.2', 'SKY': '1',
+                          'PTY': '0', 'POP': '0', 'PCP': '강수없음', 'REH': '70', 'SNO': '적설없음'}),
+    ('20250701', '1000', {'TMP': '25', 'UUU': '1.4', 'VVV': '-1.9', 'VEC': '324', 'WSD': '2.36', 'SKY': '3',
+                          'PTY': '0', 'POP': '20', 'PCP': '강수없음', 'REH': '65', 'SNO': '적설없음'}),
+    ('20250701', '1100', {'TMP': '26', 'UUU': '2.1', 'VVV': '-2.2', 'VEC': '316', 'WSD': '3.0', 'SKY': '4',
+                          'PTY': '1', 'POP': '60', 'PCP': '1.0mm', 'REH': '80', 'SNO': '적설없음'}),
+    ('20250701', '1200', {'TMP': '27', 'UUU': '1.5', 'VVV': '-1.4', 'VEC': '313', 'WSD': '2.1',
+                          'PTY': '0', 'POP': '30', 'PCP': '강수없음', 'REH': '75', 'SNO': '적설없음'}),
+    ('20250701', '1300', {'TMP': '28', 'UUU': '1.0', 'VVV': '-1.1', 'VEC': '318', 'WSD': '1.5', 'SKY': '1',
+                          'PTY': '0', 'POP': '10', 'PCP': '강수없음', 'REH': '55', 'SNO': '적설없음'}),
+    ('20250701', '1400', {'TMP': '29', 'UUU': '3.1', 'VVV': '-3.1', 'VEC': '315', 'WSD': '4.4', 'SKY': '3',
+                          'PTY': '4', 'POP': '70', 'PCP': '5.0mm', 'REH': '85', 'SNO': '적설없음'}),
+    ('20250701', '1500', {'TMX': '29.0'}),
+    ('20250702', '0000', {'TMP': '21', 'UUU': '0.3', 'VVV': '-0.7', 'VEC': '337', 'WSD': '0.8', 'SKY': '1',
+                          'PTY': '0', 'POP': '0', 'PCP': '강수없음', 'REH': '90', 'SNO': '적설없음'}),
+    ('20250702', '1200', {'TMP': '31', 'UUU': '1.8', 'VVV': '-2.0', 'VEC': '318', 'WSD': '2.7', 'SKY': '3',
+                          'PTY': '0', 'POP': '30', 'PCP': '강수없음', 'REH': '60', 'SNO': '적설없음'}),
+]
+
+KMA_FORECAST_PAYLOAD = {
+    'response': {
+        'header': {'resultCode': '00', 'resultMsg': 'NORMAL_SERVICE'},
+        'body': {
+            'dataType': 'JSON',
+            'items': {'item': [
+                {
+                    'baseDate': '20250701',
+                    'baseTime': '0500',
+                    'category': category,
+                    'fcstDate': fcst_date,
+                    'fcstTime': fcst_time,
+                    'fcstValue': value,
+                    'nx': 61,
+                    'ny': 125
+                }
+                for fcst_date, fcst_time, values in KMA_FORECAST_SLOTS
+                for category, value in values.items()
+            ]},
+            'pageNo': 1,
+            'numOfRows': 1000,
+            'totalCount': sum(len(values) for _, _, values in KMA_FORECAST_SLOTS)
+        }
+    }
+}
+
+
+class ForecastParsingTest(SimpleTestCase):
+    """저장된 단기예보 응답을 예보 표로 피벗해서 화면 응답까지 만드는 과정 확인"""
+
+    NOW = datetime(2025, 7, 1, 10, 30)
+
+    def setUp(self):
+        self.table = ForecastTable.from_api_data(KMA_FORECAST_PAYLOAD)
+
+    def test_table_pivots_tracked_categories(self):
+        self.assertEqual(self.table.base, ('20250701', '0500'))
+        # TMX만 있는 15시는 행이 되지 않음
+        self.assertEqual([hour for _, hour in self.table.slots], [9, 10, 11, 12, 13, 14, 0, 12])
+        self.assertEqual(self.table.value('POP', 2), 60)
+        self.assertEqual(self.table.value('REH', 2), 80)
+        self.assertAlmostEqual(self.table.value('WSD', 1), 2.36, places=5)  # 실수 열은 float32
+        self.assertFalse(self.table.has('SKY', 3))
+
+    def test_invalid_payload_raises(self):
+        with self.assertRaises(ValueError):
+            ForecastTable.from_api_data({'response': {'header': {'resultCode': '03'}}})
+        with self.assertRaises(ValueError):
+            ForecastTable.from_api_data({'response': {'body': {'items': {'item': []}}}})
+
+    def test_format_weather(self):
+        with mock.patch('local_data.weather_service.datetime') as mocked_datetime:
+            mocked_datetime.now.return_value = self.NOW
+            result = WeatherService()._format_weather(self.table)
+
+        self.assertEqual(result, {
+            'temp': '25°C',
+            'condition': '구름많음',
+            'dust': '보통',
+            'description': '외출하기 좋은 날씨예요',
+            'humidity': 65,
+            'wind_speed': 2.4,
+            'pop': 20,
+            # 12시는 하늘상태가 없어 건너뜀
+            'hourly_forecast': [
+                {'time': '11:00', 'temp': '26°C', 'condition': '비', 'pop': 60},
+                {'time': '13:00', 'temp': '28°C', 'condition': '맑음', 'pop': 10},
+                {'time': '14:00', 'temp': '29°C', 'condition': '소나기', 'pop': 70},
+            ],
+            'daily_forecast': [
+                {'date': '07/01', 'min_temp': '24°C', 'max_temp': '29°C', 'pop': 70},
+                {'date': '07/02', 'min_temp': '21°C', 'max_temp': '31°C', 'pop': 30},
+            ]
+        })
+
+    def test_current_falls_back_to_first_slot_of_day(self):
+        current = self.table.current(datetime(2025, 7, 1, 23, 0))
+        self.assertEqual(current, {
+            'time': '09:00', 'temp': '24°C', 'condition': '맑음', 'pop': 0, 'humidity': 70, 'wind_speed': 1.2
+        })
+
+
+def make_search_page(initial_data_json):
+    """ytInitialData JSON 문자열을 검색 결과 페이지 HTML로 감쌈"""
+    return (
+        "<html><head><script>var ytcfg = {};</script></head><body>"
+        f"<script>var ytInitialData = {initial_data_json};</script>"
+        "</body></html>"
+    )
+
+
+def video_renderer(video_id, title, view_text=None, published_text=None):
+    renderer = {'videoId': video_id, 'title': {'runs': [{'text': title}]}}
+    if view_text is not None:
+        renderer['viewCountText'] = {'simpleText': view_text}
+    if published_text is not None:
+        renderer['publishedTimeText'] = {'simpleText': published_text}
+    return {'videoRenderer': renderer}
+
+
+def search_results_json(items):
+    return json.dumps({'contents': {'sectionListRenderer': {'contents': [
+        {'itemSectionRenderer': {'contents': items}}
+    ]}}}, ensure_ascii=False, separators=(',', ':'))
+
+
+class YoutubeExtractorTest(SimpleTestCase):
+    """ytInitialData videoRenderer 추출과 게시 시각 해석 확인"""
+
+    def test_video_without_view_count_keeps_its_own_fields(self):
+        html = make_search_page(search_results_json([
+            video_renderer('live0001', '강남구 실시간 방송'),
+            video_renderer('vid00002', '강남구 축제 현장', '조회수 3.1만회', '2일 전'),
+        ]))
+
+        self.assertEqual(list(iter_videos(html)), [
+            YoutubeVideo('live0001', '강남구 실시간 방송', '', ''),
+            YoutubeVideo('vid00002', '강남구 축제 현장', '조회수 3.1만회', '2일 전'),
+        ])
+        # 기존 정규식은 조회수 없는 영상을 다음 영상의 조회수와 짝지음
+        self.assertEqual(_legacy_extract(html, 10), [('live0001', '강남구 실시간 방송', '조회수 3.1만회')])
+
+    def test_duplicate_video_is_returned_once(self):
+        html = make_search_page(search_results_json([
+            video_renderer('vid00001', '첫 번째 제목', '조회수 10회'),
+            video_renderer('vid00002', '다른 영상', '조회수 20회'),
+            video_renderer('vid00001', '추천 선반의 같은 영상', '조회수 11회'),
+        ]))
+
+        videos = list(iter_videos(html))
+        self.assertEqual([video.video_id for video in videos], ['vid00001', 'vid00002'])
+        self.assertEqual(videos[0].title, '첫 번째 제목')
+
+    def test_malformed_renderer_is_skipped(self):
+        good = search_results_json([video_renderer('vid00002', '정상 영상', '조회수 5회')])
+        # 작은따옴표 키는 JSON이 아니므로 raw_decode가 거부하고, 문자열 값은 객체가 아니라 무시됨
+        html = make_search_page(
+            '{"broken":[{"videoRenderer":{"videoId":"bad00001",\'title\':{}}},'
+            '{"videoRenderer":"placeholder"},'
+            '{"videoRenderer":{"videoId":"notitle1"}}],'
+            f'"rest":{good}}}'
+        )
+
+        self.assertEqual(list(iter_videos(html)), [YoutubeVideo('vid00002', '정상 영상', '조회수 5회', '')])
+
+    def test_page_without_initial_data(self):
+        self.assertEqual(list(iter_videos('<html><body>검색 결과 없음</body></html>')), [])
+
+    def test_parse_published_text(self):
+        now = datetime(2025, 7, 1, 12, 0)
+        cases = [
+            ('10초 전', timedelta(seconds=10)),
+            ('5분 전', timedelta(minutes=5)),
+            ('3시간 전', timedelta(hours=3)),
+            ('스트리밍 시간: 4일 전', timedelta(days=4)),
+            ('2주 전', timedelta(weeks=2)),
+            ('1개월 전', timedelta(days=30)),
+            ('2달 전', timedelta(days=60)),
+            ('1년 전', timedelta(days=365)),
+            ('30 seconds ago', timedelta(seconds=30)),
+            ('1 minute ago', timedelta(minutes=1)),
+            ('5 minutes ago', timedelta(minutes=5)),
+            ('Streamed 2 hours ago', timedelta(hours=2)),
+            ('Streamed 2 days ago', timedelta(days=2)),
+            ('3 weeks ago', timedelta(weeks=3)),
+            ('6 months ago', timedelta(days=180)),
+            ('1 Year ago', timedelta(days=365)),
+        ]
+        for text, delta in cases:
+            with self.subTest(text=text):
+                self.assertEqual(parse_published_text(text, now), now - delta)
+
+        for text in ('', None, 'Premieres soon', '최초 공개 예정', '3 fortnights ago'):
+            with self.subTest(text=text):
+                self.assertIsNone(parse_published_text(text, now))
@@ -0,0 +1,239 @@
+"""
+URL 정규화 및 수집 URL 색인 - Bloom filter 스냅샷 + LocalIssue.url_hash 컬럼으로 구/날짜 구분 없이 중복 제거
+"""
+import re
+import math
+import hashlib
+import logging
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# 같은 글을 가리키지만 유입 경로만 다른 쿼리 파라미터
+TRACKING_PARAMS = {'fbclid', 'gclid', 'igshid', 'ref_src', 'spm'}
+_NAVER_ARTICLE_PATH = re.compile(r'^/(?:mnews/)?article/(\d+)/(\d+)')
+
+
+def canonicalize_url(url):
+    """저장용 정규화 URL
+    
+    호스트 소문자화, 기본 포트/fragment/추적 파라미터 제거, 쿼리 정렬.
+    YouTube 영상과 네이버 뉴스 기사는 주소 형태가 여러 가지라 하나의 형태로 통일한다.
+    """
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    
+    scheme = (parts.scheme or 'https').lower()
+    host = (parts.hostname or '').lower()
+    netloc = host if port in (None, 80, 443) else f"{host}:{port}"
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith('utm_')
+    ]
+    
+    bare_host = _strip_host_prefix(host)
+    if bare_host in ('youtube.com', 'youtu.be'):
+        video_id = _youtube_video_id(bare_host, path, query)
+        if video_id:
+            return f"https://www.youtube.com/watch?v={video_id}"
+    
+    if bare_host.endswith('news.naver.com'):
+        article = _NAVER_ARTICLE_PATH.match(path)
+        params = dict(query)
+        if article:
+            return f"https://n.news.naver.com/article/{article.group(1)}/{article.group(2)}"
+        if params.get('oid') and params.get('aid'):
+            return f"https://n.news.naver.com/article/{params['oid']}/{params['aid']}"
+    
+    return urlunsplit((scheme, netloc, path, urlencode(sorted(query)), ''))
+
+
+def _strip_host_prefix(host):
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            return host[len(prefix):]
+    return host
+
+
+def _youtube_video_id(host, path, query):
+    if host == 'youtu.be':
+        return path.strip('/') or None
+    if path == '/watch':
+        return dict(query).get('v')
+    for prefix in ('/shorts/', '/live/', '/embed/'):
+        if path.startswith(prefix):
+            return path[len(prefix):].split('/')[0] or None
+    return None
+
+
+def url_hash(url):
+    """중복 판정용 고정 길이 해시 (SHA-1 hex 40자)
+    
+    정규화 URL에서 scheme과 www./m. 접두어까지 빼고 해시하므로
+    http/https, PC/모바일 주소가 같은 해시가 된다.
+    """
+    parts = urlsplit(canonicalize_url(url))
+    key = _strip_host_prefix(parts.netloc) + urlunsplit(('', '', parts.path, parts.query, ''))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+
+class BloomFilter:
+    """SHA-1 hex 해시를 받는 Bloom filter (이중 해싱으로 hash_count개 비트 위치 계산)"""
+    
+    def __init__(self, capacity=1_000_000, error_rate=0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+        # 색인에 반영한 마지막 LocalIssue id (스냅샷 이후 추가분만 따라잡기 위함)
+        self.last_id = 0
+    
+    def _positions(self, digest):
+        h1 = int(digest[:16], 16)
+        h2 = int(digest[16:32], 16) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+    
+    def add(self, digest):
+        for position in self._positions(digest):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, digest):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+
+class SeenUrlIndex:
+    """이미 저장된 이슈 URL 색인
+    
+    - Bloom filter에 없으면 새 URL로 판정 (DB 조회 없음)
+    - Bloom filter에 있으면 배치 단위로 url_hash를 한 번에 조회해 확인 (오탐 제거)
+    - 필터는 공유 캐시에 스냅샷으로 저장하고, 불러올 때 스냅샷 이후 추가된 행만 반영한다.
+    """
+    
+    SNAPSHOT_KEY = 'local_data:seen-urls:bloom'
+    
+    def __init__(self, capacity=1_000_000, error_rate=0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bloom = None
+        self._lock = threading.Lock()
+        
+        self.checked = 0
+        self.bloom_negative = 0
+        self.duplicates = 0
+        self.false_positives = 0
+    
+    def refresh(self):
+        """스냅샷을 불러오고(처음 한 번) DB에 새로 저장된 URL 해시를 반영"""
+        with self._lock:
+            if self.bloom is None:
+                snapshot = cache.get(self.SNAPSHOT_KEY)
+                if isinstance(snapshot, BloomFilter) and snapshot.capacity >= self.capacity:
+                    self.bloom = snapshot
+                else:
+                    self.bloom = BloomFilter(self.capacity, self.error_rate)
+            
+            self._catch_up()
+            
+            # 용량을 넘으면 오탐률이 올라가므로 두 배 크기로 다시 생성
+            if self.bloom.count > self.bloom.capacity:
+                logger.info(f"URL 색인 재생성 (항목 {self.bloom.count}개 > 용량 {self.bloom.capacity}개)")
+                self.bloom = BloomFilter(self.bloom.capacity * 2, self.error_rate)
+                self._catch_up()
+    
+    def _catch_up(self):
+        from .models import LocalIssue
+        
+        rows = (
+            LocalIssue.objects.filter(id__gt=self.bloom.last_id, url_hash__isnull=False)
+            .order_by('id').values_list('id', 'url_hash')
+        )
+        for issue_id, digest in rows.iterator(chunk_size=5000):
+            self.bloom.add(digest)
+            self.bloom.last_id = issue_id
+    
+    def filter_new(self, results):
+        """저장된 적 없는 결과만 반환 (배치 안의 중복과 URL 없는 결과도 제거)
+        
+        반환되는 결과는 복사본이며 url은 정규화 URL로 바뀌고 url_hash가 추가된다.
+        """
+        from .models import LocalIssue
+        
+        self.refresh()
+        
+        candidates = []
+        batch_hashes = set()
+        for result in results:
+            # 링크 없는 결과는 저장 대상이 아님
+            if not result.get('url'):
+                continue
+            url = canonicalize_url(result['url'])
+            digest = url_hash(url)
+            if digest in batch_hashes:
+                continue
+            batch_hashes.add(digest)
+            candidates.append(dict(result, url=url, url_hash=digest))
+        
+        with self._lock:
+            maybe_seen = [result['url_hash'] for result in candidates if result['url_hash'] in self.bloom]
+        
+        existing = set()
+        if maybe_seen:
+            existing = set(
+                LocalIssue.objects.filter(url_hash__in=maybe_seen).values_list('url_hash', flat=True)
+            )
+        
+        with self._lock:
+            self.checked += len(candidates)
+            self.bloom_negative += len(candidates) - len(maybe_seen)
+            self.duplicates += len(existing)
+            self.false_positives += len(maybe_seen) - len(existing)
+        
+        return [result for result in candidates if result['url_hash'] not in existing]
+    
+    def clear(self):
+        """전체 이슈 삭제 후 호출 - 스냅샷을 지우고 빈 필터로 다시 시작"""
+        with self._lock:
+            self.bloom = None
+            cache.delete(self.SNAPSHOT_KEY)
+    
+    def save(self):
+        """현재 필터를 공유 캐시에 스냅샷으로 저장"""
+        with self._lock:
+            if self.bloom is not None:
+                cache.set(self.SNAPSHOT_KEY, self.bloom, None)
+    
+    def get_stats(self):
+        with self._lock:
+            return {
+                'indexed': self.bloom.count if self.bloom else 0,
+                'checked': self.checked,
+                'bloom_negative': self.bloom_negative,
+                'duplicates': self.duplicates,
+                'false_positives': self.false_positives
+            }
+
+
+_seen_url_index = None
+_seen_url_index_lock = threading.Lock()
+
+
+def get_seen_url_index():
+    """프로세스 공유 수집 URL 색인 반환"""
+    global _seen_url_index
+    if _seen_url_index is None:
+        with _seen_url_index_lock:
+            if _seen_url_index is None:
+                _seen_url_index = SeenUrlIndex()
+    return _seen_url_index
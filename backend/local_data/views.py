@@ -1,9 +1,11 @@
 from django.shortcuts import render, get_object_or_404
 from django.http import JsonResponse
 from django.utils import timezone
+from django.db.models import Case, When, Value, F, FloatField, Exists, OuterRef
+from django.db.models.functions import Abs
 from datetime import date, timedelta
 from .models import Location, SentimentSummary, SentimentAnalysis, RawData, DistrictAnnouncement, LocalIssue
-from .sentiment_analyzer import SimpleSentimentAnalyzer, update_sentiment_summary
+from .sentiment_analyzer import update_sentiment_summary
 
 def briefing_view(request):
     """실제 데이터 기반 브리핑 뷰"""
@@ -64,38 +66,68 @@ def briefing_view(request):
     }
     return render(request, 'briefing.html', briefing_data)
 
-def get_top_impact_content(location, target_date):
+def _sentiment_weight():
+    """감성 가중치 SQL 표현식 (긍정 1, 부정 -1, 중립 0)"""
+    return Case(
+        When(sentiment='positive', then=Value(1.0)),
+        When(sentiment='negative', then=Value(-1.0)),
+        default=Value(0.0),
+        output_field=FloatField()
+    )
+
+CONTENT_MODELS = {
+    'raw_data': RawData,
+    'district_announcement': DistrictAnnouncement,
+    'local_issue': LocalIssue,
+}
+
+def _load_contents(analyses):
+    """분석 결과가 가리키는 원본 콘텐츠를 타입별 in_bulk 한 번씩으로 조회"""
+    ids_by_type = {}
+    for analysis in analyses:
+        ids_by_type.setdefault(analysis.content_type, []).append(analysis.content_id)
+    
+    contents = {}
+    for content_type, content_ids in ids_by_type.items():
+        model = CONTENT_MODELS.get(content_type)
+        if model is None:
+            continue
+        for pk, obj in model.objects.in_bulk(content_ids).items():
+            contents[(content_type, pk)] = obj
+    return contents
+
+def get_top_impact_content(location, target_date, limit=5):
     """감성 온도에 가장 영향을 많이 준 상위 5개 콘텐츠 추출"""
-    analyses = SentimentAnalysis.objects.filter(
+    # 영향도 계산 및 정렬은 SQL에서 처리하고 상위 N개만 조회
+    analyses = list(SentimentAnalysis.objects.filter(
         location=location,
-        analyzed_at__date=target_date
-    )
+        analyzed_at__date=target_date,
+        content_type='local_issue'
+    ).filter(
+        Exists(LocalIssue.objects.filter(id=OuterRef('content_id')))
+    ).annotate(
+        impact_score=Abs(F('confidence') * _sentiment_weight() * 100)
+    ).order_by('-impact_score', '-id')[:limit])
     
-    impact_items = []
+    issues = LocalIssue.objects.in_bulk([analysis.content_id for analysis in analyses])
     
+    impact_items = []
     for analysis in analyses:
-        if analysis.content_type == 'local_issue':
-            try:
-                issue = LocalIssue.objects.get(id=analysis.content_id)
-                # 영향도 계산
-                sentiment_weight = 1 if analysis.sentiment == 'positive' else -1 if analysis.sentiment == 'negative' else 0
-                impact_score = abs(analysis.confidence * sentiment_weight * 100)
-                
-                impact_items.append({
-                    'title': issue.title,
-                    'url': issue.url,
-                    'source': issue.get_source_display(),
-                    'source_type': issue.source,
-                    'sentiment': analysis.sentiment,
-                    'impact_score': impact_score,
-                    'view_count': issue.view_count
-                })
-            except LocalIssue.DoesNotExist:
-                continue
+        issue = issues.get(analysis.content_id)
+        if issue is None:
+            continue
+        
+        impact_items.append({
+            'title': issue.title,
+            'url': issue.url,
+            'source': issue.get_source_display(),
+            'source_type': issue.source,
+            'sentiment': analysis.sentiment,
+            'impact_score': analysis.impact_score,
+            'view_count': issue.view_count
+        })
     
-    # 영향도 높은 순으로 정렬 후 상위 5개 반환
-    impact_items.sort(key=lambda x: x['impact_score'], reverse=True)
-    return impact_items[:5]
+    return impact_items
 
 
 
@@ -204,11 +236,16 @@ def sentiment_details_api(request, location_id):
     location = get_object_or_404(Location, id=location_id)
     today = date.today()
     
-    # 오늘의 감성 분석 데이터 가져오기
-    analyses = SentimentAnalysis.objects.filter(
+    # 오늘의 감성 분석 데이터 가져오기 (영향도는 SQL에서 계산)
+    analyses = list(SentimentAnalysis.objects.filter(
         location=location,
         analyzed_at__date=today
-    ).order_by('-confidence')[:10]  # 신뢰도 높은 순으로 10개
+    ).annotate(
+        impact=F('confidence') * _sentiment_weight() * 10  # 10도 만점으로 스케일링
+    ).order_by('-confidence')[:10])  # 신뢰도 높은 순으로 10개
+    
+    # 원본 데이터를 타입별로 한 번에 조회
+    contents = _load_contents(analyses)
     
     details = []
     
@@ -216,34 +253,22 @@ def sentiment_details_api(request, location_id):
         # 원본 데이터 찾기
         title = ""
         source = ""
+        content = contents.get((analysis.content_type, analysis.content_id))
+        
+        if analysis.content_type in CONTENT_MODELS and content is None:
+            continue
         
         if analysis.content_type == 'raw_data':
-            try:
-                raw_data = RawData.objects.get(id=analysis.content_id)
-                title = raw_data.title or raw_data.content[:50]
-                source = f"{raw_data.get_category_display()}"
-            except RawData.DoesNotExist:
-                continue
-                
+            title = content.title or content.content[:50]
+            source = f"{content.get_category_display()}"
         elif analysis.content_type == 'district_announcement':
-            try:
-                announcement = DistrictAnnouncement.objects.get(id=analysis.content_id)
-                title = announcement.title[:50]
-                source = "구청 공지사항"
-            except DistrictAnnouncement.DoesNotExist:
-                continue
-                
+            title = content.title[:50]
+            source = "구청 공지사항"
         elif analysis.content_type == 'local_issue':
-            try:
-                issue = LocalIssue.objects.get(id=analysis.content_id)
-                title = issue.title[:50]
-                source = f"{issue.get_source_display()}"
-            except LocalIssue.DoesNotExist:
-                continue
+            title = content.title[:50]
+            source = f"{content.get_source_display()}"
         
-        # 영향도 계산 (신뢰도 * 감성 가중치)
-        sentiment_weight = 1 if analysis.sentiment == 'positive' else -1 if analysis.sentiment == 'negative' else 0
-        impact = round(analysis.confidence * sentiment_weight * 10, 1)  # 10도 만점으로 스케일링
+        impact = round(analysis.impact, 1)
         
         details.append({
             'title': title,
@@ -0,0 +1,198 @@
+"""
+기상청 예보 격자 캐시 - (nx, ny, base_date, base_time) 단위 저장, 동시 요청 병합, stale-while-revalidate
+"""
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+def forecast_cache_key(nx, ny, base_date, base_time):
+    """예보 주기별 격자 캐시 키"""
+    return f"weather:table:{nx}:{ny}:{base_date}{base_time}"
+
+
+def latest_forecast_key(nx, ny):
+    """격자별 마지막으로 받은 예보 (stale 응답용)"""
+    return f"weather:latest-table:{nx}:{ny}"
+
+
+class GridForecastCache:
+    """격자 좌표 단위 예보 캐시
+    
+    - 같은 격자를 쓰는 구는 예보 주기당 한 번만 기상청 API를 호출한다.
+    - 같은 키의 동시 요청은 프로세스 안에서는 하나의 호출로 병합하고,
+      프로세스 간에는 공유 캐시의 잠금 키로 한 곳만 호출한다.
+    - 새 주기 예보가 아직 없으면 이전 주기 예보로 즉시 응답하고 백그라운드에서 갱신한다.
+      갱신이 실패한 격자는 failure_backoff초 동안 다시 갱신하지 않는다.
+    """
+    
+    def __init__(self, forecast_timeout=60 * 60 * 4, stale_timeout=60 * 60 * 24,
+                 lock_timeout=30, wait_timeout=10, failure_backoff=60):
+        self.forecast_timeout = forecast_timeout
+        self.stale_timeout = stale_timeout
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.failure_backoff = failure_backoff
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='weather-refresh')
+        self.hits = 0
+        self.stale_hits = 0
+        self.coalesced = 0
+        self.upstream_calls = 0
+        self.backoff_skips = 0
+    
+    def get(self, nx, ny, base_date, base_time, fetch):
+        """격자 예보 조회
+        
+        fetch(nx, ny, base_date, base_time)는 캐시에 없을 때만 호출된다.
+        fetch는 정상 예보가 아니면 예외를 발생시켜야 한다 (오류 응답은 캐시하지 않음).
+        """
+        data = cache.get(forecast_cache_key(nx, ny, base_date, base_time))
+        if data is not None:
+            with self._lock:
+                self.hits += 1
+            return data
+        
+        latest = cache.get(latest_forecast_key(nx, ny))
+        if latest is not None:
+            # 이전 예보 주기 데이터로 응답하고 새 주기 예보는 백그라운드에서 조회
+            with self._lock:
+                self.stale_hits += 1
+            self.refresh(nx, ny, base_date, base_time, fetch)
+            return latest['data']
+        
+        return self._load(nx, ny, base_date, base_time, fetch).result(
+            timeout=self.lock_timeout + self.wait_timeout
+        )
+    
+    def refresh(self, nx, ny, base_date, base_time, fetch):
+        """백그라운드 갱신 (이미 진행 중이면 병합, 최근 실패한 격자면 건너뛰고 None 반환)"""
+        key = forecast_cache_key(nx, ny, base_date, base_time)
+        with self._lock:
+            if key in self._inflight:
+                return self._inflight[key]
+        
+        # 기상청 장애 중에는 stale 요청마다 갱신을 다시 쌓지 않음 (프로세스 간 공유)
+        if cache.get(f"{key}:failed") is not None:
+            with self._lock:
+                self.backoff_skips += 1
+            return None
+        
+        future = self._executor.submit(self._load_result, nx, ny, base_date, base_time, fetch)
+        future.add_done_callback(lambda done: self._record_refresh_error(key, done))
+        return future
+    
+    def _load_result(self, nx, ny, base_date, base_time, fetch):
+        return self._load(nx, ny, base_date, base_time, fetch).result()
+    
+    def _record_refresh_error(self, key, future):
+        if future.exception() is not None:
+            logger.warning(f"날씨 예보 백그라운드 갱신 실패: {future.exception()}")
+            cache.add(f"{key}:failed", 1, self.failure_backoff)
+    
+    def _load(self, nx, ny, base_date, base_time, fetch):
+        """같은 키의 동시 조회를 하나로 병합 (진행 중인 Future 반환)"""
+        key = forecast_cache_key(nx, ny, base_date, base_time)
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future
+            future = Future()
+            self._inflight[key] = future
+        
+        try:
+            future.set_result(self._fetch_once(key, nx, ny, base_date, base_time, fetch))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return future
+    
+    def _fetch_once(self, key, nx, ny, base_date, base_time, fetch):
+        """프로세스 간 잠금을 잡은 쪽만 기상청 API 호출"""
+        # 병합 대기열이 비워지는 사이 다른 요청이 이미 저장했을 수 있음
+        data = cache.get(key)
+        if data is not None:
+            return data
+        
+        lock_key = f"{key}:lock"
+        acquired = cache.add(lock_key, 1, self.lock_timeout)
+        if not acquired:
+            # 다른 프로세스가 조회 중 - 결과가 저장될 때까지 대기 (시간 초과 시 직접 조회)
+            deadline = time.monotonic() + self.wait_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.2)
+                data = cache.get(key)
+                if data is not None:
+                    return data
+        
+        try:
+            with self._lock:
+                self.upstream_calls += 1
+            data = fetch(nx, ny, base_date, base_time)
+            cache.set(key, data, self.forecast_timeout)
+            cache.set(latest_forecast_key(nx, ny), {
+                'base_date': base_date,
+                'base_time': base_time,
+                'data': data
+            }, self.stale_timeout)
+            return data
+        finally:
+            if acquired:
+                cache.delete(lock_key)
+    
+    def prefetch(self, cells, base_date, base_time, fetch, workers=8):
+        """여러 격자의 예보를 병렬로 미리 조회해 캐시에 저장
+        
+        이미 캐시된 격자는 건너뛴다. 격자별 성공 여부를 반환한다.
+        """
+        def load(cell):
+            nx, ny = cell
+            try:
+                self._load(nx, ny, base_date, base_time, fetch).result()
+            except Exception as e:
+                logger.warning(f"격자 ({nx}, {ny}) 예보 조회 실패: {e}")
+                return False
+            return True
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            return dict(zip(cells, executor.map(load, cells)))
+    
+    def get_stats(self):
+        """캐시 히트/병합/기상청 호출 횟수 반환"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'stale_hits': self.stale_hits,
+                'coalesced': self.coalesced,
+                'upstream_calls': self.upstream_calls,
+                'backoff_skips': self.backoff_skips,
+                'inflight': len(self._inflight)
+            }
+
+
+_forecast_cache = None
+_forecast_cache_lock = threading.Lock()
+
+
+def get_forecast_cache():
+    """settings.WEATHER_CACHE 설정으로 프로세스 공유 예보 캐시 반환"""
+    global _forecast_cache
+    if _forecast_cache is None:
+        with _forecast_cache_lock:
+            if _forecast_cache is None:
+                from django.conf import settings
+                options = getattr(settings, 'WEATHER_CACHE', {})
+                _forecast_cache = GridForecastCache(
+                    forecast_timeout=options.get('FORECAST_TIMEOUT', 60 * 60 * 4),
+                    stale_timeout=options.get('STALE_TIMEOUT', 60 * 60 * 24),
+                    failure_backoff=options.get('FAILURE_BACKOFF', 60)
+                )
+    return _forecast_cache
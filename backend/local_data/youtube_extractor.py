@@ -0,0 +1,211 @@
+"""
+YouTube 검색 결과 페이지 추출기 - 페이지에 포함된 ytInitialData에서 videoRenderer만 골라 디코딩
+"""
+import json
+import re
+import sys
+import time
+import random
+from collections import namedtuple
+from datetime import datetime, timedelta
+
+# 영상 1개 (조회수/게시 시각은 화면 표시 문자열 그대로, 없으면 빈 문자열)
+YoutubeVideo = namedtuple('YoutubeVideo', ['video_id', 'title', 'view_text', 'published_text'])
+
+_INITIAL_DATA_MARKERS = ('var ytInitialData = ', 'window["ytInitialData"] = ', 'ytInitialData = ')
+_RENDERER_KEY = '"videoRenderer":'
+_decoder = json.JSONDecoder()
+
+
+def find_initial_data(html):
+    """ytInitialData JSON의 (시작, 끝) 위치 - 없으면 None"""
+    for marker in _INITIAL_DATA_MARKERS:
+        start = html.find(marker)
+        if start == -1:
+            continue
+        start += len(marker)
+        end = html.find(';</script>', start)
+        return start, (end if end != -1 else len(html))
+    return None
+
+
+def iter_video_renderers(html):
+    """ytInitialData 안의 videoRenderer 객체를 앞에서부터 하나씩 디코딩
+    
+    전체 JSON을 파싱하지 않고 "videoRenderer": 키 위치만 찾아 그 값만 디코딩한다.
+    디코딩한 객체 끝으로 건너뛰므로 페이지를 한 번만 훑는다.
+    """
+    span = find_initial_data(html)
+    if span is None:
+        return
+    
+    pos, end = span
+    while True:
+        pos = html.find(_RENDERER_KEY, pos, end)
+        if pos == -1:
+            return
+        start = pos + len(_RENDERER_KEY)
+        while start < end and html[start].isspace():
+            start += 1
+        try:
+            renderer, pos = _decoder.raw_decode(html, start)
+        except ValueError:
+            pos = start
+            continue
+        if isinstance(renderer, dict):
+            yield renderer
+
+
+def _text(node):
+    """{"simpleText": ...} 또는 {"runs": [{"text": ...}]} 형태의 표시 문자열"""
+    if not isinstance(node, dict):
+        return ''
+    if 'simpleText' in node:
+        return node['simpleText']
+    return ''.join(run.get('text', '') for run in node.get('runs', []))
+
+
+def iter_videos(html):
+    """검색 결과 페이지의 영상을 YoutubeVideo로 하나씩 반환 (같은 영상은 한 번만)"""
+    seen = set()
+    for renderer in iter_video_renderers(html):
+        video_id = renderer.get('videoId')
+        title = _text(renderer.get('title'))
+        if not video_id or not title or video_id in seen:
+            continue
+        seen.add(video_id)
+        yield YoutubeVideo(
+            video_id,
+            title,
+            _text(renderer.get('viewCountText')),
+            _text(renderer.get('publishedTimeText'))
+        )
+
+
+# 상대 시각 단위 (한국어/영어 표시 문자열)
+_RELATIVE_UNITS = [
+    ('초', timedelta(seconds=1)), ('second', timedelta(seconds=1)),
+    ('분', timedelta(minutes=1)), ('minute', timedelta(minutes=1)),
+    ('시간', timedelta(hours=1)), ('hour', timedelta(hours=1)),
+    ('일', timedelta(days=1)), ('day', timedelta(days=1)),
+    ('주', timedelta(weeks=1)), ('week', timedelta(weeks=1)),
+    ('개월', timedelta(days=30)), ('달', timedelta(days=30)), ('month', timedelta(days=30)),
+    ('년', timedelta(days=365)), ('year', timedelta(days=365)),
+]
+_RELATIVE_PATTERN = re.compile(r'(\d+)\s*([^\d\s]+)')
+
+
+def parse_published_text(text, now=None):
+    """'3시간 전', 'Streamed 2 days ago' 같은 게시 시각 문자열을 datetime으로 (해석 불가면 None)"""
+    match = _RELATIVE_PATTERN.search(text or '')
+    if not match:
+        return None
+    
+    amount, unit = int(match.group(1)), match.group(2).lower()
+    for name, delta in _RELATIVE_UNITS:
+        if unit.startswith(name):
+            return (now or datetime.now()) - delta * amount
+    return None
+
+
+# 기존 정규식 추출 (성능 비교용)
+_LEGACY_PATTERN = re.compile(
+    r'"videoId":"([^"]+)".*?"title":{"runs":\[{"text":"([^"]+)".*?"viewCountText":{"simpleText":"([^"]*)"',
+    re.DOTALL
+)
+
+
+def _legacy_extract(html, limit):
+    return _LEGACY_PATTERN.findall(html)[:limit]
+
+
+def _sample_page(video_count, seed=22):
+    """검색 결과 페이지와 같은 구성의 샘플 HTML
+    
+    5개 중 1개는 조회수 없는 실시간/예정 영상이고, 끝에는 조회수 없는 Shorts 선반이 붙는다.
+    """
+    rng = random.Random(seed)
+    items = []
+    for i in range(video_count):
+        renderer = {
+            'videoId': f"vid{i:08d}",
+            'thumbnail': {'thumbnails': [
+                {'url': f"https://i.ytimg.com/vi/vid{i:08d}/hq{size}.jpg", 'width': size, 'height': size}
+                for size in (360, 480, 720)
+            ]},
+            'title': {'runs': [{'text': f"강남구 소식 {i}번째 영상"}]},
+            'navigationEndpoint': {'watchEndpoint': {'videoId': f"vid{i:08d}"}},
+            'ownerText': {'runs': [{'text': f"채널 {rng.randint(1, 50)}"}]},
+            'detailedMetadataSnippets': [{'snippetText': {'runs': [{'text': '설명 ' * 40}]}}],
+            'lengthText': {'simpleText': f"{rng.randint(1, 20)}:{rng.randint(10, 59)}"},
+        }
+        if i % 5:
+            renderer['viewCountText'] = {'simpleText': f"조회수 {rng.randint(1, 99)}만회"}
+            renderer['publishedTimeText'] = {'simpleText': f"{rng.randint(1, 23)}시간 전"}
+        items.append({'videoRenderer': renderer})
+        if i % 4 == 0:
+            items.append({'adSlotRenderer': {'tracking': 'x' * 2000}})
+    
+    shorts = [
+        {'reelItemRenderer': {'videoId': f"short{i:06d}", 'headline': {'simpleText': f"쇼츠 {i}"}}}
+        for i in range(video_count // 2)
+    ]
+    items.append({'reelShelfRenderer': {'items': shorts}})
+    
+    initial_data = {'contents': {'twoColumnSearchResultsRenderer': {'primaryContents': {
+        'sectionListRenderer': {'contents': [{'itemSectionRenderer': {'contents': items}}]}
+    }}}}
+    script = 'var ytcfg = {' + ' ' * 200000 + '};'
+    return (
+        f"<html><head><script>{script}</script></head><body>"
+        f"<script>var ytInitialData = {json.dumps(initial_data, ensure_ascii=False, separators=(',', ':'))};</script>"
+        f"</body></html>"
+    )
+
+
+def performance_test(paths=None, limit=10):
+    """기존 정규식 대비 ytInitialData 추출기 성능 비교
+    
+    paths에 저장해 둔 검색 결과 페이지(HTML)를 넘기면 그 페이지로, 없으면 샘플 페이지로 측정한다.
+    """
+    if paths:
+        pages = []
+        for path in paths:
+            with open(path, encoding='utf-8') as f:
+                pages.append((path, f.read()))
+    else:
+        pages = [(f"샘플 {count}개 영상", _sample_page(count)) for count in (20, 80, 320)]
+    
+    print("=== YouTube 검색 결과 추출 성능 테스트 ===")
+    for name, html in pages:
+        start_time = time.perf_counter()
+        legacy = _legacy_extract(html, limit)
+        legacy_duration = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        videos = []
+        for video in iter_videos(html):
+            videos.append(video)
+            if len(videos) >= limit:
+                break
+        lazy_duration = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        all_videos = list(iter_videos(html))
+        full_duration = time.perf_counter() - start_time
+        
+        # 정규식은 조회수 없는 영상을 건너뛰며 다음 영상의 조회수와 짝지음
+        mismatched = sum(
+            1 for (video_id, title, _), video in zip(legacy, all_videos)
+            if video_id != video.video_id
+        )
+        
+        size_mb = len(html.encode('utf-8')) / 1024 / 1024
+        print(f"\n{name} ({size_mb:.1f}MB, 영상 {len(all_videos)}개)")
+        print(f"  기존 정규식: {legacy_duration * 1000:.1f}ms, {len(legacy)}개 (순서 어긋남 {mismatched}개)")
+        print(f"  추출기 (앞 {limit}개): {lazy_duration * 1000:.1f}ms")
+        print(f"  추출기 (전체): {full_duration * 1000:.1f}ms ({full_duration * 1000 / size_mb:.1f}ms/MB)")
+
+
+if __name__ == "__main__":
+    performance_test(sys.argv[1:])
@@ -0,0 +1,256 @@
+"""
+구별 브리핑 스냅샷 - 크롤링/분석 완료 시 미리 직렬화해 두고 그대로 응답
+"""
+import json
+import threading
+from collections import OrderedDict
+from datetime import date, timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count
+from local_data.data_version import bump_data_version, get_data_version, new_data_version, versioned_cache_key
+from local_data.models import Location, LocalIssue, SentimentAnalysis, RestaurantInfo
+
+
+def count_issue_sentiments(location, issues):
+    """저장된 SentimentAnalysis 기준 감성별 개수 집계
+    
+    집계는 한 번의 쿼리로 처리하고, 아직 분석 결과가 없는 이슈만
+    분석해서 저장하므로 다음 요청부터는 다시 분석하지 않는다.
+    """
+    counts = {'positive': 0, 'negative': 0, 'neutral': 0}
+    if not issues:
+        return counts
+    
+    issue_ids = [issue.id for issue in issues]
+    analyzed = SentimentAnalysis.objects.filter(
+        content_type='local_issue',
+        content_id__in=issue_ids
+    )
+    
+    # 감성별 개수를 단일 GROUP BY 쿼리로 집계
+    rows = analyzed.values('sentiment').annotate(count=Count('id'))
+    for row in rows:
+        if row['sentiment'] in counts:
+            counts[row['sentiment']] += row['count']
+    
+    analyzed_total = sum(counts.values())
+    if analyzed_total >= len(issue_ids):
+        return counts
+    
+    # 분석 결과가 없는 이슈만 분석 (fallback)
+    analyzed_ids = set(analyzed.values_list('content_id', flat=True))
+    missing_issues = [issue for issue in issues if issue.id not in analyzed_ids]
+    
+    from local_data.sentiment_analyzer import get_sentiment_analyzer, build_sentiment_analysis
+    from local_data.db_writers import record_sentiment_analyses
+    analyzer = get_sentiment_analyzer()
+    
+    analyses_to_create = []
+    for issue in missing_issues:
+        result = analyzer.analyze_text(issue.title)
+        counts[result['sentiment']] += 1
+        analyses_to_create.append(build_sentiment_analysis(
+            location, 'local_issue', issue.id, issue.title, result, analyzer
+        ))
+    
+    record_sentiment_analyses(analyses_to_create)
+    
+    return counts
+
+
+def calculate_sentiment_temperature(counts):
+    """감성별 개수로 감성 온도 계산"""
+    total = counts['positive'] + counts['negative'] + counts['neutral']
+    if total == 0:
+        return {
+            'temperature': 50,
+            'mood_emoji': '☁️',
+            'description': '보통',
+            'positive_ratio': 0,
+            'negative_ratio': 0
+        }
+    
+    pos_ratio = (counts['positive'] / total) * 100
+    neg_ratio = (counts['negative'] / total) * 100
+    
+    # 온도 계산 (0~100)
+    temp = int(pos_ratio - neg_ratio + 50)
+    temp = max(0, min(100, temp))
+    
+    if temp >= 80:
+        emoji, desc = '😊', '매우 좋음'
+    elif temp >= 60:
+        emoji, desc = '🙂', '좋음'
+    elif temp >= 40:
+        emoji, desc = '😐', '보통'
+    elif temp >= 20:
+        emoji, desc = '😕', '나쁨'
+    else:
+        emoji, desc = '😔', '매우 나쁨'
+    
+    return {
+        'temperature': temp,
+        'mood_emoji': emoji,
+        'description': desc,
+        'positive_ratio': round(pos_ratio, 1),
+        'negative_ratio': round(neg_ratio, 1)
+    }
+
+
+def build_briefing_data(location, today):
+    """구별 브리핑 응답 데이터 생성"""
+    # 7일 이내 데이터만 필터링
+    week_ago = today - timedelta(days=7)
+    
+    # 동네 이슈 - 7일 이내 조회수 높은 순 5개
+    recent_issues = LocalIssue.objects.filter(
+        location=location,
+        collected_at__date__gte=week_ago
+    ).order_by('-view_count', '-collected_at')[:5]
+    
+    # 감성 온도계 - 7일 이내 500개 데이터로 분석
+    sentiment_data = list(LocalIssue.objects.filter(
+        location=location,
+        collected_at__date__gte=week_ago
+    ).order_by('-collected_at')[:500])
+    
+    # 신규 음식점 (서울시 API - 실제 인허가일자 기준)
+    new_restaurants = RestaurantInfo.objects.filter(
+        location=location,
+        management_number__startswith='seoul_',
+        business_status_name='영업'
+    ).order_by('-license_date')[:5]
+    
+    # 핵플 음식점 (카카오 API - 인기 맛집)
+    hot_restaurants = RestaurantInfo.objects.filter(
+        location=location,
+        management_number__startswith='kakao_',
+        business_status_name='영업'
+    ).order_by('-collected_at')[:5]
+    
+    # 감성 온도 계산 결과에 영향을 준 뉴스 추가
+    sentiment_counts = count_issue_sentiments(location, sentiment_data)
+    sentiment_result = calculate_sentiment_temperature(sentiment_counts)
+    sentiment_result['influential_news'] = [{
+        'title': issue.title,
+        'source': issue.get_source_display(),
+        'url': issue.url,
+        'view_count': issue.view_count,
+        'collected_at': issue.collected_at.strftime('%m/%d %H:%M')
+    } for issue in sentiment_data[:5]]  # 감성 분석에 사용된 상위 5개 데이터
+    
+    data = {
+        'success': True,
+        'district': location.gu,
+        'date': today.isoformat(),
+        'sentiment': sentiment_result,
+        'categories': {
+            'local_issues': {
+                'title': '동네 이슈',
+                'emoji': '💬',
+                'items': [{
+                    'title': issue.title,
+                    'source': issue.get_source_display(),
+                    'url': issue.url,
+                    'view_count': issue.view_count,
+                    'collected_at': issue.collected_at.strftime('%m/%d %H:%M')
+                } for issue in recent_issues]
+            },
+            
+            'new_restaurants': {
+                'title': '신규 개업 음식점',
+                'emoji': '🆕',
+                'items': [{
+                    'name': restaurant.business_name,
+                    'type': restaurant.get_business_type_display(),
+                    'address': restaurant.road_address or restaurant.lot_address,
+                    'license_date': restaurant.license_date.strftime('%m/%d') if restaurant.license_date else ''
+                } for restaurant in new_restaurants]
+            },
+            'hot_restaurants': {
+                'title': '핵플 음식점',
+                'emoji': '🔥',
+                'items': [{
+                    'name': restaurant.business_name,
+                    'type': restaurant.get_business_type_display(),
+                    'address': restaurant.road_address or restaurant.lot_address,
+                    'phone': restaurant.phone_number
+                } for restaurant in hot_restaurants]
+            }
+        }
+    }
+    
+    return data
+
+
+def serialize_briefing(data):
+    """브리핑 데이터를 JsonResponse와 같은 형식의 JSON 바이트로 직렬화"""
+    return json.dumps(data, cls=DjangoJSONEncoder).encode('utf-8')
+
+
+# 프로세스 로컬 스냅샷 (키에 데이터 버전이 포함되므로 무효화 불필요)
+_local_snapshots = OrderedDict()
+_local_lock = threading.Lock()
+LOCAL_SNAPSHOT_LIMIT = 100
+
+
+def _remember(key, snapshot):
+    with _local_lock:
+        _local_snapshots[key] = snapshot
+        _local_snapshots.move_to_end(key)
+        while len(_local_snapshots) > LOCAL_SNAPSHOT_LIMIT:
+            _local_snapshots.popitem(last=False)
+
+
+def get_briefing_snapshot(district, today):
+    """직렬화된 브리핑 스냅샷 반환
+    
+    프로세스 로컬 → 공유 캐시 순으로 조회하고, 둘 다 없으면 생성해서 저장한다.
+    지역이 없으면 Location.DoesNotExist 발생.
+    """
+    key = versioned_cache_key('briefing', district, today.isoformat())
+    
+    with _local_lock:
+        snapshot = _local_snapshots.get(key)
+    if snapshot is not None:
+        return snapshot
+    
+    snapshot = cache.get(key)
+    if snapshot is None:
+        location = Location.objects.get(gu=district)
+        snapshot = serialize_briefing(build_briefing_data(location, today))
+        cache.set(key, snapshot, settings.RESPONSE_CACHE_TIMEOUT)
+    
+    _remember(key, snapshot)
+    return snapshot
+
+
+def write_briefing_snapshots(today, version=None):
+    """전체 구 브리핑 스냅샷을 지정한 데이터 버전으로 미리 저장
+    
+    크롤링 완료 후 새 버전으로 스냅샷을 모두 채운 다음 bump_data_version(version)을
+    호출하면 요청은 항상 완성된 스냅샷을 받는다.
+    """
+    if version is None:
+        version = get_data_version()
+    
+    snapshots = {}
+    for location in Location.objects.order_by('gu'):
+        key = versioned_cache_key('briefing', location.gu, today.isoformat(), version=version)
+        snapshots[key] = serialize_briefing(build_briefing_data(location, today))
+    
+    cache.set_many(snapshots, settings.RESPONSE_CACHE_TIMEOUT)
+    return len(snapshots)
+
+
+def publish_briefing_snapshots():
+    """크롤링 완료 후 호출 - 새 데이터 버전으로 스냅샷을 채운 뒤 버전 전환
+    
+    이전 버전의 캐시(지역 목록, 브리핑)는 모두 무효화된다.
+    """
+    version = new_data_version()
+    written = write_briefing_snapshots(date.today(), version)
+    bump_data_version(version)
+    return written
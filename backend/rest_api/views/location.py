@@ -1,32 +1,44 @@
+from django.conf import settings
+from django.core.cache import cache
 from django.http import JsonResponse
+from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
-from local_data.models import Location, LocalIssue, SentimentSummary
-from django.db.models import Count
-from datetime import date, timedelta
+from local_data.models import Location
+from local_data.data_version import versioned_cache_key
+from django.db.models import Count, Q
+from datetime import date, datetime, time, timedelta
+
+
+def build_districts_data(today):
+    """구별 최근 7일 이슈 개수를 단일 집계 쿼리로 조회"""
+    # collected_at__date 대신 시각 범위로 비교해야 (location, collected_at) 인덱스를 사용
+    week_ago = timezone.make_aware(datetime.combine(today - timedelta(days=7), time.min))
+    locations = Location.objects.annotate(
+        recent_issues=Count('localissue', filter=Q(localissue__collected_at__gte=week_ago))
+    ).order_by('gu')
+    
+    return [
+        {
+            'name': location.gu,
+            'code': location.gu_code,
+            'recent_issues': location.recent_issues,
+            'has_data': location.recent_issues > 0
+        }
+        for location in locations
+    ]
 
 @csrf_exempt
 @require_http_methods(["GET"])
 def get_districts(request):
     try:
-        # 각 구별 데이터 개수와 함께 반환
-        districts_data = []
-        locations = Location.objects.all().order_by('gu')
-        
-        for location in locations:
-            # 최근 7일 이슈 개수
-            week_ago = date.today() - timedelta(days=7)
-            issue_count = LocalIssue.objects.filter(
-                location=location,
-                collected_at__date__gte=week_ago
-            ).count()
-            
-            districts_data.append({
-                'name': location.gu,
-                'code': location.gu_code,
-                'recent_issues': issue_count,
-                'has_data': issue_count > 0
-            })
+        # 다음 크롤링 완료(데이터 버전 변경) 전까지 캐시된 응답 사용
+        today = date.today()
+        cache_key = versioned_cache_key('districts', today.isoformat())
+        districts_data = cache.get(cache_key)
+        if districts_data is None:
+            districts_data = build_districts_data(today)
+            cache.set(cache_key, districts_data, settings.RESPONSE_CACHE_TIMEOUT)
         
         return JsonResponse({
             'success': True,
@@ -38,4 +50,4 @@ def get_districts(request):
         return JsonResponse({
             'success': False,
             'error': f'지역 데이터 조회 중 오류: {str(e)}'
-        }, status=500)
\ No newline at end of file
+        }, status=500)
@@ -9,6 +9,8 @@ source venv/bin/activate
 
 # Django 서버 시작
 cd backend
+# DB 캐시 테이블 생성 (REDIS_URL 미사용 시, 이미 있으면 건너뜀)
+python manage.py createcachetable
 python manage.py runserver
 
 echo "✅ 서버가 http://127.0.0.1:8000 에서 실행 중입니다"
\ No newline at end of file